@@ -0,0 +1,51 @@
+"""change_tracking
+
+Revision ID: 3c7d9e1f5a20
+Revises: e4f7a2c91b06
+Create Date: 2026-10-19 14:03:51.672019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7d9e1f5a20'
+down_revision: Union[str, Sequence[str], None] = 'e4f7a2c91b06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('bookings', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+    # Backfill with the latest thing that happened to each booking
+    op.execute("""
+        UPDATE bookings
+        SET updated_at = least(
+            greatest(requested_at, approved_at, cancelled_at, check_in_at, check_out_at), now()
+        )
+    """)
+    op.alter_column('bookings', 'updated_at', nullable=False)
+    op.create_index('idx_booking_updated_at', 'bookings', ['updated_at', 'id'], unique=False)
+    op.create_index('idx_space_updated_at', 'spaces', ['updated_at', 'id'], unique=False)
+
+    op.create_table('tombstones',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('table_name', sa.Text(), nullable=False),
+    sa.Column('row_id', sa.BigInteger(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_tombstone_table_deleted', 'tombstones', ['table_name', 'deleted_at', 'row_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_tombstone_table_deleted', table_name='tombstones')
+    op.drop_table('tombstones')
+    op.drop_index('idx_space_updated_at', table_name='spaces')
+    op.drop_index('idx_booking_updated_at', table_name='bookings')
+    op.drop_column('bookings', 'updated_at')
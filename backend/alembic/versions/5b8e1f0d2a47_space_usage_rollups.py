@@ -0,0 +1,45 @@
+"""space_usage_rollups
+
+Revision ID: 5b8e1f0d2a47
+Revises: c09b20211832
+Create Date: 2025-12-02 10:14:07.512310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e1f0d2a47'
+down_revision: Union[str, Sequence[str], None] = 'c09b20211832'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('space_usage_rollups',
+    sa.Column('space_id', sa.BigInteger(), nullable=False),
+    sa.Column('usage_date', sa.Date(), nullable=False),
+    sa.Column('hour', sa.SmallInteger(), nullable=False),
+    sa.Column('pending_count', sa.Integer(), nullable=False),
+    sa.Column('approved_count', sa.Integer(), nullable=False),
+    sa.Column('rejected_count', sa.Integer(), nullable=False),
+    sa.Column('cancelled_count', sa.Integer(), nullable=False),
+    sa.Column('completed_count', sa.Integer(), nullable=False),
+    sa.Column('no_show_count', sa.Integer(), nullable=False),
+    sa.Column('booked_minutes', sa.Integer(), nullable=False),
+    sa.CheckConstraint('hour >= 0 AND hour <= 23', name='check_hour_range'),
+    sa.ForeignKeyConstraint(['space_id'], ['spaces.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('space_id', 'usage_date', 'hour')
+    )
+    op.create_index('idx_usage_rollup_date', 'space_usage_rollups', ['usage_date'], unique=False)
+    # Populate from existing bookings with: python -m app.scripts.backfill_usage_rollups
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_usage_rollup_date', table_name='space_usage_rollups')
+    op.drop_table('space_usage_rollups')
@@ -0,0 +1,75 @@
+"""allocation_windows
+
+Revision ID: 6f1a9c3e8d24
+Revises: 8b2e6d4f1c37
+Create Date: 2026-10-19 18:47:12.504391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f1a9c3e8d24'
+down_revision: Union[str, Sequence[str], None] = '8b2e6d4f1c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('allocation_windows',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('space_id', sa.BigInteger(), nullable=False),
+    sa.Column('created_by', sa.BigInteger(), nullable=True),
+    sa.Column('booking_date', sa.Date(), nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=True),
+    sa.Column('end_time', sa.Time(), nullable=True),
+    sa.Column('closes_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('policy', sa.Enum('LOTTERY', 'PENALTY_WEIGHTED', name='allocationpolicy'), nullable=False),
+    sa.Column('status', sa.Enum('OPEN', 'ALLOCATED', name='allocationwindowstatus'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('allocated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.CheckConstraint('end_time > start_time', name='check_window_end_after_start'),
+    sa.CheckConstraint('(start_time IS NULL) = (end_time IS NULL)', name='check_window_times_paired'),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['space_id'], ['spaces.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_allocation_window_closes', 'allocation_windows', ['status', 'closes_at'], unique=False)
+    op.create_index('idx_allocation_window_open', 'allocation_windows', ['space_id', 'booking_date'], unique=True, postgresql_where=sa.text("status = 'OPEN'"))
+
+    op.create_table('allocation_requests',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('window_id', sa.BigInteger(), nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('booking_id', sa.BigInteger(), nullable=True),
+    sa.Column('start_time', sa.Time(), nullable=False),
+    sa.Column('end_time', sa.Time(), nullable=False),
+    sa.Column('attendees', sa.Integer(), nullable=False),
+    sa.Column('purpose', sa.Text(), nullable=False),
+    sa.Column('status', sa.Enum('QUEUED', 'ALLOCATED', 'REJECTED', name='allocationrequeststatus'), nullable=False),
+    sa.Column('requested_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('decided_at', sa.DateTime(timezone=True), nullable=True),
+    sa.CheckConstraint('attendees > 0', name='check_request_attendees_positive'),
+    sa.CheckConstraint('end_time > start_time', name='check_request_end_after_start'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['window_id'], ['allocation_windows.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('window_id', 'user_id', name='uq_allocation_request_window_user')
+    )
+    op.create_index('idx_allocation_request_user', 'allocation_requests', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_allocation_request_user', table_name='allocation_requests')
+    op.drop_table('allocation_requests')
+    op.drop_index('idx_allocation_window_open', table_name='allocation_windows', postgresql_where=sa.text("status = 'OPEN'"))
+    op.drop_index('idx_allocation_window_closes', table_name='allocation_windows')
+    op.drop_table('allocation_windows')
+    sa.Enum(name='allocationrequeststatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='allocationwindowstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='allocationpolicy').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,31 @@
+"""booking_calendar_index
+
+Revision ID: 8b2e6d4f1c37
+Revises: 3c7d9e1f5a20
+Create Date: 2026-10-19 16:21:07.318544
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e6d4f1c37'
+down_revision: Union[str, Sequence[str], None] = '3c7d9e1f5a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_booking_calendar', 'bookings', ['booking_date', 'space_id', 'start_time'],
+        unique=False, postgresql_include=['end_time', 'status', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_booking_calendar', table_name='bookings')
@@ -0,0 +1,58 @@
+"""user_stats
+
+Revision ID: 9d3a6c4e7b12
+Revises: 5b8e1f0d2a47
+Create Date: 2025-12-04 15:41:22.907133
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3a6c4e7b12'
+down_revision: Union[str, Sequence[str], None] = '5b8e1f0d2a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_stats',
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('booking_count', sa.Integer(), nullable=False),
+    sa.Column('rating_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Integer(), nullable=False),
+    sa.Column('active_penalty_points', sa.Integer(), nullable=False),
+    sa.Column('no_show_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+    # Backfill from existing data
+    op.execute("""
+        INSERT INTO user_stats (
+            user_id, booking_count, rating_count, rating_sum,
+            active_penalty_points, no_show_count, updated_at
+        )
+        SELECT user_id, sum(booking_count), sum(rating_count), sum(rating_sum),
+               sum(active_penalty_points), sum(no_show_count), now()
+        FROM (
+            SELECT user_id, 1 AS booking_count, 0 AS rating_count, 0 AS rating_sum,
+                   0 AS active_penalty_points, (status = 'NO_SHOW')::int AS no_show_count
+            FROM bookings
+            UNION ALL
+            SELECT rated_user_id, 0, 1, rating, 0, 0 FROM user_ratings
+            UNION ALL
+            SELECT user_id, 0, 0, 0, points, 0 FROM user_penalties WHERE status = 'ACTIVE'
+        ) AS contributions
+        GROUP BY user_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_stats')
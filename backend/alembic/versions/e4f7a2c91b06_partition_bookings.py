@@ -0,0 +1,130 @@
+"""partition_bookings
+
+Revision ID: e4f7a2c91b06
+Revises: 9d3a6c4e7b12
+Create Date: 2026-10-19 09:12:40.318254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f7a2c91b06'
+down_revision: Union[str, Sequence[str], None] = '9d3a6c4e7b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, user_id, space_id, booking_date, start_time, end_time, status, attendees, purpose, "
+    "requested_at, approved_by, approved_at, cancelled_at, cancellation_reason, check_in_at, check_out_at"
+)
+INDEXES = {
+    'idx_booking_user_id': ['user_id'],
+    'idx_booking_space_id': ['space_id'],
+    'idx_booking_date_status': ['booking_date', 'status'],
+    'idx_booking_datetime': ['booking_date', 'start_time', 'end_time'],
+}
+# Monthly partitions are created this far past the current month
+MONTHS_AHEAD = 3
+
+
+def _bookings_table(name: str, *args, **kwargs) -> None:
+    op.create_table(name,
+    sa.Column('id', sa.BigInteger(), server_default=sa.text("nextval('bookings_id_seq'::regclass)"), nullable=False),
+    sa.Column('user_id', sa.BigInteger(), nullable=False),
+    sa.Column('space_id', sa.BigInteger(), nullable=False),
+    sa.Column('booking_date', sa.Date(), nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=False),
+    sa.Column('end_time', sa.Time(), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='bookingstatus', create_type=False), nullable=False),
+    sa.Column('attendees', sa.Integer(), nullable=False),
+    sa.Column('purpose', sa.Text(), nullable=False),
+    sa.Column('requested_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('approved_by', sa.BigInteger(), nullable=True),
+    sa.Column('approved_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('cancelled_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('cancellation_reason', sa.Text(), nullable=True),
+    sa.Column('check_in_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('check_out_at', sa.DateTime(timezone=True), nullable=True),
+    sa.CheckConstraint('attendees > 0', name='check_attendees_positive'),
+    sa.CheckConstraint('end_time > start_time', name='check_end_after_start'),
+    sa.ForeignKeyConstraint(['approved_by'], ['users.id'], ondelete='RESTRICT'),
+    sa.ForeignKeyConstraint(['space_id'], ['spaces.id'], ondelete='RESTRICT'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='RESTRICT'),
+    *args,
+    **kwargs
+    )
+
+
+def _set_aside(old_name: str) -> None:
+    """Rename ``bookings`` out of the way, freeing its index and key names."""
+    op.execute(f"ALTER TABLE bookings RENAME TO {old_name}")
+    op.execute(f"ALTER TABLE {old_name} RENAME CONSTRAINT bookings_pkey TO {old_name}_pkey")
+    for index in INDEXES:
+        op.drop_index(index, table_name=old_name)
+
+
+def _replace(old_name: str) -> None:
+    """Copy ``old_name`` into the new ``bookings``, hand it the id sequence and drop it."""
+    op.execute(f"INSERT INTO bookings ({COLUMNS}) SELECT {COLUMNS} FROM {old_name}")
+    op.execute("ALTER SEQUENCE bookings_id_seq OWNED BY bookings.id")
+    op.execute(f"DROP TABLE {old_name} CASCADE")
+    for index, columns in INDEXES.items():
+        op.create_index(index, 'bookings', columns, unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A foreign key can't reference id alone on a partitioned table
+    op.drop_constraint('user_penalties_booking_id_fkey', 'user_penalties', type_='foreignkey')
+    op.drop_constraint('user_ratings_booking_id_fkey', 'user_ratings', type_='foreignkey')
+
+    _set_aside('bookings_unpartitioned')
+    _bookings_table('bookings',
+    sa.PrimaryKeyConstraint('id', 'booking_date'),
+    postgresql_partition_by='RANGE (booking_date)',
+    )
+    op.execute("CREATE TABLE bookings_default PARTITION OF bookings DEFAULT")
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', least(min(booking_date), current_date)),
+                    date_trunc('month', greatest(max(booking_date), current_date)) + interval '{MONTHS_AHEAD} months',
+                    interval '1 month'
+                )::date
+                FROM bookings_unpartitioned
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF bookings FOR VALUES FROM (%L) TO (%L)',
+                    'bookings_' || to_char(month, 'YYYY_MM'), month, (month + interval '1 month')::date
+                );
+            END LOOP;
+        END $$
+    """)
+    _replace('bookings_unpartitioned')
+
+
+def downgrade() -> None:
+    """Downgrade schema. Partitions already moved to the archive schema are left there."""
+    for index in INDEXES:
+        op.drop_index(index, table_name='bookings')
+    op.execute("ALTER TABLE bookings RENAME TO bookings_partitioned")
+    op.execute("ALTER TABLE bookings_partitioned RENAME CONSTRAINT bookings_pkey TO bookings_partitioned_pkey")
+    _bookings_table('bookings', sa.PrimaryKeyConstraint('id'))
+    _replace('bookings_partitioned')
+
+    # Bookings archived away no longer exist here, as with ON DELETE SET NULL
+    for table in ('user_penalties', 'user_ratings'):
+        op.execute(
+            f"UPDATE {table} SET booking_id = NULL "
+            f"WHERE booking_id IS NOT NULL AND booking_id NOT IN (SELECT id FROM bookings)"
+        )
+        op.create_foreign_key(f'{table}_booking_id_fkey', table, 'bookings', ['booking_id'], ['id'], ondelete='SET NULL')
@@ -0,0 +1,122 @@
+"""
+Small in-process TTL caches kept coherent by the invalidation bus.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.invalidation import Invalidation, InvalidationBus, InvalidationKind, invalidation_bus
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    LRU cache whose entries expire after ``ttl`` seconds.
+
+    The whole cache is cleared when a message of any kind in ``invalidated_by``
+    arrives, or when the bus requests a full flush. Caches subscribe to the
+    process-wide ``invalidation_bus`` and register in ``caches`` unless given
+    a ``bus`` and ``registry`` of their own (as tests do).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        maxsize: int = 1024,
+        invalidated_by: tuple[InvalidationKind, ...] = (),
+        bus: InvalidationBus | None = None,
+        registry: dict[str, "TTLCache"] | None = None,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._generation = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+        bus = invalidation_bus if bus is None else bus
+        bus.subscribe(self._on_invalidation, *invalidated_by)
+        bus.on_flush(self.clear)
+        (caches if registry is None else registry)[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default``."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for ``key``, calling ``loader`` on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            generation = self._generation
+            value = await loader()
+            # Don't store a value that was loaded across an invalidation
+            if generation == self._generation:
+                self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        self._generation += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._generation += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _on_invalidation(self, message: Invalidation) -> None:
+        self.clear()
+
+
+# Registry of every cache, by name
+caches: dict[str, TTLCache] = {}
+
+# Space catalog: filter config and the utility list
+catalog_cache = TTLCache(
+    "catalog",
+    ttl=settings.CATALOG_CACHE_TTL_SECONDS,
+    maxsize=256,
+    invalidated_by=(InvalidationKind.SPACE, InvalidationKind.UTILITY),
+)
+
+# Admin dashboard counters, keyed by day
+admin_stats_cache = TTLCache(
+    "admin_stats",
+    ttl=settings.ADMIN_STATS_CACHE_TTL_SECONDS,
+    maxsize=4,
+    invalidated_by=(InvalidationKind.BOOKING_DAY, InvalidationKind.USER, InvalidationKind.SPACE),
+)
+
+
+@metrics.registry.collector
+def _collect_cache_metrics():
+    for name, cache in caches.items():
+        lookups = cache.hits + cache.misses
+        # The caches count lookups themselves; the counters catch up at scrape time
+        metrics.cache_hits.inc(cache.hits - metrics.cache_hits.get(cache=name), cache=name)
+        metrics.cache_misses.inc(cache.misses - metrics.cache_misses.get(cache=name), cache=name)
+        metrics.cache_hit_ratio.set(cache.hits / lookups if lookups else 0.0, cache=name)
+        metrics.cache_entries.set(len(cache), cache=name)
@@ -19,6 +19,53 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: int = 5432
     POSTGRES_DB: str = "study_space"
+    # LISTEN needs a session-level connection; point these at Postgres itself
+    # when POSTGRES_HOST is a transaction-pooling PgBouncer
+    POSTGRES_LISTEN_HOST: str | None = None
+    POSTGRES_LISTEN_PORT: int | None = None
+    # Streaming read replica; GET requests are served from it when set
+    POSTGRES_REPLICA_HOST: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
+    REPLICA_MAX_WAIT_MS: int = 200  # How long a read waits for the replica to catch up before using the primary
+
+    # Connection Pool Settings (per process)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30  # Seconds to wait for a connection before failing
+    DB_POOL_RECYCLE: int = -1  # Reconnect connections older than this many seconds (-1 = never)
+    DB_POOL_PRE_PING: bool = True  # Test each connection with a round trip on checkout
+    DB_STATEMENT_CACHE_SIZE: int = 100  # Prepared statements cached per connection
+    DB_PGBOUNCER: bool = False  # Transaction-pooling PgBouncer: no statement cache, unique statement names
+    DB_CONNECTION_BUDGET: int | None = None  # Max connections per database across all workers; caps each worker's pool
+
+    # Server Settings
+    WEB_CONCURRENCY: int | None = None  # Worker processes (set by app.scripts.serve)
+
+    # Booking Settings
+    BOOKING_DAY_START_HOUR: int = 7  # Opening hours used for occupancy
+    BOOKING_DAY_END_HOUR: int = 22
+    BOOKING_PENALTY_POINTS_LIMIT: int = 20  # Active points that block new bookings (0 = no limit)
+    CALENDAR_MAX_DAYS: int = 42  # Longest range /bookings/calendar serves (six weeks)
+    BOOKING_ALTERNATIVES_LIMIT: int = 5  # Free slots suggested when a booking conflicts
+    BOOKING_ALTERNATIVE_STEP_MINUTES: int = 30  # Grid of start times tried in the same space
+
+    # Cache Settings
+    CACHE_INVALIDATION_ENABLED: bool = True
+    CACHE_INVALIDATION_CHANNEL: str = "cache_invalidation"
+    CATALOG_CACHE_TTL_SECONDS: int = 300
+    ADMIN_STATS_CACHE_TTL_SECONDS: int = 30
+
+    # Export Settings
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per server-side cursor round trip
+
+    # Startup Settings
+    WARMUP_ENABLED: bool = True  # Warm pools, statements and caches before reporting ready
+    WARMUP_TIMEOUT_SECONDS: float = 60
+    GC_FREEZE_AFTER_WARMUP: bool = True  # Move warm-up objects out of the collector's reach
+
+    # Observability Settings
+    METRICS_ENABLED: bool = True  # Serve Prometheus metrics at /metrics
+    BCRYPT_WORKERS: int = 4  # Threads hashing/verifying passwords off the event loop
     
     @property
     def DATABASE_URL(self) -> str:
@@ -30,5 +77,20 @@ class Settings(BaseSettings):
         """Asynchronous database URL for SQLAlchemy (using asyncpg)"""
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def REPLICA_DATABASE_URL(self) -> str | None:
+        """Asynchronous database URL of the read replica, if one is configured"""
+        if not self.POSTGRES_REPLICA_HOST:
+            return None
+        port = self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_REPLICA_HOST}:{port}/{self.POSTGRES_DB}"
+
+    @property
+    def LISTEN_DATABASE_URL(self) -> str:
+        """Plain libpq URL for the dedicated LISTEN connection (raw asyncpg)"""
+        host = self.POSTGRES_LISTEN_HOST or self.POSTGRES_HOST
+        port = self.POSTGRES_LISTEN_PORT or self.POSTGRES_PORT
+        return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{host}:{port}/{self.POSTGRES_DB}"
+
     
 settings = Settings()
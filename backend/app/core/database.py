@@ -1,18 +1,103 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import asyncio
+import re
+import time
+import uuid
+
+from fastapi import Request
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util import await_only
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from typing import AsyncGenerator
 
-from app.core.config import settings
+from app.core import metrics
+from app.core.config import Settings, settings
+
+# Requests that never write and may be served by the replica
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+# Header carrying the primary's WAL position after a write; clients send it
+# back so their next read doesn't see a replica that is behind their write
+CONSISTENCY_HEADER = "X-Consistency-Token"
+
+_LSN = re.compile(r"^[0-9A-Fa-f]{1,8}/[0-9A-Fa-f]{1,8}$")
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        engine = self._orig_logging_name or "primary"
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.db_pool_timeouts.inc(engine=engine)
+            raise
+        finally:
+            metrics.db_pool_wait.observe(time.perf_counter() - started, engine=engine)
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def engine_options(config: Settings, name: str = "primary") -> dict:
+    """Keyword arguments for ``create_async_engine`` from the pool settings."""
+    if config.DB_PGBOUNCER:
+        # A transaction pooler hands each transaction a different server
+        # connection, so named prepared statements can't be reused or must
+        # never collide
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    else:
+        connect_args = {
+            "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+        }
+    pool_size, max_overflow = config.DB_POOL_SIZE, config.DB_MAX_OVERFLOW
+    if config.DB_CONNECTION_BUDGET:
+        # Each worker gets an equal share of the budget, idle pool first
+        share = max(1, config.DB_CONNECTION_BUDGET // (config.WEB_CONCURRENCY or 1))
+        pool_size = min(pool_size, share)
+        max_overflow = min(max_overflow, share - pool_size)
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_logging_name": name,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+def _instrument(engine: AsyncEngine, name: str) -> None:
+    @event.listens_for(engine.sync_engine, "checkout")
+    def count_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.db_pool_checkouts.inc(engine=name)
+
+    @metrics.registry.collector
+    def collect_pool():
+        pool = engine.pool
+        metrics.db_pool_size.set(pool.size(), engine=name)
+        metrics.db_pool_checked_out.set(pool.checkedout(), engine=name)
+        metrics.db_pool_overflow.set(max(pool.overflow(), 0), engine=name)
 
 
 async_engine = create_async_engine(
     settings.ASYNC_DATABASE_URL,
     echo=False,  # Set to False in production
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    **engine_options(settings),
 )
+_instrument(async_engine, "primary")
 
 AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
@@ -22,6 +107,117 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Optional streaming replica for reads
+replica_engine: AsyncEngine | None = None
+if settings.REPLICA_DATABASE_URL:
+    replica_engine = create_async_engine(
+        settings.REPLICA_DATABASE_URL,
+        echo=False,
+        **engine_options(settings, "replica"),
+    )
+    _instrument(replica_engine, "replica")
+
+# Engines for read-only sessions share the pools above; every transaction
+# they start is BEGIN READ ONLY
+primary_read_engine = async_engine.execution_options(postgresql_readonly=True)
+replica_read_engine = replica_engine.execution_options(postgresql_readonly=True) if replica_engine else None
+
+_REPLICA_CAUGHT_UP = text(
+    # pg_last_wal_replay_lsn() is NULL on a server that isn't replaying WAL
+    "SELECT COALESCE(pg_last_wal_replay_lsn() >= CAST(CAST(:token AS text) AS pg_lsn), true)"
+)
+
+
+def _replica_caught_up(connection, token: str) -> bool:
+    return connection.execute(_REPLICA_CAUGHT_UP, {"token": token}).scalar_one()
+
+
+def _choose_read_engine(token: str | None) -> AsyncEngine:
+    """
+    Pick the engine for a read: the replica if configured and, given a
+    consistency token, once it has replayed that far. The replica is polled
+    for up to ``REPLICA_MAX_WAIT_MS`` before falling back to the primary.
+
+    Runs inside SQLAlchemy's greenlet, so it is written synchronously.
+    """
+    if replica_read_engine is None:
+        return primary_read_engine
+    if token is None or not _LSN.match(token):
+        metrics.db_reads.inc(engine="replica", reason="no_token")
+        return replica_read_engine
+
+    deadline = time.monotonic() + settings.REPLICA_MAX_WAIT_MS / 1000
+    try:
+        with replica_read_engine.sync_engine.connect() as connection:
+            while not _replica_caught_up(connection, token):
+                if time.monotonic() >= deadline:
+                    metrics.db_reads.inc(engine="primary", reason="replica_behind")
+                    return primary_read_engine
+                await_only(asyncio.sleep(0.01))
+    except exc.DBAPIError:
+        metrics.db_reads.inc(engine="primary", reason="replica_error")
+        return primary_read_engine
+    metrics.db_reads.inc(engine="replica", reason="caught_up")
+    return replica_read_engine
+
+
+class ReadSession(Session):
+    """
+    Session for read-only requests.
+
+    Like any session it checks out a connection only when the first statement
+    runs; the engine (replica or primary) is chosen at that point too, so a
+    request answered from a cache never touches the database.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        engine = self.info.get("engine")
+        if engine is None:
+            engine = self.info["engine"] = _choose_read_engine(self.info.get("consistency_token"))
+        return engine.sync_engine
+
+
+ReadSessionLocal = async_sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    class_=AsyncSession,
+    sync_session_class=ReadSession,
+    expire_on_commit=False,
+)
+
+
+async def current_wal_lsn(session: AsyncSession) -> str:
+    """The primary's current WAL write position."""
+    return (await session.execute(text("SELECT pg_current_wal_lsn()::text"))).scalar_one()
+
+
+class ConsistencyTokenMiddleware:
+    """
+    Commit successful writes before the response starts and return the WAL
+    position in ``X-Consistency-Token``.
+
+    Sessions normally commit after the response is sent; a token taken then
+    would be too late to hand to the client. Only active with a replica.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in READ_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                session = scope.get("state", {}).get("write_session")
+                if session is not None and session.in_transaction():
+                    await session.commit()
+                    MutableHeaders(scope=message)[CONSISTENCY_HEADER] = await current_wal_lsn(session)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
 
 # Base class for all models
 class Base(DeclarativeBase):
@@ -29,17 +225,58 @@ class Base(DeclarativeBase):
     pass
 
 
-# Dependency for FastAPI endpoints (async)
-async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+def open_read_session(request: Request) -> AsyncSession:
+    """A read-only session carrying the request's consistency token."""
+    return ReadSessionLocal(info={"consistency_token": request.headers.get(CONSISTENCY_HEADER)})
+
+
+# Dependencies for FastAPI endpoints (async)
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a read-only session.
+
+    Transactions are started READ ONLY and never committed; closing the
+    session hands the connection back to the pool, which ends the
+    transaction. Served by the replica when one is configured, honouring the
+    request's consistency token.
+    """
+    async with open_read_session(request) as session:
+        yield session
+
+
+async def get_primary_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a read-only session on the primary, for reads
+    that need the primary's view of running transactions (``/changes``) and
+    for loading the shared caches, which would otherwise keep a lagging
+    replica's view until they expire.
+    """
+    async with ReadSessionLocal(info={"engine": primary_read_engine}) as session:
+        yield session
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides an async database session to FastAPI endpoints.
+
+    GET/HEAD requests get a read-only session (see ``get_read_db``);
+    everything else a read-write session on the primary, committed at the
+    end of the request.
     
     Usage in FastAPI:
         @app.get("/items")
         async def read_items(db: AsyncSession = Depends(get_async_db)):
             ...
     """
-    async with AsyncSessionLocal() as session:
+    if request.method in READ_METHODS:
+        async with open_read_session(request) as session:
+            yield session
+        return
+
+    session = AsyncSessionLocal()
+    if replica_engine is not None:
+        request.state.write_session = session
+    async with session:
         try:
             yield session
             await session.commit()
@@ -0,0 +1,58 @@
+"""
+MessagePack responses.
+
+Routes that support it return MessagePack to clients whose ``Accept`` header
+prefers ``application/msgpack`` (or ``application/x-msgpack``) to JSON, and
+JSON otherwise. Without the ``msgpack`` package installed every client gets
+JSON.
+"""
+import importlib.util
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+msgpack_available = importlib.util.find_spec("msgpack") is not None
+
+
+def _quality(params: list[str]) -> float:
+    for param in params:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return min(max(float(value), 0.0), 1.0)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def accepts_msgpack(request: Request) -> bool:
+    """Whether the ``Accept`` header ranks MessagePack above zero and no lower than JSON."""
+    if not msgpack_available:
+        return False
+    msgpack_q = json_q = 0.0
+    for entry in request.headers.get("accept", "").split(","):
+        media_type, *params = entry.split(";")
+        media_type = media_type.strip().lower()
+        q = _quality(params)
+        if media_type in _MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type in ("application/json", "application/*", "*/*"):
+            json_q = max(json_q, q)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def negotiated_response(request: Request, content: Any) -> Response:
+    """``content`` as MessagePack if the client asked for it, else as JSON."""
+    headers = {"Vary": "Accept"}
+    if accepts_msgpack(request):
+        import msgpack
+
+        return Response(
+            msgpack.packb(jsonable_encoder(content)), media_type=MSGPACK_MEDIA_TYPE, headers=headers
+        )
+    return JSONResponse(jsonable_encoder(content), headers=headers)
@@ -1,11 +1,16 @@
+from typing import Any
+
 from fastapi import HTTPException, status
 
 
 class BadRequestException(HTTPException):
-    def __init__(self, detail: str = "Bad request", code: str = "BAD_REQUEST"):
+    def __init__(self, detail: str = "Bad request", code: str = "BAD_REQUEST", details: dict[str, Any] | None = None):
+        body = {"code": code, "message": detail}
+        if details is not None:
+            body["details"] = details
         super().__init__(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"code": code, "message": detail}
+            detail=body
         )
 
 
@@ -0,0 +1,234 @@
+"""
+Cross-replica cache invalidation bus.
+
+Mutations queue typed invalidation messages on the SQLAlchemy session. The
+messages are published with ``pg_notify`` inside the same transaction, so other
+replicas only see them once the data is committed, and they are applied to the
+local process at flush time and again when the transaction ends.
+
+Every replica keeps a single ``LISTEN`` connection open (see
+``InvalidationBus.start``). If that connection drops, notifications sent while
+it was down are lost, so every subscriber is fully flushed after reconnecting.
+"""
+import asyncio
+import enum
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Iterable
+
+import asyncpg
+from loguru import logger
+from sqlalchemy import event, select, func
+from sqlalchemy.orm import Session, SessionTransaction, UOWTransaction
+
+from app.core.config import settings
+
+# pg_notify payloads are limited to 8000 bytes; past this many messages a
+# transaction publishes a flush of the affected kinds instead.
+MAX_MESSAGES_PER_NOTIFY = 100
+
+_PENDING_KEY = "pending_invalidations"
+
+
+class InvalidationKind(str, enum.Enum):
+    """Kinds of cached data that can be invalidated."""
+    SPACE = "space"
+    UTILITY = "utility"
+    USER = "user"
+    BOOKING_DAY = "booking_day"
+
+
+@dataclass(frozen=True)
+class Invalidation:
+    """A single invalidation message. ``key=None`` invalidates the whole kind."""
+    kind: InvalidationKind
+    key: str | None = None
+
+
+Handler = Callable[[Invalidation], None]
+FlushHandler = Callable[[], None]
+
+
+class InvalidationBus:
+    """Dispatches invalidation messages to local subscribers and other replicas."""
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._handlers: dict[InvalidationKind, list[Handler]] = {kind: [] for kind in InvalidationKind}
+        self._flush_handlers: list[FlushHandler] = []
+        self._task: asyncio.Task | None = None
+        self._connection: asyncpg.Connection | None = None
+
+    # Local subscribers
+
+    def subscribe(self, handler: Handler, *kinds: InvalidationKind) -> None:
+        """Call ``handler`` for every message of the given kinds."""
+        for kind in kinds:
+            self._handlers[kind].append(handler)
+
+    def on_flush(self, handler: FlushHandler) -> None:
+        """Call ``handler`` whenever every cache must be dropped."""
+        self._flush_handlers.append(handler)
+
+    def apply(self, message: Invalidation) -> None:
+        """Apply a message to every local subscriber of its kind."""
+        for handler in self._handlers[message.kind]:
+            try:
+                handler(message)
+            except Exception:
+                logger.exception("Invalidation handler failed for {}", message)
+
+    def flush_all(self) -> None:
+        """Drop everything held by local subscribers."""
+        for handler in self._flush_handlers:
+            try:
+                handler()
+            except Exception:
+                logger.exception("Invalidation flush handler failed")
+
+    # Wire format
+
+    def encode(self, messages: Iterable[Invalidation]) -> str:
+        """Encode messages into a NOTIFY payload."""
+        messages = list(dict.fromkeys(messages))
+        if len(messages) > MAX_MESSAGES_PER_NOTIFY:
+            messages = [Invalidation(kind) for kind in dict.fromkeys(m.kind for m in messages)]
+        return json.dumps({
+            "o": self.origin,
+            "m": [[m.kind.value, m.key] for m in messages],
+        }, separators=(",", ":"))
+
+    def decode(self, payload: str) -> tuple[str, list[Invalidation]]:
+        """Decode a NOTIFY payload into its origin and messages."""
+        data = json.loads(payload)
+        return data["o"], [Invalidation(InvalidationKind(kind), key) for kind, key in data["m"]]
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            origin, messages = self.decode(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed invalidation payload: {}", payload)
+            self.flush_all()
+            return
+
+        # Our own messages were already applied when the transaction ended
+        if origin == self.origin:
+            return
+        for message in messages:
+            self.apply(message)
+
+    # Listener lifecycle
+
+    async def start(self) -> None:
+        """Start the background LISTEN connection."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(), name="invalidation-listener")
+
+    async def stop(self) -> None:
+        """Stop the LISTEN connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self) -> None:
+        delay = 1.0
+        first_connect = True
+        while True:
+            lost = asyncio.Event()
+            try:
+                self._connection = await asyncpg.connect(settings.LISTEN_DATABASE_URL)
+                self._connection.add_termination_listener(lambda _: lost.set())
+                await self._connection.add_listener(self.channel, self._on_notification)
+                logger.info("Listening for cache invalidations on '{}'", self.channel)
+
+                # Anything published while we were disconnected is gone
+                if not first_connect:
+                    self.flush_all()
+                first_connect = False
+                delay = 1.0
+
+                await lost.wait()
+                logger.warning("Invalidation listener connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Invalidation listener failed ({}), retrying in {:.0f}s", e, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            finally:
+                if self._connection is not None and not self._connection.is_closed():
+                    await self._connection.close()
+                self._connection = None
+
+
+invalidation_bus = InvalidationBus(settings.CACHE_INVALIDATION_CHANNEL)
+
+
+# Queuing messages on a session
+
+def invalidate(session: Session | Any, kind: InvalidationKind, key: Any = None) -> None:
+    """
+    Queue an invalidation on the session's current transaction.
+
+    Accepts either a sync ``Session`` or an ``AsyncSession``. Model changes are
+    picked up automatically (see ``track_model``); call this directly after
+    Core-level statements such as bulk ``DELETE``/``UPDATE``.
+    """
+    sync_session = getattr(session, "sync_session", session)
+    message = Invalidation(kind, None if key is None else _format_key(key))
+    sync_session.info.setdefault(_PENDING_KEY, set()).add(message)
+    invalidation_bus.apply(message)
+
+
+def _format_key(key: Any) -> str:
+    if isinstance(key, date):
+        return key.isoformat()
+    return str(key)
+
+
+_tracked_models: dict[type, list[tuple[InvalidationKind, Callable[[Any], Any]]]] = {}
+
+
+def track_model(model: type, kind: InvalidationKind, key: Callable[[Any], Any]) -> None:
+    """Publish ``kind`` with ``key(instance)`` whenever an instance of ``model`` is flushed."""
+    _tracked_models.setdefault(model, []).append((kind, key))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_model_invalidations(session: Session, flush_context: UOWTransaction) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        for kind, key in _tracked_models.get(type(instance), ()):
+            invalidate(session, kind, key(instance))
+
+
+@event.listens_for(Session, "before_commit")
+def _publish_invalidations(session: Session) -> None:
+    # before_commit runs ahead of the final flush; flush now so its changes are published too
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+
+    pending = session.info.get(_PENDING_KEY)
+    if not pending or not settings.CACHE_INVALIDATION_ENABLED:
+        return
+    session.connection().execute(
+        select(func.pg_notify(invalidation_bus.channel, invalidation_bus.encode(pending)))
+    )
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _apply_invalidations(session: Session, transaction: SessionTransaction) -> None:
+    # Re-apply on commit *and* rollback: anything cached between the flush and
+    # the end of the transaction may hold data that is now stale or reverted.
+    if transaction.parent is not None:
+        return
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        for message in pending:
+            invalidation_bus.apply(message)
@@ -0,0 +1,36 @@
+"""
+Helpers for building JSON documents in PostgreSQL.
+
+Used by endpoints that answer with a single statement: related rows are
+aggregated with ``json_agg`` in the database instead of being loaded as ORM
+objects and assembled in Python.
+"""
+from typing import Any
+
+from sqlalchemy import JSON, Text, cast, func, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def json_list(expression: Any, *order_by: Any) -> ColumnElement:
+    """``json_agg(expression ORDER BY ...)``, ``[]`` when there are no rows."""
+    return func.coalesce(
+        func.json_agg(aggregate_order_by(expression, *order_by)),
+        literal_column("'[]'::json"),
+        type_=JSON,
+    )
+
+
+def json_object(**fields: Any) -> ColumnElement:
+    """``json_build_object`` with the keys in argument order."""
+    return func.json_build_object(*(part for item in fields.items() for part in item), type_=JSON)
+
+
+def enum_value(column: Any) -> ColumnElement:
+    """
+    The API value of an enum column.
+
+    Enums are stored by member name (``NO_SHOW``); every enum in
+    ``app.models.enums`` uses the lower-cased name as its value.
+    """
+    return func.lower(cast(column, Text))
@@ -0,0 +1,341 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+A deliberately small implementation of counters, gauges and histograms with
+labels, so the app can expose ``/metrics`` without another dependency or an
+external agent. Values live in this process; with several workers each one
+is scraped (or labelled) separately.
+
+Collectors registered with ``registry.collector`` are called at scrape time
+for values that already live elsewhere (pool state, cache counters).
+"""
+import math
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterable, Iterator
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Default latency buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# A collected sample: (metric name, labels, value)
+Sample = tuple[str, dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """Base class: a named family of labelled series."""
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple) -> dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    @property
+    def family(self) -> str:
+        """The name the HELP and TYPE lines give the family."""
+        return self.name
+
+    def samples(self) -> Iterator[Sample]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """A monotonically increasing value."""
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        # An unlabelled counter is exposed from the start, at zero
+        self._values: dict[tuple, float] = {} if self.labelnames else {(): 0.0}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    @property
+    def family(self) -> str:
+        # The text format wants the family named like its only sample
+        return f"{self.name}_total"
+
+    def samples(self):
+        for key, value in list(self._values.items()):
+            yield self.family, self._labels(key), value
+
+
+class Gauge(Metric):
+    """A value that can go up and down."""
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        for key, value in list(self._values.items()):
+            yield self.name, self._labels(key), value
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets."""
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # key -> ([count per bucket], sum)
+        self._values: dict[tuple, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * len(self.buckets), [0.0]))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            total[0] += value
+
+    @contextmanager
+    def time(self, **labels: str):
+        """Observe the duration of the ``with`` block, in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        counts, _ = self._values.get(self._key(labels), ([0], [0.0]))
+        return sum(counts)
+
+    def samples(self):
+        for key, (counts, total) in list(self._values.items()):
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_count", labels, cumulative
+            yield f"{self.name}_sum", labels, total[0]
+
+
+class Registry:
+    """Holds metrics and scrape-time collectors and renders them."""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def collector(self, func: Callable[[], None]) -> Callable[[], None]:
+        """Register ``func`` to refresh gauges just before each scrape."""
+        self._collectors.append(func)
+        return func
+
+    def render(self) -> str:
+        for collect in self._collectors:
+            collect()
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.family} {metric.documentation}")
+            lines.append(f"# TYPE {metric.family} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# HTTP
+http_requests = registry.counter(
+    "http_requests", "HTTP requests handled", ["method", "route", "status"]
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ["method", "route"]
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled", ["method", "route"]
+)
+
+# Database pools, labelled by engine ("primary", "replica")
+db_pool_checkouts = registry.counter(
+    "db_pool_checkouts", "Connections checked out of the pool", ["engine"]
+)
+db_pool_wait = registry.histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection (including connecting)",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+db_pool_timeouts = registry.counter(
+    "db_pool_timeouts", "Checkouts that gave up after DB_POOL_TIMEOUT", ["engine"]
+)
+db_pool_size = registry.gauge("db_pool_size", "Configured pool size", ["engine"])
+db_pool_checked_out = registry.gauge("db_pool_checked_out", "Connections currently checked out", ["engine"])
+db_pool_overflow = registry.gauge("db_pool_overflow", "Connections open beyond pool_size", ["engine"])
+db_reads = registry.counter(
+    "db_reads", "Read-only requests by the engine that served them", ["engine", "reason"]
+)
+
+# Password hashing
+bcrypt_queue_wait = registry.histogram(
+    "bcrypt_queue_wait_seconds", "Time bcrypt work waited for a hashing thread", ["operation"]
+)
+bcrypt_duration = registry.histogram(
+    "bcrypt_duration_seconds", "Time spent hashing or verifying a password", ["operation"]
+)
+
+# Caches
+cache_hits = registry.counter("cache_hits", "Cache hits", ["cache"])
+cache_misses = registry.counter("cache_misses", "Cache misses", ["cache"])
+cache_hit_ratio = registry.gauge("cache_hit_ratio", "Cache hits / lookups since start", ["cache"])
+cache_entries = registry.gauge("cache_entries", "Entries currently cached", ["cache"])
+
+# Background jobs
+job_duration = registry.histogram(
+    "job_duration_seconds",
+    "Duration of maintenance jobs",
+    ["job", "outcome"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+
+# Startup
+app_startup = registry.gauge("app_startup_seconds", "Time spent in each startup phase", ["phase"])
+app_warmup_step = registry.gauge("app_warmup_step_seconds", "Time spent in each warm-up step", ["step"])
+app_ready = registry.gauge("app_ready", "1 once warm-up has finished")
+
+
+def timed_job(name: str):
+    """Decorate an async job so its duration and outcome are recorded."""
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await func(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                job_duration.observe(time.perf_counter() - started, job=name, outcome=outcome)
+        return wrapper
+    return decorator
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route latency, status and in-flight requests.
+
+    Requests are labelled with the route template (``/spaces/{space_id}``),
+    not the raw path, so the number of series stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    def _route(self, scope: Scope) -> str:
+        partial = None
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+            if match == Match.PARTIAL and partial is None:
+                # Path matches but the method doesn't (405)
+                partial = route.path
+        return partial or "<unmatched>"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = self._route(scope)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method=method, route=route)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_request_duration.observe(time.perf_counter() - started, method=method, route=route)
+            http_requests.inc(method=method, route=route, status=str(status))
+            http_requests_in_flight.dec(method=method, route=route)
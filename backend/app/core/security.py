@@ -1,11 +1,21 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
 
 import bcrypt
 import jwt
 
+from app.core import metrics
 from app.core.config import settings
 
+# bcrypt is deliberately slow; keep it off the event loop in a bounded pool
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_WORKERS,
+    thread_name_prefix="bcrypt",
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
@@ -23,6 +33,31 @@ def get_password_hash(password: str) -> str:
     ).decode("utf-8")
 
 
+async def _run_bcrypt(operation: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Run ``func`` on the bcrypt pool, recording queue wait and duration."""
+    submitted = time.perf_counter()
+
+    def timed():
+        started = time.perf_counter()
+        metrics.bcrypt_queue_wait.observe(started - submitted, operation=operation)
+        try:
+            return func(*args)
+        finally:
+            metrics.bcrypt_duration.observe(time.perf_counter() - started, operation=operation)
+
+    return await asyncio.get_running_loop().run_in_executor(_bcrypt_executor, timed)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop."""
+    return await _run_bcrypt("verify", verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await _run_bcrypt("hash", get_password_hash, password)
+
+
 def create_access_token(subject: int | str, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token."""
     if expires_delta:
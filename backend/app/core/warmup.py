@@ -0,0 +1,148 @@
+"""
+Startup warm-up and readiness.
+
+Before the app reports ready, ``warm_up`` pays the first-request costs up
+front: it configures the ORM mappers, opens the pool connections, replays the
+hot read routes in-process (compiling and caching their SQL, building the
+response serializers and priming the catalog caches) and generates the
+OpenAPI schema. ``/ready`` returns 503 until it has finished.
+"""
+import asyncio
+import gc
+import inspect
+import time
+from dataclasses import dataclass, field
+
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from loguru import logger
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import configure_mappers
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, async_engine, replica_engine
+from app.core.security import create_access_token
+from app.models import User, UserRole
+
+# Hot read routes replayed during warm-up
+PUBLIC_ROUTES = [
+    "/spaces",
+    "/spaces/config/filters",
+    "/spaces/bootstrap",
+    "/utilities",
+]
+# Replayed as the first admin, when there is one
+AUTHENTICATED_ROUTES = [
+    "/auth/me",
+    "/bookings",
+    "/bookings?my=false",
+    "/penalties",
+    "/ratings",
+    "/admin/users",
+    "/admin/stats",
+    "/admin/analytics/utilization",
+]
+
+
+@dataclass
+class StartupReport:
+    """Timings of this process's startup."""
+    ready: bool = False
+    import_seconds: float | None = None
+    warmup_seconds: float | None = None
+    steps: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+
+startup = StartupReport()
+
+
+def record_import_time(seconds: float) -> None:
+    startup.import_seconds = round(seconds, 3)
+    metrics.app_startup.set(seconds, phase="import")
+
+
+async def open_pool_connections(engine: AsyncEngine, count: int) -> None:
+    """Open ``count`` connections at once so they sit idle in the pool."""
+    async def touch():
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(touch() for _ in range(count)))
+
+
+async def replay_routes(app: FastAPI) -> int:
+    """Issue the hot read routes in-process. Returns the number of requests."""
+    async with AsyncSessionLocal() as db:
+        admin_id = (await db.execute(
+            select(User.id).where(User.role == UserRole.ADMIN).order_by(User.id).limit(1)
+        )).scalar_one_or_none()
+
+    requests = [(path, {}) for path in PUBLIC_ROUTES]
+    if admin_id is not None:
+        headers = {"Authorization": f"Bearer {create_access_token(subject=admin_id)}"}
+        requests += [(path, headers) for path in AUTHENTICATED_ROUTES]
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://warmup") as client:
+        for path, headers in requests:
+            response = await client.get(path, headers=headers)
+            if response.status_code >= 400:
+                logger.warning("Warm-up request {} returned {}", path, response.status_code)
+    return len(requests)
+
+
+async def warm_up(app: FastAPI, engines: list[AsyncEngine] | None = None) -> StartupReport:
+    """Run every warm-up step, then mark the process ready."""
+    if engines is None:
+        engines = [async_engine] + ([replica_engine] if replica_engine is not None else [])
+
+    async def step(name: str, run):
+        started = time.perf_counter()
+        result = run()
+        if inspect.isawaitable(result):
+            await result
+        elapsed = time.perf_counter() - started
+        startup.steps[name] = round(elapsed, 3)
+        metrics.app_warmup_step.set(elapsed, step=name)
+
+    started = time.perf_counter()
+    await step("configure_mappers", configure_mappers)
+    await step("open_connections", lambda: asyncio.gather(*(
+        open_pool_connections(engine, getattr(engine.pool, "size", lambda: 1)()) for engine in engines
+    )))
+    await step("replay_routes", lambda: replay_routes(app))
+    await step("openapi", app.openapi)
+    if settings.GC_FREEZE_AFTER_WARMUP:
+        # Everything allocated so far lives for the whole process; keep the
+        # collector from rescanning it (and from touching its pages)
+        await step("gc_freeze", lambda: (gc.collect(), gc.freeze()))
+
+    startup.warmup_seconds = round(time.perf_counter() - started, 3)
+    startup.error = None
+    startup.ready = True
+    metrics.app_startup.set(startup.warmup_seconds, phase="warmup")
+    metrics.app_ready.set(1)
+    logger.info(
+        "Ready: imported in {}s, warmed up in {}s {}",
+        startup.import_seconds, startup.warmup_seconds, startup.steps,
+    )
+    return startup
+
+
+async def try_warm_up(app: FastAPI) -> bool:
+    """Run ``warm_up`` within ``WARMUP_TIMEOUT_SECONDS``; report whether it succeeded."""
+    try:
+        await asyncio.wait_for(warm_up(app), settings.WARMUP_TIMEOUT_SECONDS)
+        return True
+    except Exception as e:
+        startup.error = repr(e)
+        logger.warning("Warm-up failed: {}", e)
+        return False
+
+
+async def warm_up_until_ready(app: FastAPI, retry_seconds: float = 5.0) -> None:
+    """Retry warm-up until it succeeds, e.g. while the database is still starting."""
+    while not await try_warm_up(app):
+        await asyncio.sleep(retry_seconds)
@@ -3,9 +3,14 @@ from app.dependencies.auth import (
     get_current_active_user,
     get_current_admin_user,
 )
+from app.dependencies.batch import get_batch_ids, parse_ids, id_in, in_request_order
 
 __all__ = [
     "get_current_user",
     "get_current_active_user",
     "get_current_admin_user",
+    "get_batch_ids",
+    "parse_ids",
+    "id_in",
+    "in_request_order",
 ]
@@ -1,9 +1,19 @@
-from contextlib import asynccontextmanager
+import time
+
+_import_started = time.perf_counter()
+
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.core.config import settings
+from app.core.database import CONSISTENCY_HEADER, ConsistencyTokenMiddleware
+from app.core.invalidation import invalidation_bus
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.warmup import record_import_time, startup, try_warm_up, warm_up_until_ready
 from app.routes import api_router
 
 
@@ -11,8 +21,21 @@ from app.routes import api_router
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
+    if settings.CACHE_INVALIDATION_ENABLED:
+        await invalidation_bus.start()
+    retry = None
+    if not settings.WARMUP_ENABLED:
+        startup.ready = True
+    elif not await try_warm_up(app):
+        # Serve liveness checks but stay unready until the database is reachable
+        retry = asyncio.create_task(warm_up_until_ready(app))
     yield
     # Shutdown
+    if retry is not None:
+        retry.cancel()
+        with suppress(asyncio.CancelledError):
+            await retry
+    await invalidation_bus.stop()
 
 
 app = FastAPI(
@@ -29,8 +52,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[CONSISTENCY_HEADER],
 )
 
+# Read-your-writes token for clients when reads go to a replica
+app.add_middleware(ConsistencyTokenMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include API routes
 app.include_router(api_router)
 
@@ -39,3 +69,28 @@ app.include_router(api_router)
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/ready", tags=["Health"])
+async def readiness_check():
+    """Readiness endpoint: 503 until startup warm-up has finished."""
+    return JSONResponse(
+        status_code=200 if startup.ready else 503,
+        content={
+            "status": "ready" if startup.ready else "warming_up",
+            "import_seconds": startup.import_seconds,
+            "warmup_seconds": startup.warmup_seconds,
+            "steps": startup.steps,
+            "error": startup.error,
+        },
+    )
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", tags=["Health"], include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics for this process."""
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+record_import_time(time.perf_counter() - _import_started)
@@ -5,12 +5,18 @@ from app.models.enums import (
     SpaceStatus,
     BookingStatus,
     PenaltyStatus,
+    AllocationPolicy,
+    AllocationWindowStatus,
+    AllocationRequestStatus,
 )
-from app.models.user import User
+from app.models.user import User, UserStats
 from app.models.space import Space, Utility, SpaceUtility
 from app.models.booking import Booking
 from app.models.penalty import UserPenalty
 from app.models.rating import UserRating
+from app.models.analytics import SpaceUsageRollup
+from app.models.tombstone import Tombstone
+from app.models.allocation import AllocationWindow, AllocationRequest
 
 __all__ = [
     "Base",
@@ -19,11 +25,19 @@ __all__ = [
     "SpaceStatus",
     "BookingStatus",
     "PenaltyStatus",
+    "AllocationPolicy",
+    "AllocationWindowStatus",
+    "AllocationRequestStatus",
     "User",
+    "UserStats",
     "Space",
     "Utility",
     "SpaceUtility",
     "Booking",
     "UserPenalty",
     "UserRating",
+    "SpaceUsageRollup",
+    "Tombstone",
+    "AllocationWindow",
+    "AllocationRequest",
 ]
\ No newline at end of file
@@ -0,0 +1,138 @@
+from datetime import date, datetime, time, timezone
+from typing import List, Optional
+
+import sqlalchemy as sa
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    Text,
+    ForeignKey,
+    Index,
+    CheckConstraint,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+from app.models.enums import AllocationPolicy, AllocationWindowStatus, AllocationRequestStatus
+
+
+class AllocationWindow(Base):
+    """
+    A high-demand space and day (optionally a range of its slots) whose
+    booking requests are queued until ``closes_at`` and then allocated
+    together.
+    """
+    __tablename__ = "allocation_windows"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    # Foreign keys
+    space_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("spaces.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    created_by: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True
+    )
+
+    # Designated slots; no times means the whole day
+    booking_date: Mapped[date] = mapped_column(sa.Date, nullable=False)
+    start_time: Mapped[Optional[time]] = mapped_column(sa.Time, nullable=True)
+    end_time: Mapped[Optional[time]] = mapped_column(sa.Time, nullable=True)
+
+    # Allocation
+    closes_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
+    policy: Mapped[AllocationPolicy] = mapped_column(default=AllocationPolicy.LOTTERY, nullable=False)
+    status: Mapped[AllocationWindowStatus] = mapped_column(
+        default=AllocationWindowStatus.OPEN, nullable=False
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    allocated_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    requests: Mapped[List["AllocationRequest"]] = relationship(
+        "AllocationRequest",
+        back_populates="window",
+        cascade="all, delete-orphan",
+        lazy="select"
+    )
+
+    # Table constraints
+    __table_args__ = (
+        CheckConstraint("end_time > start_time", name="check_window_end_after_start"),
+        CheckConstraint("(start_time IS NULL) = (end_time IS NULL)", name="check_window_times_paired"),
+        # One open window per space and day
+        Index(
+            "idx_allocation_window_open", "space_id", "booking_date",
+            unique=True, postgresql_where=sa.text("status = 'OPEN'"),
+        ),
+        Index("idx_allocation_window_closes", "status", "closes_at"),
+    )
+
+
+class AllocationRequest(Base):
+    """A booking request queued in an allocation window."""
+    __tablename__ = "allocation_requests"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    # Foreign keys
+    window_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("allocation_windows.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    # The booking made for an allocated request; references bookings.id
+    # without a constraint (see Booking.penalties)
+    booking_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+
+    # Requested booking
+    start_time: Mapped[time] = mapped_column(sa.Time, nullable=False)
+    end_time: Mapped[time] = mapped_column(sa.Time, nullable=False)
+    attendees: Mapped[int] = mapped_column(Integer, nullable=False)
+    purpose: Mapped[str] = mapped_column(Text, nullable=False)
+
+    status: Mapped[AllocationRequestStatus] = mapped_column(
+        default=AllocationRequestStatus.QUEUED, nullable=False
+    )
+
+    # Timestamps
+    requested_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    decided_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    window: Mapped["AllocationWindow"] = relationship(
+        "AllocationWindow",
+        back_populates="requests",
+        lazy="select"
+    )
+
+    # Table constraints
+    __table_args__ = (
+        CheckConstraint("end_time > start_time", name="check_request_end_after_start"),
+        CheckConstraint("attendees > 0", name="check_request_attendees_positive"),
+        # One request per user per window, so nobody improves their odds by repeating
+        UniqueConstraint("window_id", "user_id", name="uq_allocation_request_window_user"),
+        Index("idx_allocation_request_user", "user_id"),
+    )
@@ -0,0 +1,48 @@
+from datetime import date
+
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    SmallInteger,
+    Date,
+    ForeignKey,
+    Index,
+    CheckConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class SpaceUsageRollup(Base):
+    """
+    Per-space, per-hour booking counters.
+
+    Status counts are attributed to the hour a booking starts in; booked
+    minutes are spread over every hour the booking overlaps.
+    """
+    __tablename__ = "space_usage_rollups"
+
+    # Composite primary key
+    space_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("spaces.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    usage_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    hour: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+
+    # Counters
+    pending_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    approved_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rejected_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    cancelled_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completed_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    no_show_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    booked_minutes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Table constraints
+    __table_args__ = (
+        CheckConstraint("hour >= 0 AND hour <= 23", name="check_hour_range"),
+        Index("idx_usage_rollup_date", "usage_date"),
+    )
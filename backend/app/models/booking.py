@@ -3,6 +3,7 @@ from typing import List, Optional
 
 import sqlalchemy as sa
 from sqlalchemy import (
+    DDL,
     BigInteger,
     Integer,
     Date,
@@ -11,17 +12,26 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     CheckConstraint,
+    event,
+    func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.core.database import Base
+from app.core.invalidation import InvalidationKind, track_model
 from app.models.enums import BookingStatus
+from app.models.tombstone import record_deletes
 
 
 class Booking(Base):
+    """
+    A booking request. The table is range-partitioned by ``booking_date``
+    (one partition per month, see ``app.services.partitions``), so its
+    primary key includes the partition key; ``id`` alone identifies a row.
+    """
     __tablename__ = "bookings"
 
-    # Primary key
+    # Primary key (with booking_date)
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
 
     # Foreign keys
@@ -37,7 +47,7 @@ class Booking(Base):
     )
 
     # Booking details
-    booking_date: Mapped[date] = mapped_column(Date, nullable=False)
+    booking_date: Mapped[date] = mapped_column(Date, primary_key=True, nullable=False)
     start_time: Mapped[time] = mapped_column(Time, nullable=False)
     end_time: Mapped[time] = mapped_column(Time, nullable=False)
     status: Mapped[BookingStatus] = mapped_column(default=BookingStatus.PENDING, nullable=False)
@@ -67,6 +77,15 @@ class Booking(Base):
     check_in_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True), nullable=True)
     check_out_at: Mapped[Optional[datetime]] = mapped_column(sa.DateTime(timezone=True), nullable=True)
 
+    # Change tracking: the writing transaction's start time, which the
+    # /changes cursor relies on (see app.services.changes)
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
     # Relationships
     user: Mapped["User"] = relationship(
         "User",
@@ -88,15 +107,20 @@ class Booking(Base):
         lazy="select"
     )
 
+    # booking_id is a plain column there: a foreign key can't point at id
+    # alone on a partitioned table, and archived partitions keep their ids.
+    # Deleting a booking still nulls it out through these relationships.
     penalties: Mapped[List["UserPenalty"]] = relationship(
         "UserPenalty",
         back_populates="booking",
+        primaryjoin="Booking.id == foreign(UserPenalty.booking_id)",
         lazy="select"
     )
 
     ratings: Mapped[List["UserRating"]] = relationship(
         "UserRating",
         back_populates="booking",
+        primaryjoin="Booking.id == foreign(UserRating.booking_id)",
         lazy="select"
     )
 
@@ -108,7 +132,15 @@ class Booking(Base):
         Index("idx_booking_space_id", "space_id"),
         Index("idx_booking_date_status", "booking_date", "status"),
         Index("idx_booking_datetime", "booking_date", "start_time", "end_time"),
+        Index("idx_booking_updated_at", "updated_at", "id"),
+        # Covers GET /bookings/calendar with an index-only range scan
+        Index(
+            "idx_booking_calendar", "booking_date", "space_id", "start_time",
+            postgresql_include=["end_time", "status", "id"],
+        ),
+        {"postgresql_partition_by": "RANGE (booking_date)"},
     )
+    __mapper_args__ = {"primary_key": [id], "eager_defaults": True}
 
     # Validators
     @validates("end_time")
@@ -127,4 +159,16 @@ class Booking(Base):
     def validate_check_out(self, key: str, value: Optional[datetime]) -> Optional[datetime]:
         if value and self.check_in_at and value <= self.check_in_at:
             raise ValueError("Check-out time must be after check-in time")
-        return value
\ No newline at end of file
+        return value
+
+
+track_model(Booking, InvalidationKind.BOOKING_DAY, lambda booking: booking.booking_date)
+record_deletes(Booking)
+
+# Tables made with create_all (tests, scratch databases) get a catch-all
+# partition; migrated databases also get the monthly ones
+event.listen(
+    Booking.__table__,
+    "after_create",
+    DDL("CREATE TABLE bookings_default PARTITION OF bookings DEFAULT"),
+)
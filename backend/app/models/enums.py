@@ -34,4 +34,23 @@ class PenaltyStatus(str, enum.Enum):
     """Penalty status types."""
     ACTIVE = "active"
     RESOLVED = "resolved"
-    EXPIRED = "expired"
\ No newline at end of file
+    EXPIRED = "expired"
+
+
+class AllocationPolicy(str, enum.Enum):
+    """How a batch allocation orders competing requests."""
+    LOTTERY = "lottery"
+    PENALTY_WEIGHTED = "penalty_weighted"
+
+
+class AllocationWindowStatus(str, enum.Enum):
+    """Allocation window states."""
+    OPEN = "open"
+    ALLOCATED = "allocated"
+
+
+class AllocationRequestStatus(str, enum.Enum):
+    """Queued booking request states."""
+    QUEUED = "queued"
+    ALLOCATED = "allocated"
+    REJECTED = "rejected"
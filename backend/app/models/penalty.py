@@ -13,6 +13,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.core.database import Base
+from app.core.invalidation import InvalidationKind, track_model
 from app.models.enums import PenaltyStatus
 
 
@@ -28,11 +29,8 @@ class UserPenalty(Base):
         ForeignKey("users.id", ondelete="RESTRICT"),
         nullable=False
     )
-    booking_id: Mapped[Optional[int]] = mapped_column(
-        BigInteger,
-        ForeignKey("bookings.id", ondelete="SET NULL"),
-        nullable=True
-    )
+    # References bookings.id without a constraint (see Booking.penalties)
+    booking_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     created_by: Mapped[Optional[int]] = mapped_column(
         BigInteger,
         ForeignKey("users.id", ondelete="RESTRICT"),
@@ -62,6 +60,7 @@ class UserPenalty(Base):
     booking: Mapped[Optional["Booking"]] = relationship(
         "Booking",
         back_populates="penalties",
+        primaryjoin="foreign(UserPenalty.booking_id) == Booking.id",
         lazy="select"
     )
 
@@ -84,4 +83,7 @@ class UserPenalty(Base):
     def validate_points(self, key: str, value: int) -> int:
         if value <= 0:
             raise ValueError("Points must be positive")
-        return value
\ No newline at end of file
+        return value
+
+
+track_model(UserPenalty, InvalidationKind.USER, lambda penalty: penalty.user_id)
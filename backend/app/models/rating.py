@@ -13,6 +13,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.core.database import Base
+from app.core.invalidation import InvalidationKind, track_model
 
 
 class UserRating(Base):
@@ -27,11 +28,8 @@ class UserRating(Base):
         ForeignKey("users.id", ondelete="RESTRICT"),
         nullable=False
     )
-    booking_id: Mapped[Optional[int]] = mapped_column(
-        BigInteger,
-        ForeignKey("bookings.id", ondelete="SET NULL"),
-        nullable=True
-    )
+    # References bookings.id without a constraint (see Booking.penalties)
+    booking_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     created_by: Mapped[Optional[int]] = mapped_column(
         BigInteger,
         ForeignKey("users.id", ondelete="RESTRICT"),
@@ -60,6 +58,7 @@ class UserRating(Base):
     booking: Mapped[Optional["Booking"]] = relationship(
         "Booking",
         back_populates="ratings",
+        primaryjoin="foreign(UserRating.booking_id) == Booking.id",
         lazy="select"
     )
 
@@ -81,4 +80,7 @@ class UserRating(Base):
     def validate_rating(self, key: str, value: int) -> int:
         if value < 1 or value > 5:
             raise ValueError("Rating must be between 1 and 5")
-        return value
\ No newline at end of file
+        return value
+
+
+track_model(UserRating, InvalidationKind.USER, lambda rating: rating.rated_user_id)
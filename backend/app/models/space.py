@@ -13,7 +13,9 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.core.database import Base
+from app.core.invalidation import InvalidationKind, track_model
 from app.models.enums import SpaceStatus
+from app.models.tombstone import record_deletes
 
 
 class Space(Base):
@@ -39,10 +41,11 @@ class Space(Base):
         default=lambda: datetime.now(timezone.utc),
         nullable=False
     )
+    # The writing transaction's start time (see Booking.updated_at)
     updated_at: Mapped[datetime] = mapped_column(
         sa.DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=sa.func.now(),
+        onupdate=sa.func.now(),
         nullable=False
     )
 
@@ -73,7 +76,9 @@ class Space(Base):
         CheckConstraint("capacity > 0", name="check_capacity_positive"),
         Index("idx_space_status", "status"),
         Index("idx_space_building_floor", "building", "floor"),
+        Index("idx_space_updated_at", "updated_at", "id"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     # Validators
     @validates("capacity")
@@ -140,4 +145,10 @@ class SpaceUtility(Base):
     utility: Mapped["Utility"] = relationship(
         "Utility",
         back_populates="space_utilities"
-    )
\ No newline at end of file
+    )
+
+
+track_model(Space, InvalidationKind.SPACE, lambda space: space.id)
+track_model(Utility, InvalidationKind.UTILITY, lambda utility: utility.id)
+track_model(SpaceUtility, InvalidationKind.SPACE, lambda link: link.space_id)
+record_deletes(Space)
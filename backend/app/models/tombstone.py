@@ -0,0 +1,40 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy import BigInteger, Text, Index, event, func, insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class Tombstone(Base):
+    """
+    A deleted row, kept so ``/changes`` feeds can tell clients to drop it.
+
+    ``deleted_at`` is the deleting transaction's start time, the same clock
+    that stamps ``updated_at`` on the tracked tables.
+    """
+    __tablename__ = "tombstones"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    table_name: Mapped[str] = mapped_column(Text, nullable=False)
+    row_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    # Table constraints
+    __table_args__ = (
+        Index("idx_tombstone_table_deleted", "table_name", "deleted_at", "row_id"),
+    )
+
+
+def record_deletes(model: type) -> None:
+    """Write a tombstone whenever the ORM deletes an instance of ``model``."""
+    table_name = model.__tablename__
+
+    @event.listens_for(model, "after_delete")
+    def _record(mapper, connection, instance) -> None:
+        connection.execute(insert(Tombstone).values(table_name=table_name, row_id=instance.id))
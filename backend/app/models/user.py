@@ -5,8 +5,10 @@ from typing import List, Optional
 import sqlalchemy as sa
 from sqlalchemy import (
     BigInteger,
+    Integer,
     SmallInteger,
     Text,
+    ForeignKey,
     Index,
     CheckConstraint,
 )
@@ -14,6 +16,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from sqlalchemy.dialects.postgresql import CITEXT
 
 from app.core.database import Base
+from app.core.invalidation import InvalidationKind, track_model
 from app.models.enums import UserRole, UserStatus
 
 
@@ -53,7 +56,14 @@ class User(Base):
         "Booking",
         back_populates="user",
         foreign_keys="Booking.user_id",
-        lazy="selectin"
+        lazy="select"
+    )
+
+    stats: Mapped[Optional["UserStats"]] = relationship(
+        "UserStats",
+        back_populates="user",
+        uselist=False,
+        lazy="joined"
     )
 
     approved_bookings: Mapped[List["Booking"]] = relationship(
@@ -102,6 +112,29 @@ class User(Base):
         Index("idx_user_role_status", "role", "status"),
     )
 
+    # Materialized stats (a user without a stats row has none of these yet)
+    @property
+    def total_bookings(self) -> int:
+        return self.stats.booking_count if self.stats else 0
+
+    @property
+    def rating_count(self) -> int:
+        return self.stats.rating_count if self.stats else 0
+
+    @property
+    def average_rating(self) -> Optional[float]:
+        if not self.stats or not self.stats.rating_count:
+            return None
+        return self.stats.rating_sum / self.stats.rating_count
+
+    @property
+    def active_penalty_points(self) -> int:
+        return self.stats.active_penalty_points if self.stats else 0
+
+    @property
+    def no_show_count(self) -> int:
+        return self.stats.no_show_count if self.stats else 0
+
     # Validators
     @validates("email")
     def validate_email(self, key: str, value: str) -> str:
@@ -127,4 +160,41 @@ class User(Base):
     def validate_year_of_study(self, key: str, value: Optional[int]) -> Optional[int]:
         if value is not None and (value < 1 or value > 7):
             raise ValueError("Year of study must be between 1 and 7")
-        return value
\ No newline at end of file
+        return value
+
+
+class UserStats(Base):
+    """Per-user counters maintained by the booking, rating and penalty routes."""
+    __tablename__ = "user_stats"
+
+    # Primary key
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    # Counters
+    booking_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    active_penalty_points: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    no_show_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Timestamps
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+
+    # Relationships
+    user: Mapped["User"] = relationship(
+        "User",
+        back_populates="stats"
+    )
+
+
+track_model(User, InvalidationKind.USER, lambda user: user.id)
+track_model(UserStats, InvalidationKind.USER, lambda stats: stats.user_id)
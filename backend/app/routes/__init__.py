@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.routes import auth, spaces, utilities, bookings, penalties, ratings, admin
+from app.routes import auth, spaces, utilities, bookings, penalties, ratings, admin, analytics, exports, allocations
 
 api_router = APIRouter()
 
@@ -8,6 +8,9 @@ api_router.include_router(auth.router, prefix="/auth", tags=["Auth"])
 api_router.include_router(spaces.router, prefix="/spaces", tags=["Spaces"])
 api_router.include_router(utilities.router, prefix="/utilities", tags=["Utilities"])
 api_router.include_router(bookings.router, prefix="/bookings", tags=["Bookings"])
+api_router.include_router(allocations.router, prefix="/allocations", tags=["Allocations"])
 api_router.include_router(penalties.router, prefix="/penalties", tags=["Penalties"])
 api_router.include_router(ratings.router, prefix="/ratings", tags=["Ratings"])
 api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
+api_router.include_router(analytics.router, prefix="/admin/analytics", tags=["Analytics"])
+api_router.include_router(exports.router, prefix="/admin/exports", tags=["Exports"])
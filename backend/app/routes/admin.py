@@ -1,38 +1,84 @@
+from datetime import date, datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy import select, func
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy import select, func, true
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.core.database import get_async_db
+from app.core.cache import admin_stats_cache
+from app.core.database import get_async_db, get_primary_read_db
 from app.core.exceptions import NotFoundException
-from app.dependencies import get_current_admin_user
-from app.models import User, Booking, UserPenalty, UserRating, UserStatus, BookingStatus
+from app.dependencies import get_current_admin_user, get_batch_ids, id_in, in_request_order
+from app.models import (
+    User,
+    Space,
+    Booking,
+    UserPenalty,
+    UserStatus,
+    SpaceStatus,
+    BookingStatus,
+    PenaltyStatus,
+)
 from app.schemas import (
     UserResponse,
     UserSummaryResponse,
     AdminUpdateUserRequest,
+    AdminStatsResponse,
 )
-from app.schemas.user import AdminUserSummaryResponse, BookingHistoryItem
-from app.schemas.penalty import PenaltyResponse
-from app.schemas.rating import RatingResponse
+from app.schemas.user import AdminUserSummaryResponse
 from app.schemas.common import PaginatedResponse, PaginatedResponseMeta
+from app.services.user_summary import user_summary_query
 
 router = APIRouter()
 
 
+@router.get("/stats", response_model=AdminStatsResponse)
+async def admin_get_stats(
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+):
+    """Dashboard counters (admin only), cached until the next relevant change."""
+    today = date.today()
+
+    async def load() -> AdminStatsResponse:
+        # One round trip: a filtered aggregate per table, cross-joined into one row
+        users = select(
+            func.count().label("total_users"),
+            func.count().filter(User.status == UserStatus.SUSPENDED).label("suspended_users"),
+        ).select_from(User).subquery("users")
+        spaces = select(
+            func.count().label("total_spaces"),
+            func.count().filter(Space.status == SpaceStatus.ACTIVE).label("active_spaces"),
+        ).select_from(Space).subquery("spaces")
+        bookings = select(
+            func.count().filter(Booking.status == BookingStatus.PENDING).label("pending_bookings"),
+            func.count().filter(Booking.booking_date == today).label("today_bookings"),
+        ).select_from(Booking).subquery("bookings")
+        penalties = select(
+            func.count().filter(UserPenalty.status == PenaltyStatus.ACTIVE).label("active_penalties"),
+        ).select_from(UserPenalty).subquery("penalties")
+
+        query = select(users, spaces, bookings, penalties).select_from(
+            users.join(spaces, true()).join(bookings, true()).join(penalties, true())
+        )
+        row = (await db.execute(query)).mappings().one()
+        return AdminStatsResponse(**row, generated_at=datetime.now(timezone.utc))
+
+    return await admin_stats_cache.get_or_load(today.isoformat(), load)
+
+
 @router.get("/users", response_model=PaginatedResponse[UserSummaryResponse])
 async def admin_list_users(
     current_user: Annotated[User, Depends(get_current_admin_user)],
     db: Annotated[AsyncSession, Depends(get_async_db)],
+    ids: Annotated[list[int] | None, Depends(get_batch_ids)],
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
     q: str | None = Query(default=None, description="Search query"),
     status: UserStatus | None = None,
 ):
     """Admin list of users."""
-    query = select(User).options(selectinload(User.bookings))
+    query = select(User)
 
     if q:
         query = query.where(
@@ -43,6 +89,14 @@ async def admin_list_users(
     if status:
         query = query.where(User.status == status)
 
+    if ids is not None:
+        result = await db.execute(query.where(id_in(User.id, ids)))
+        users = in_request_order(result.scalars().all(), ids)
+        return PaginatedResponse(
+            data=[UserSummaryResponse.model_validate(u) for u in users],
+            meta=PaginatedResponseMeta(total=len(users), limit=len(ids), offset=0)
+        )
+
     query = query.order_by(User.joined_at.desc())
 
     # Count total
@@ -55,29 +109,9 @@ async def admin_list_users(
     result = await db.execute(query)
     users = result.scalars().all()
 
-    # Build response with computed fields
-    user_summaries = []
-    for user in users:
-        # Calculate average rating
-        rating_result = await db.execute(
-            select(func.avg(UserRating.rating)).where(UserRating.rated_user_id == user.id)
-        )
-        avg_rating = rating_result.scalar()
-
-        user_summaries.append(UserSummaryResponse(
-            id=user.id,
-            full_name=user.full_name,
-            email=user.email,
-            student_id=user.student_id,
-            department=user.department,
-            profile_image_url=user.profile_image_url,
-            status=user.status,
-            total_bookings=len(user.bookings) if user.bookings else 0,
-            average_rating=float(avg_rating) if avg_rating else None,
-        ))
-
+    # Booking and rating counters come from the joined user_stats row
     return PaginatedResponse(
-        data=user_summaries,
+        data=[UserSummaryResponse.model_validate(u) for u in users],
         meta=PaginatedResponseMeta(total=total, limit=limit, offset=offset)
     )
 
@@ -131,62 +165,29 @@ async def admin_update_user(
 async def admin_get_user_summary(
     user_id: int,
     current_user: Annotated[User, Depends(get_current_admin_user)],
-    db: Annotated[AsyncSession, Depends(get_async_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    limit: int = Query(default=50, ge=1, le=100, description="Booking history items"),
+    booking_offset: int = Query(default=0, ge=0, alias="bookingOffset"),
+    penalty_limit: int | None = Query(default=None, ge=1, alias="penaltyLimit", description="Default: all"),
+    penalty_offset: int = Query(default=0, ge=0, alias="penaltyOffset"),
+    rating_limit: int | None = Query(default=None, ge=1, alias="ratingLimit", description="Default: all"),
+    rating_offset: int = Query(default=0, ge=0, alias="ratingOffset"),
 ):
-    """Get user with booking history, penalties and ratings."""
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-
-    if not user:
-        raise NotFoundException(detail="User not found")
-
-    # Get booking history (completed, cancelled, no_show)
-    booking_result = await db.execute(
-        select(Booking)
-        .where(
-            Booking.user_id == user_id,
-            Booking.status.in_([
-                BookingStatus.COMPLETED,
-                BookingStatus.CANCELLED,
-                BookingStatus.NO_SHOW
-            ])
-        )
-        .options(selectinload(Booking.space))
-        .order_by(Booking.booking_date.desc())
-        .limit(50)
-    )
-    bookings = booking_result.scalars().all()
-
-    booking_history = [
-        BookingHistoryItem(
-            id=b.id,
-            space_name=b.space.name if b.space else "Unknown",
-            date=str(b.booking_date),
-            time=f"{b.start_time.strftime('%H:%M')} - {b.end_time.strftime('%H:%M')}",
-            status=b.status.value,
+    """
+    Get user with booking history, penalties and ratings, built in one statement.
+
+    The booking history is paged (50 at a time by default); penalties and
+    ratings are returned in full unless a limit is given.
+    """
+    result = await db.execute(
+        user_summary_query(
+            user_id, limit, booking_offset, penalty_limit, penalty_offset, rating_limit, rating_offset
         )
-        for b in bookings
-    ]
-
-    # Get penalties
-    penalty_result = await db.execute(
-        select(UserPenalty)
-        .where(UserPenalty.user_id == user_id)
-        .order_by(UserPenalty.created_at.desc())
     )
-    penalties = penalty_result.scalars().all()
+    summary = result.scalar_one_or_none()
 
-    # Get ratings
-    rating_result = await db.execute(
-        select(UserRating)
-        .where(UserRating.rated_user_id == user_id)
-        .order_by(UserRating.created_at.desc())
-    )
-    ratings = rating_result.scalars().all()
+    if summary is None:
+        raise NotFoundException(detail="User not found")
 
-    return AdminUserSummaryResponse(
-        user=UserResponse.model_validate(user),
-        booking_history=booking_history,
-        penalties=[PenaltyResponse.model_validate(p) for p in penalties],
-        ratings=[RatingResponse.model_validate(r) for r in ratings],
-    )
+    # Already shaped like AdminUserSummaryResponse
+    return Response(content=summary, media_type="application/json")
@@ -0,0 +1,186 @@
+from datetime import date, datetime, timezone
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.core.exceptions import NotFoundException, ForbiddenException, BadRequestException, ConflictException
+from app.dependencies import get_current_active_user, get_current_admin_user
+from app.models import (
+    AllocationRequest,
+    AllocationRequestStatus,
+    AllocationWindow,
+    AllocationWindowStatus,
+    Space,
+    User,
+    UserRole,
+)
+from app.schemas import (
+    AllocationWindowResponse,
+    CreateAllocationWindowRequest,
+    AllocationRequestResponse,
+    AllocationResult,
+)
+from app.schemas.common import PaginatedResponse, PaginatedResponseMeta
+from app.services.allocations import allocate_window
+
+router = APIRouter()
+
+
+@router.get("/windows", response_model=PaginatedResponse[AllocationWindowResponse])
+async def list_windows(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    status: AllocationWindowStatus | None = AllocationWindowStatus.OPEN,
+    space_id: int | None = Query(default=None, alias="spaceId"),
+    booking_date: date | None = Query(default=None, alias="date"),
+):
+    """List allocation windows (open ones by default)."""
+    query = select(AllocationWindow)
+
+    if status:
+        query = query.where(AllocationWindow.status == status)
+    if space_id:
+        query = query.where(AllocationWindow.space_id == space_id)
+    if booking_date:
+        query = query.where(AllocationWindow.booking_date == booking_date)
+
+    query = query.order_by(AllocationWindow.closes_at, AllocationWindow.id)
+
+    # Count total
+    count_query = select(func.count()).select_from(query.subquery())
+    total_result = await db.execute(count_query)
+    total = total_result.scalar() or 0
+
+    # Apply pagination
+    query = query.offset(offset).limit(limit)
+    result = await db.execute(query)
+    windows = result.scalars().all()
+
+    return PaginatedResponse(
+        data=[AllocationWindowResponse.model_validate(w) for w in windows],
+        meta=PaginatedResponseMeta(total=total, limit=limit, offset=offset)
+    )
+
+
+@router.post("/windows", response_model=AllocationWindowResponse, status_code=status.HTTP_201_CREATED)
+async def create_window(
+    request: CreateAllocationWindowRequest,
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)]
+):
+    """Designate a space and day for batch allocation (admin only)."""
+    space = (await db.execute(select(Space).where(Space.id == request.space_id))).scalar_one_or_none()
+    if not space:
+        raise NotFoundException(detail="Space not found")
+
+    if request.booking_date < date.today():
+        raise BadRequestException(detail="Cannot create allocation windows for past dates")
+    if (request.start_time is None) != (request.end_time is None):
+        raise BadRequestException(detail="Give both start_time and end_time, or neither")
+    if request.start_time is not None and request.end_time <= request.start_time:
+        raise BadRequestException(detail="End time must be after start time")
+    if request.closes_at.tzinfo is None:
+        raise BadRequestException(detail="closes_at must include a timezone")
+    if request.closes_at <= datetime.now(timezone.utc):
+        raise BadRequestException(detail="closes_at must be in the future")
+
+    existing = await db.execute(
+        select(AllocationWindow.id).where(
+            AllocationWindow.space_id == request.space_id,
+            AllocationWindow.booking_date == request.booking_date,
+            AllocationWindow.status == AllocationWindowStatus.OPEN,
+        )
+    )
+    if existing.scalar_one_or_none():
+        raise ConflictException(detail="An allocation window is already open for this space and day")
+
+    window = AllocationWindow(
+        space_id=request.space_id,
+        booking_date=request.booking_date,
+        start_time=request.start_time,
+        end_time=request.end_time,
+        closes_at=request.closes_at,
+        policy=request.policy,
+        created_by=current_user.id,
+    )
+    db.add(window)
+    await db.flush()
+    await db.refresh(window)
+
+    return AllocationWindowResponse.model_validate(window)
+
+
+@router.post("/windows/{window_id}/allocate", response_model=AllocationResult)
+async def allocate_now(
+    window_id: int,
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)]
+):
+    """Allocate a window's queued requests now, even before it closes (admin only)."""
+    if not (await db.execute(select(AllocationWindow.id).where(AllocationWindow.id == window_id))).scalar():
+        raise NotFoundException(detail="Allocation window not found")
+
+    result = await allocate_window(db, window_id)
+    if result is None:
+        raise BadRequestException(detail="Allocation window has already been allocated")
+    return result
+
+
+@router.get("/requests", response_model=PaginatedResponse[AllocationRequestResponse])
+async def list_requests(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    status: AllocationRequestStatus | None = None,
+    window_id: int | None = Query(default=None, alias="windowId"),
+):
+    """List your queued booking requests and their outcomes (admins see everyone's)."""
+    query = select(AllocationRequest)
+
+    if current_user.role != UserRole.ADMIN:
+        query = query.where(AllocationRequest.user_id == current_user.id)
+    if status:
+        query = query.where(AllocationRequest.status == status)
+    if window_id:
+        query = query.where(AllocationRequest.window_id == window_id)
+
+    query = query.order_by(AllocationRequest.requested_at.desc(), AllocationRequest.id.desc())
+
+    # Count total
+    count_query = select(func.count()).select_from(query.subquery())
+    total_result = await db.execute(count_query)
+    total = total_result.scalar() or 0
+
+    # Apply pagination
+    query = query.offset(offset).limit(limit)
+    result = await db.execute(query)
+    requests = result.scalars().all()
+
+    return PaginatedResponse(
+        data=[AllocationRequestResponse.model_validate(r) for r in requests],
+        meta=PaginatedResponseMeta(total=total, limit=limit, offset=offset)
+    )
+
+
+@router.get("/requests/{request_id}", response_model=AllocationRequestResponse)
+async def get_request(
+    request_id: int,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)]
+):
+    """Get a queued booking request and its outcome."""
+    result = await db.execute(select(AllocationRequest).where(AllocationRequest.id == request_id))
+    request = result.scalar_one_or_none()
+
+    if not request:
+        raise NotFoundException(detail="Allocation request not found")
+    if request.user_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise ForbiddenException(detail="Not allowed to view this request")
+
+    return AllocationRequestResponse.model_validate(request)
@@ -0,0 +1,106 @@
+from datetime import date, timedelta
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select, func, cast, Text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.exceptions import BadRequestException
+from app.dependencies import get_current_admin_user
+from app.models import Space, SpaceUsageRollup, User
+from app.schemas import UtilizationGroupBy, UtilizationRow, UtilizationResponse
+from app.services.usage import STATUS_COLUMNS
+
+router = APIRouter()
+
+
+@router.get("/utilization", response_model=UtilizationResponse)
+async def get_utilization(
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    date_from: date | None = Query(default=None, alias="from"),
+    date_to: date | None = Query(default=None, alias="to"),
+    group_by: UtilizationGroupBy = Query(default=UtilizationGroupBy.SPACE, alias="groupBy"),
+    building: str | None = None,
+    space_id: int | None = Query(default=None, alias="spaceId"),
+):
+    """Occupancy and no-show rates from the usage rollups (admin only)."""
+    date_to = date_to or date.today()
+    date_from = date_from or date_to - timedelta(days=29)
+    if date_to < date_from:
+        raise BadRequestException(detail="'to' must not be before 'from'")
+
+    rollup = SpaceUsageRollup
+    if group_by == UtilizationGroupBy.SPACE:
+        key, label = cast(rollup.space_id, Text), func.min(Space.name)
+        group = rollup.space_id
+    elif group_by == UtilizationGroupBy.BUILDING:
+        key, label = Space.building, None
+        group = Space.building
+    elif group_by == UtilizationGroupBy.HOUR:
+        key, label = cast(rollup.hour, Text), None
+        group = rollup.hour
+    else:
+        key, label = cast(rollup.usage_date, Text), None
+        group = rollup.usage_date
+
+    counters = [*STATUS_COLUMNS.values(), "booked_minutes"]
+    query = (
+        select(
+            key.label("key"),
+            *([label.label("label")] if label is not None else []),
+            *[func.sum(getattr(rollup, column)).label(column) for column in counters],
+        )
+        .select_from(rollup)
+        .join(Space, Space.id == rollup.space_id)
+        .where(rollup.usage_date >= date_from, rollup.usage_date <= date_to)
+        .group_by(group)
+        .order_by(group)
+    )
+    space_count_query = select(Space.building, func.count()).group_by(Space.building)
+    if building:
+        query = query.where(Space.building == building)
+        space_count_query = space_count_query.where(Space.building == building)
+    if space_id:
+        query = query.where(rollup.space_id == space_id)
+        space_count_query = space_count_query.where(Space.id == space_id)
+
+    result = await db.execute(query)
+    rows = result.mappings().all()
+
+    # Bookable minutes per group, for occupancy
+    spaces_per_building = dict((await db.execute(space_count_query)).all())
+    total_spaces = sum(spaces_per_building.values())
+    days = (date_to - date_from).days + 1
+    open_minutes = max(settings.BOOKING_DAY_END_HOUR - settings.BOOKING_DAY_START_HOUR, 0) * 60
+
+    def available_minutes(row) -> int:
+        if group_by == UtilizationGroupBy.SPACE:
+            return days * open_minutes
+        if group_by == UtilizationGroupBy.BUILDING:
+            return days * open_minutes * spaces_per_building.get(row["key"], 0)
+        if group_by == UtilizationGroupBy.HOUR:
+            return days * 60 * total_spaces
+        return open_minutes * total_spaces
+
+    data = []
+    for row in rows:
+        available = available_minutes(row)
+        held = row["approved_count"] + row["completed_count"] + row["no_show_count"]
+        data.append(UtilizationRow(
+            key=row["key"],
+            label=row.get("label"),
+            booking_count=sum(row[column] for column in STATUS_COLUMNS.values()),
+            **{column: row[column] for column in counters},
+            occupancy_rate=row["booked_minutes"] / available if available else None,
+            no_show_rate=row["no_show_count"] / held if held else None,
+        ))
+
+    return UtilizationResponse(
+        date_from=date_from,
+        date_to=date_to,
+        group_by=group_by,
+        rows=data,
+    )
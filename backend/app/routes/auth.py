@@ -5,8 +5,8 @@ from fastapi.security import OAuth2PasswordRequestForm, HTTPAuthorizationCredent
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_async_db
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.database import get_async_db, get_read_db
+from app.core.security import get_password_hash_async, verify_password_async, create_access_token
 from app.dependencies.auth import bearer_scheme
 from app.core.exceptions import (
     BadRequestException,
@@ -46,7 +46,7 @@ async def register(
     # Create new user
     user = User(
         email=request.email.lower(),
-        password_hash=get_password_hash(request.password),
+        password_hash=await get_password_hash_async(request.password),
         full_name=request.full_name,
         student_id=request.student_id,
         department=request.department,
@@ -71,13 +71,15 @@ async def register(
 @router.post("/login", response_model=AuthTokenResponse)
 async def login(
     request: LoginRequest,
-    db: Annotated[AsyncSession, Depends(get_async_db)]
+    db: Annotated[AsyncSession, Depends(get_read_db)]
 ):
     """Log in and receive JWT token."""
     result = await db.execute(select(User).where(User.email == request.email.lower()))
     user = result.scalar_one_or_none()
+    # Release the connection before the slow password check
+    await db.close()
 
-    if not user or not verify_password(request.password, user.password_hash):
+    if not user or not await verify_password_async(request.password, user.password_hash):
         raise UnauthorizedException(detail="Invalid email or password", code="INVALID_CREDENTIALS")
 
     if user.status != UserStatus.ACTIVE:
@@ -95,13 +97,14 @@ async def login(
 @router.post("/login/form", response_model=AuthTokenResponse)
 async def login_form(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    db: Annotated[AsyncSession, Depends(get_async_db)]
+    db: Annotated[AsyncSession, Depends(get_read_db)]
 ):
     """Log in using form data (for OAuth2 compatibility)."""
     result = await db.execute(select(User).where(User.email == form_data.username.lower()))
     user = result.scalar_one_or_none()
+    await db.close()
 
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user or not await verify_password_async(form_data.password, user.password_hash):
         raise UnauthorizedException(detail="Invalid email or password", code="INVALID_CREDENTIALS")
 
     if user.status != UserStatus.ACTIVE:
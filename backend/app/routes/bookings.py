@@ -1,45 +1,168 @@
 from datetime import datetime, timezone, date
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, noload, selectinload
 
-from app.core.database import get_async_db
+from app.core.config import settings
+from app.core.database import get_async_db, get_primary_read_db
+from app.core.encoding import negotiated_response
 from app.core.exceptions import (
     NotFoundException,
     ForbiddenException,
     BadRequestException,
 )
-from app.dependencies import get_current_active_user, get_current_admin_user
+from app.dependencies import (
+    get_current_active_user,
+    get_current_admin_user,
+    get_batch_ids,
+    parse_ids,
+    id_in,
+    in_request_order,
+)
 from app.models import Booking, Space, User, BookingStatus, UserRole
 from app.schemas import (
+    AllocationRequestResponse,
     BookingResponse,
+    BookingCalendarResponse,
     CreateBookingRequest,
+    SpaceResponse,
     UpdateBookingStatusRequest,
+    UserSummaryResponse,
 )
-from app.schemas.common import PaginatedResponse, PaginatedResponseMeta
+from app.schemas.common import ChangesResponse, PaginatedResponse, PaginatedResponseMeta
+from app.services.allocations import allocate_window, find_open_window, queue_request
+from app.services.alternatives import BLOCKING_STATUSES, suggest_alternatives
+from app.services.changes import fetch_changes
+from app.services.usage import usage_snapshot, record_booking_usage
+from app.services.user_stats import record_booking_status
 
 router = APIRouter()
 
+BOOKING_FIELDS = tuple(name for name in BookingResponse.model_fields if name not in ("space", "user"))
+BOOKING_RELATIONS = ("space", "user")
+# Statuses on a calendar unless asked otherwise: everything that held its slot
+CALENDAR_STATUSES = tuple(
+    s for s in BookingStatus if s not in (BookingStatus.CANCELLED, BookingStatus.REJECTED)
+)
+
+
+def _split(value: str, allowed: tuple[str, ...], param: str) -> tuple[str, ...]:
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise BadRequestException(
+            detail=f"Unknown {param}: {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+    # Keep the schema's order, drop duplicates
+    return tuple(name for name in allowed if name in names)
+
+
+class BookingView:
+    """
+    Which booking fields and related rows a request asked for.
+
+    Without ``fields`` the full ``BookingResponse`` is returned, with the space
+    and user unless ``include`` narrows them. With ``fields`` only those columns
+    are loaded and returned, and related rows only when named in ``include``.
+    """
+
+    def __init__(self, fields: tuple[str, ...] | None, include: tuple[str, ...]):
+        self.fields = fields
+        self.include = include
+
+    @property
+    def include_space(self) -> bool:
+        return "space" in self.include
+
+    @property
+    def include_user(self) -> bool:
+        return "user" in self.include
+
+    def options(self, columns: bool = True) -> list:
+        """Loader options for the requested shape; ``columns=False`` loads whole rows."""
+        options = [
+            selectinload(Booking.space).options(
+                selectinload(Space.utilities), noload(Space.space_utilities)
+            ) if self.include_space else noload(Booking.space),
+            selectinload(Booking.user) if self.include_user else noload(Booking.user),
+        ]
+        if columns and self.fields is not None:
+            # user_id is needed for the ownership checks, the keys for the relations
+            needed = {"user_id", "space_id", *self.fields}
+            options.append(load_only(*(getattr(Booking, name) for name in needed)))
+        return options
+
+    def render(self, booking: Booking) -> BookingResponse | dict[str, Any]:
+        if self.fields is None:
+            return BookingResponse.from_orm_with_relations(
+                booking, include_space=self.include_space, include_user=self.include_user
+            )
+        data = {name: getattr(booking, name) for name in self.fields}
+        if self.include_space:
+            data["space"] = SpaceResponse.from_orm_with_utilities(booking.space)
+        if self.include_user:
+            data["user"] = UserSummaryResponse.model_validate(booking.user)
+        return data
+
+    def respond(self, content: Any, status_code: int = status.HTTP_200_OK) -> Any:
+        """Sparse payloads bypass ``response_model``, which would require every field."""
+        if self.fields is None:
+            return content
+        return JSONResponse(jsonable_encoder(content), status_code=status_code)
+
+
+def get_booking_view(
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated booking fields to return (default: all)",
+    ),
+    include: str | None = Query(
+        default=None,
+        description="Comma-separated relations to embed: space, user "
+                    "(default: both, or none when fields is given)",
+    ),
+) -> BookingView:
+    selected = _split(fields, BOOKING_FIELDS, "fields") if fields is not None else None
+    if include is not None:
+        relations = _split(include, BOOKING_RELATIONS, "include")
+    else:
+        relations = () if selected is not None else BOOKING_RELATIONS
+    return BookingView(selected, relations)
+
+
+async def _reload(db: AsyncSession, booking: Booking, view: BookingView) -> Booking:
+    """Re-read a flushed booking with the view's relations."""
+    query = select(Booking).where(Booking.id == booking.id).options(
+        *view.options(columns=False)
+    ).execution_options(populate_existing=True)
+    result = await db.execute(query)
+    return result.scalar_one()
+
 
 @router.get("", response_model=PaginatedResponse[BookingResponse])
 async def list_bookings(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_async_db)],
+    view: Annotated[BookingView, Depends(get_booking_view)],
+    ids: Annotated[list[int] | None, Depends(get_batch_ids)],
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
     status: BookingStatus | None = None,
     my: bool = Query(default=True, description="If true, only return user's own bookings"),
     user_id: int | None = Query(default=None, description="Admin filter by userId"),
     space_id: int | None = Query(default=None, alias="spaceId"),
+    date_from: date | None = Query(default=None, alias="from", description="Earliest booking date"),
+    date_to: date | None = Query(default=None, alias="to", description="Latest booking date"),
 ):
     """List bookings."""
-    query = select(Booking).options(
-        selectinload(Booking.space).selectinload(Space.utilities),
-        selectinload(Booking.user)
-    )
+    if date_from and date_to and date_to < date_from:
+        raise BadRequestException(detail="'to' must not be before 'from'")
+    query = select(Booking)
 
     # Non-admin users can ONLY see their own bookings (ignore my and user_id parameters)
     if current_user.role != UserRole.ADMIN:
@@ -48,14 +171,27 @@ async def list_bookings(
         # Admin can filter by user_id or see their own bookings
         if user_id:
             query = query.where(Booking.user_id == user_id)
-        elif my:
+        elif my and ids is None:
             query = query.where(Booking.user_id == current_user.id)
-        # If admin sets my=False and no user_id, show all bookings
+        # If admin sets my=False and no user_id, or asks for ids, show all bookings
 
     if status:
         query = query.where(Booking.status == status)
     if space_id:
         query = query.where(Booking.space_id == space_id)
+    # Restricting booking_date limits the scan to those months' partitions
+    if date_from:
+        query = query.where(Booking.booking_date >= date_from)
+    if date_to:
+        query = query.where(Booking.booking_date <= date_to)
+
+    if ids is not None:
+        result = await db.execute(query.where(id_in(Booking.id, ids)).options(*view.options()))
+        bookings = in_request_order(result.scalars().all(), ids)
+        return view.respond(PaginatedResponse[Any](
+            data=[view.render(b) for b in bookings],
+            meta=PaginatedResponseMeta(total=len(bookings), limit=len(ids), offset=0)
+        ))
 
     # Order by most recent first
     query = query.order_by(Booking.booking_date.desc(), Booking.start_time.desc())
@@ -66,13 +202,99 @@ async def list_bookings(
     total = total_result.scalar() or 0
 
     # Apply pagination
-    query = query.offset(offset).limit(limit)
+    query = query.options(*view.options()).offset(offset).limit(limit)
     result = await db.execute(query)
     bookings = result.scalars().all()
 
-    return PaginatedResponse(
-        data=[BookingResponse.from_orm_with_relations(b) for b in bookings],
+    return view.respond(PaginatedResponse[Any](
+        data=[view.render(b) for b in bookings],
         meta=PaginatedResponseMeta(total=total, limit=limit, offset=offset)
+    ))
+
+
+@router.get("/calendar", response_model=BookingCalendarResponse)
+async def booking_calendar(
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    date_from: date = Query(alias="from", description="First day"),
+    date_to: date = Query(alias="to", description="Last day"),
+    space_ids: str | None = Query(
+        default=None, alias="spaceIds", description="Comma-separated space ids (default: all)"
+    ),
+    statuses: str | None = Query(
+        default=None,
+        description="Comma-separated statuses (default: all but cancelled and rejected)",
+    ),
+):
+    """
+    Bookings in a date range as parallel arrays, for calendars and displays.
+    Send ``Accept: application/msgpack`` for MessagePack instead of JSON.
+    """
+    if date_to < date_from:
+        raise BadRequestException(detail="'to' must not be before 'from'")
+    if (date_to - date_from).days >= settings.CALENDAR_MAX_DAYS:
+        raise BadRequestException(detail=f"At most {settings.CALENDAR_MAX_DAYS} days per request")
+    wanted = CALENDAR_STATUSES
+    if statuses is not None:
+        names = _split(statuses, tuple(s.value for s in BookingStatus), "statuses")
+        wanted = tuple(BookingStatus(name) for name in names)
+
+    query = (
+        select(
+            Booking.id, Booking.space_id, Booking.booking_date,
+            Booking.start_time, Booking.end_time, Booking.status,
+        )
+        .where(
+            Booking.booking_date >= date_from,
+            Booking.booking_date <= date_to,
+            Booking.status.in_(wanted),
+        )
+        .order_by(Booking.booking_date, Booking.space_id, Booking.start_time)
+    )
+    if space_ids is not None:
+        query = query.where(id_in(Booking.space_id, parse_ids(space_ids, "spaceIds")))
+    rows = (await db.execute(query)).all()
+
+    status_index = {booking_status: i for i, booking_status in enumerate(wanted)}
+    return negotiated_response(request, BookingCalendarResponse(
+        start_date=date_from,
+        end_date=date_to,
+        status_names=list(wanted),
+        ids=[row.id for row in rows],
+        space_ids=[row.space_id for row in rows],
+        days=[(row.booking_date - date_from).days for row in rows],
+        start_minutes=[row.start_time.hour * 60 + row.start_time.minute for row in rows],
+        end_minutes=[row.end_time.hour * 60 + row.end_time.minute for row in rows],
+        statuses=[status_index[row.status] for row in rows],
+    ))
+
+
+@router.get("/changes", response_model=ChangesResponse[BookingResponse])
+async def booking_changes(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+    since: str | None = Query(default=None, description="Cursor from the previous response; omit for a full copy"),
+    limit: int = Query(default=500, ge=1, le=1000),
+    my: bool = Query(default=True, description="If true, only return user's own bookings"),
+    include: str | None = Query(
+        default=None,
+        description="Comma-separated relations to embed: space, user (default: none)",
+    ),
+):
+    """Bookings created or updated, and ids of bookings deleted, since a cursor."""
+    view = BookingView(None, _split(include, BOOKING_RELATIONS, "include") if include else ())
+    query = select(Booking).options(*view.options())
+    # Non-admin users can ONLY sync their own bookings
+    if current_user.role != UserRole.ADMIN or my:
+        query = query.where(Booking.user_id == current_user.id)
+
+    changes = await fetch_changes(db, query, Booking, since, limit)
+    return ChangesResponse(
+        data=[view.render(b) for b in changes.rows],
+        deleted=changes.deleted,
+        cursor=changes.cursor,
+        has_more=changes.has_more,
     )
 
 
@@ -80,13 +302,11 @@ async def list_bookings(
 async def get_booking(
     booking_id: int,
     current_user: Annotated[User, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_async_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    view: Annotated[BookingView, Depends(get_booking_view)],
 ):
     """Get booking details."""
-    query = select(Booking).where(Booking.id == booking_id).options(
-        selectinload(Booking.space).selectinload(Space.utilities),
-        selectinload(Booking.user)
-    )
+    query = select(Booking).where(Booking.id == booking_id).options(*view.options())
     result = await db.execute(query)
     booking = result.scalar_one_or_none()
 
@@ -97,16 +317,35 @@ async def get_booking(
     if current_user.role != UserRole.ADMIN and booking.user_id != current_user.id:
         raise ForbiddenException(detail="Not allowed to view this booking")
 
-    return BookingResponse.from_orm_with_relations(booking)
+    return view.respond(view.render(booking))
 
 
-@router.post("", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=BookingResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": AllocationRequestResponse}},
+)
 async def create_booking(
     request: CreateBookingRequest,
     current_user: Annotated[User, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_async_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    view: Annotated[BookingView, Depends(get_booking_view)],
 ):
-    """Create a new booking request."""
+    """
+    Create a new booking request.
+
+    Requests for slots in an open allocation window are queued instead and
+    answered with ``202`` and the queued request (see ``/allocations``).
+    """
+    # Users with too many active penalty points lose booking privileges
+    limit = settings.BOOKING_PENALTY_POINTS_LIMIT
+    if limit and current_user.active_penalty_points >= limit:
+        raise ForbiddenException(
+            detail=f"Booking privileges suspended: {current_user.active_penalty_points} active penalty points",
+            code="PENALTY_LIMIT_REACHED",
+        )
+
     # Verify space exists and is active
     space_result = await db.execute(
         select(Space).where(Space.id == request.space_id).options(selectinload(Space.utilities))
@@ -134,19 +373,45 @@ async def create_booking(
     if request.booking_date < today:
         raise BadRequestException(detail="Cannot create bookings for past dates")
 
+    # Designated high-demand slots queue requests and allocate them in one batch
+    window = await find_open_window(
+        db, request.space_id, request.booking_date, request.start_time, request.end_time
+    )
+    if window is not None:
+        if window.closes_at > datetime.now(timezone.utc):
+            queued = await queue_request(db, window, current_user, request)
+            return JSONResponse(
+                jsonable_encoder(AllocationRequestResponse.model_validate(queued)),
+                status_code=status.HTTP_202_ACCEPTED,
+            )
+        # Closed but not yet allocated: allocate first, then book as usual. The
+        # request has only read so far, so committing here gives the allocation
+        # a transaction of its own that a failure below (likeliest a conflict
+        # with the slots just granted) can't roll back
+        await allocate_window(db, window.id)
+        await db.commit()
+
     # Check for time conflicts
     conflict_query = select(Booking).where(
         and_(
             Booking.space_id == request.space_id,
             Booking.booking_date == request.booking_date,
-            Booking.status.in_([BookingStatus.PENDING, BookingStatus.APPROVED]),
+            Booking.status.in_(BLOCKING_STATUSES),
             Booking.start_time < request.end_time,
             Booking.end_time > request.start_time,
         )
-    )
+    ).limit(1)
     conflict_result = await db.execute(conflict_query)
     if conflict_result.scalar_one_or_none():
-        raise BadRequestException(detail="Time slot conflicts with existing booking")
+        # Offer the nearest free slots so the client doesn't have to guess
+        alternatives = await suggest_alternatives(
+            db, space, request.booking_date, request.start_time, request.end_time, request.attendees
+        )
+        raise BadRequestException(
+            detail="Time slot conflicts with existing booking",
+            code="SLOT_CONFLICT",
+            details={"alternatives": jsonable_encoder(alternatives)},
+        )
 
     booking = Booking(
         user_id=current_user.id,
@@ -161,16 +426,13 @@ async def create_booking(
 
     db.add(booking)
     await db.flush()
+    await record_booking_usage(db, None, booking)
+    await record_booking_status(db, booking.user_id, None, booking.status)
 
-    # Reload with relations
-    query = select(Booking).where(Booking.id == booking.id).options(
-        selectinload(Booking.space).selectinload(Space.utilities),
-        selectinload(Booking.user)
-    )
-    result = await db.execute(query)
-    booking = result.scalar_one()
+    # Reload with the requested relations
+    booking = await _reload(db, booking, view)
 
-    return BookingResponse.from_orm_with_relations(booking)
+    return view.respond(view.render(booking), status_code=status.HTTP_201_CREATED)
 
 
 @router.patch("/{booking_id}", response_model=BookingResponse)
@@ -178,13 +440,11 @@ async def update_booking(
     booking_id: int,
     request: UpdateBookingStatusRequest,
     current_user: Annotated[User, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_async_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    view: Annotated[BookingView, Depends(get_booking_view)],
 ):
     """Update booking status (approve/reject/cancel/etc.)."""
-    query = select(Booking).where(Booking.id == booking_id).options(
-        selectinload(Booking.space).selectinload(Space.utilities),
-        selectinload(Booking.user)
-    )
+    query = select(Booking).where(Booking.id == booking_id).options(*view.options(columns=False))
     result = await db.execute(query)
     booking = result.scalar_one_or_none()
 
@@ -204,6 +464,7 @@ async def update_booking(
             raise BadRequestException(detail="Can only cancel pending bookings")
 
     # Update status
+    before = usage_snapshot(booking)
     booking.status = request.status
 
     if request.status == BookingStatus.CANCELLED:
@@ -214,10 +475,12 @@ async def update_booking(
         booking.approved_by = current_user.id
         booking.approved_at = datetime.now(timezone.utc)
 
+    await record_booking_usage(db, before, booking)
+    await record_booking_status(db, booking.user_id, before.status, booking.status)
     await db.flush()
-    await db.refresh(booking)
+    booking = await _reload(db, booking, view)
 
-    return BookingResponse.from_orm_with_relations(booking)
+    return view.respond(view.render(booking))
 
 
 @router.delete("/{booking_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -233,6 +496,8 @@ async def delete_booking(
     if not booking:
         raise NotFoundException(detail="Booking not found")
 
+    await record_booking_usage(db, usage_snapshot(booking), None)
+    await record_booking_status(db, booking.user_id, booking.status, None)
     await db.delete(booking)
     await db.flush()
 
@@ -241,13 +506,11 @@ async def delete_booking(
 async def check_in_booking(
     booking_id: int,
     current_user: Annotated[User, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_async_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    view: Annotated[BookingView, Depends(get_booking_view)],
 ):
     """Mark a booking as checked-in."""
-    query = select(Booking).where(Booking.id == booking_id).options(
-        selectinload(Booking.space).selectinload(Space.utilities),
-        selectinload(Booking.user)
-    )
+    query = select(Booking).where(Booking.id == booking_id).options(*view.options(columns=False))
     result = await db.execute(query)
     booking = result.scalar_one_or_none()
 
@@ -269,22 +532,20 @@ async def check_in_booking(
     booking.check_in_at = datetime.now(timezone.utc)
 
     await db.flush()
-    await db.refresh(booking)
+    booking = await _reload(db, booking, view)
 
-    return BookingResponse.from_orm_with_relations(booking)
+    return view.respond(view.render(booking))
 
 
 @router.post("/{booking_id}/check-out", response_model=BookingResponse)
 async def check_out_booking(
     booking_id: int,
     current_user: Annotated[User, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_async_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    view: Annotated[BookingView, Depends(get_booking_view)],
 ):
     """Mark a booking as checked-out."""
-    query = select(Booking).where(Booking.id == booking_id).options(
-        selectinload(Booking.space).selectinload(Space.utilities),
-        selectinload(Booking.user)
-    )
+    query = select(Booking).where(Booking.id == booking_id).options(*view.options(columns=False))
     result = await db.execute(query)
     booking = result.scalar_one_or_none()
 
@@ -303,10 +564,13 @@ async def check_out_booking(
     if booking.check_out_at:
         raise BadRequestException(detail="Already checked out")
 
+    before = usage_snapshot(booking)
     booking.check_out_at = datetime.now(timezone.utc)
     booking.status = BookingStatus.COMPLETED
 
+    await record_booking_usage(db, before, booking)
+    await record_booking_status(db, booking.user_id, before.status, booking.status)
     await db.flush()
-    await db.refresh(booking)
+    booking = await _reload(db, booking, view)
 
-    return BookingResponse.from_orm_with_relations(booking)
+    return view.respond(view.render(booking))
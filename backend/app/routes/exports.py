@@ -0,0 +1,150 @@
+from datetime import date, datetime, time, timedelta
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.core.exceptions import BadRequestException
+from app.dependencies import get_current_admin_user
+from app.models import (
+    User,
+    Space,
+    Booking,
+    UserPenalty,
+    UserRating,
+    BookingStatus,
+    PenaltyStatus,
+)
+from app.schemas import ExportFormat
+from app.services.exports import export_response
+
+router = APIRouter()
+
+
+def check_range(date_from: date | None, date_to: date | None) -> None:
+    if date_from and date_to and date_to < date_from:
+        raise BadRequestException(detail="'to' must not be before 'from'")
+
+
+def created_between(column, date_from: date | None, date_to: date | None) -> list:
+    """Filters for a timestamp column falling on or between two dates."""
+    filters = []
+    if date_from:
+        filters.append(column >= datetime.combine(date_from, time.min))
+    if date_to:
+        filters.append(column < datetime.combine(date_to + timedelta(days=1), time.min))
+    return filters
+
+
+@router.get("/bookings", response_class=StreamingResponse)
+async def export_bookings(
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    format: ExportFormat = ExportFormat.CSV,
+    date_from: date | None = Query(default=None, alias="from"),
+    date_to: date | None = Query(default=None, alias="to"),
+    status: BookingStatus | None = None,
+):
+    """Stream bookings as CSV or NDJSON (admin only)."""
+    check_range(date_from, date_to)
+
+    query = (
+        select(
+            Booking.id,
+            Booking.booking_date,
+            Booking.start_time,
+            Booking.end_time,
+            Booking.status,
+            Booking.space_id,
+            Space.name.label("space_name"),
+            Booking.user_id,
+            User.email.label("user_email"),
+            Booking.attendees,
+            Booking.purpose,
+            Booking.requested_at,
+            Booking.approved_by,
+            Booking.approved_at,
+            Booking.cancelled_at,
+            Booking.cancellation_reason,
+            Booking.check_in_at,
+            Booking.check_out_at,
+        )
+        .join(Space, Space.id == Booking.space_id)
+        .join(User, User.id == Booking.user_id)
+        .order_by(Booking.booking_date, Booking.start_time, Booking.id)
+    )
+    if date_from:
+        query = query.where(Booking.booking_date >= date_from)
+    if date_to:
+        query = query.where(Booking.booking_date <= date_to)
+    if status:
+        query = query.where(Booking.status == status)
+
+    return export_response(db, query, format, "bookings")
+
+
+@router.get("/penalties", response_class=StreamingResponse)
+async def export_penalties(
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    format: ExportFormat = ExportFormat.CSV,
+    date_from: date | None = Query(default=None, alias="from"),
+    date_to: date | None = Query(default=None, alias="to"),
+    status: PenaltyStatus | None = None,
+):
+    """Stream penalties as CSV or NDJSON, filtered by creation date (admin only)."""
+    check_range(date_from, date_to)
+
+    query = (
+        select(
+            UserPenalty.id,
+            UserPenalty.created_at,
+            UserPenalty.user_id,
+            User.email.label("user_email"),
+            UserPenalty.booking_id,
+            UserPenalty.reason,
+            UserPenalty.points,
+            UserPenalty.status,
+            UserPenalty.created_by,
+        )
+        .join(User, User.id == UserPenalty.user_id)
+        .where(*created_between(UserPenalty.created_at, date_from, date_to))
+        .order_by(UserPenalty.created_at, UserPenalty.id)
+    )
+    if status:
+        query = query.where(UserPenalty.status == status)
+
+    return export_response(db, query, format, "penalties")
+
+
+@router.get("/ratings", response_class=StreamingResponse)
+async def export_ratings(
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    format: ExportFormat = ExportFormat.CSV,
+    date_from: date | None = Query(default=None, alias="from"),
+    date_to: date | None = Query(default=None, alias="to"),
+):
+    """Stream ratings as CSV or NDJSON, filtered by creation date (admin only)."""
+    check_range(date_from, date_to)
+
+    query = (
+        select(
+            UserRating.id,
+            UserRating.created_at,
+            UserRating.rated_user_id,
+            User.email.label("rated_user_email"),
+            UserRating.booking_id,
+            UserRating.rating,
+            UserRating.comment,
+            UserRating.created_by,
+        )
+        .join(User, User.id == UserRating.rated_user_id)
+        .where(*created_between(UserRating.created_at, date_from, date_to))
+        .order_by(UserRating.created_at, UserRating.id)
+    )
+
+    return export_response(db, query, format, "ratings")
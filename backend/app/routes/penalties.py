@@ -14,6 +14,7 @@ from app.schemas import (
     UpdatePenaltyRequest,
 )
 from app.schemas.common import PaginatedResponse, PaginatedResponseMeta
+from app.services.user_stats import adjust_user_stats, active_points
 
 router = APIRouter()
 
@@ -97,6 +98,7 @@ async def add_penalty(
 
     db.add(penalty)
     await db.flush()
+    await adjust_user_stats(db, penalty.user_id, active_penalty_points=active_points(penalty.status, penalty.points))
     await db.refresh(penalty)
 
     return PenaltyResponse.model_validate(penalty)
@@ -117,6 +119,7 @@ async def update_penalty(
         raise NotFoundException(detail="Penalty not found")
 
     # Update fields if provided
+    points_before = active_points(penalty.status, penalty.points)
     if request.reason is not None:
         penalty.reason = request.reason
     if request.points is not None:
@@ -124,6 +127,11 @@ async def update_penalty(
     if request.status is not None:
         penalty.status = request.status
 
+    await adjust_user_stats(
+        db,
+        penalty.user_id,
+        active_penalty_points=active_points(penalty.status, penalty.points) - points_before,
+    )
     await db.flush()
     await db.refresh(penalty)
 
@@ -143,5 +151,6 @@ async def delete_penalty(
     if not penalty:
         raise NotFoundException(detail="Penalty not found")
 
+    await adjust_user_stats(db, penalty.user_id, active_penalty_points=-active_points(penalty.status, penalty.points))
     await db.delete(penalty)
     await db.flush()
@@ -14,6 +14,7 @@ from app.schemas import (
     UpdateRatingRequest,
 )
 from app.schemas.common import PaginatedResponse, PaginatedResponseMeta
+from app.services.user_stats import adjust_user_stats
 
 router = APIRouter()
 
@@ -97,6 +98,7 @@ async def add_rating(
 
     db.add(rating)
     await db.flush()
+    await adjust_user_stats(db, rating.rated_user_id, rating_count=1, rating_sum=rating.rating)
     await db.refresh(rating)
 
     return RatingResponse.model_validate(rating)
@@ -117,6 +119,7 @@ async def update_rating(
         raise NotFoundException(detail="Rating not found")
 
     # Update rating fields
+    await adjust_user_stats(db, rating.rated_user_id, rating_sum=request.rating - rating.rating)
     rating.rating = request.rating
     rating.comment = request.comment
 
@@ -139,5 +142,6 @@ async def delete_rating(
     if not rating:
         raise NotFoundException(detail="Rating not found")
 
+    await adjust_user_stats(db, rating.rated_user_id, rating_count=-1, rating_sum=-rating.rating)
     await db.delete(rating)
     await db.flush()
@@ -1,56 +1,70 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy import select, func
+from fastapi import APIRouter, Depends, Query, UploadFile, status
+from sqlalchemy import Select, and_, case, distinct, select, func, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.database import get_async_db
-from app.core.exceptions import NotFoundException, ForbiddenException
-from app.dependencies import get_current_active_user, get_current_admin_user
+from app.core.cache import catalog_cache
+from app.core.database import get_async_db, get_primary_read_db
+from app.core.exceptions import NotFoundException, ForbiddenException, BadRequestException
+from app.core.json_sql import enum_value, json_list, json_object
+from app.core.invalidation import InvalidationKind, invalidate
+from app.dependencies import get_current_active_user, get_current_admin_user, get_batch_ids, id_in, in_request_order
 from app.models import Space, Utility, SpaceUtility, User, SpaceStatus
 from app.schemas import (
     SpaceResponse,
     CreateSpaceRequest,
     UpdateSpaceRequest,
     SpaceFilterConfigResponse,
+    SpacesBootstrapResponse,
+    SpaceListResponse,
+    UtilityResponse,
+    ImportFormat,
+    ImportResult,
 )
-from app.schemas.common import PaginatedResponse, PaginatedResponseMeta
+from app.schemas.space import BuildingFacetCount, CapacityFacetCount, FacetCount, SpaceFacets
+from app.schemas.common import ChangesResponse, PaginatedResponse, PaginatedResponseMeta
+from app.services.changes import fetch_changes
+from app.services.imports import detect_format, parse_rows, import_spaces
 
 router = APIRouter()
 
+# Columns of a space that SpaceResponse returns as-is
+SPACE_COLUMNS = (
+    "id", "name", "building", "floor", "location", "capacity", "image_url", "created_at", "updated_at",
+)
 
-@router.get("", response_model=PaginatedResponse[SpaceResponse])
-async def list_spaces(
-    db: Annotated[AsyncSession, Depends(get_async_db)],
-    limit: int = Query(default=20, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
-    q: str | None = Query(default=None, description="Search query"),
-    building: str | None = None,
-    floor: str | None = None,
-    capacity_min: int | None = Query(default=None, alias="capacityMin"),
-    capacity_max: int | None = Query(default=None, alias="capacityMax"),
-    utilities: str | None = Query(default=None, description="Comma-separated utility keys"),
-    status: SpaceStatus | None = None,
-):
-    """List spaces with filtering & search."""
-    query = select(Space).options(selectinload(Space.utilities))
 
-    # Apply filters
+# Capacity ranges counted by the facets, matching the filter UI
+CAPACITY_BUCKETS = ((1, 10), (11, 30), (31, None))
+
+
+def _space_conditions(
+    q: str | None,
+    building: str | None,
+    floor: str | None,
+    capacity_min: int | None,
+    capacity_max: int | None,
+    utilities: str | None,
+    status: SpaceStatus | None,
+) -> dict[str, list]:
+    """The list filters as conditions on ``Space``, by the facet they belong to."""
+    conditions = {"always": [], "location": [], "capacity": [], "utilities": []}
     if q:
-        query = query.where(
+        conditions["always"].append(
             Space.name.ilike(f"%{q}%") | Space.building.ilike(f"%{q}%")
         )
     if building:
-        query = query.where(Space.building == building)
+        conditions["location"].append(Space.building == building)
     if floor:
-        query = query.where(Space.floor == floor)
+        conditions["location"].append(Space.floor == floor)
     if capacity_min:
-        query = query.where(Space.capacity >= capacity_min)
+        conditions["capacity"].append(Space.capacity >= capacity_min)
     if capacity_max:
-        query = query.where(Space.capacity <= capacity_max)
+        conditions["capacity"].append(Space.capacity <= capacity_max)
     if status:
-        query = query.where(Space.status == status)
+        conditions["always"].append(Space.status == status)
 
     # Filter by utilities
     if utilities:
@@ -61,7 +75,134 @@ async def list_spaces(
                 .join(Utility)
                 .where(Utility.key == key)
             )
-            query = query.where(Space.id.in_(subquery))
+            conditions["utilities"].append(Space.id.in_(subquery))
+
+    return conditions
+
+
+def _filter_spaces(query: Select, *filters) -> Select:
+    """Apply the list filters (see ``_space_conditions``) to a query over ``Space``."""
+    for group in _space_conditions(*filters).values():
+        query = query.where(*group)
+    return query
+
+
+async def _space_facets(db: AsyncSession, *filters) -> SpaceFacets:
+    """
+    Facet counts for the list filters, in one statement: each space is
+    joined to its utilities and counted once per grouping set. Building and
+    capacity counts apply every filter but their own; utility counts apply
+    them all, since selected utilities combine with AND.
+    """
+    conditions = _space_conditions(*filters)
+
+    def matching(*facets: str):
+        return and_(true(), *(c for facet in facets for c in conditions[facet]))
+
+    bucket = case(
+        *(
+            (Space.capacity.between(low, high) if high else Space.capacity >= low, index)
+            for index, (low, high) in enumerate(CAPACITY_BUCKETS)
+        ),
+    )
+    rows = (
+        select(
+            Space.id,
+            Space.building,
+            Space.floor,
+            bucket.label("bucket"),
+            Utility.key.label("utility"),
+            matching("location").label("in_location"),
+            matching("capacity").label("in_capacity"),
+            matching("utilities").label("in_utilities"),
+        )
+        .select_from(Space)
+        .outerjoin(SpaceUtility, SpaceUtility.space_id == Space.id)
+        .outerjoin(Utility, Utility.id == SpaceUtility.utility_id)
+        .where(*conditions["always"])
+        .subquery("rows")
+    )
+
+    def count(*flags):
+        return func.count(distinct(rows.c.id)).filter(and_(*flags))
+
+    query = (
+        select(
+            rows.c.building,
+            rows.c.floor,
+            rows.c.bucket,
+            rows.c.utility,
+            func.grouping(rows.c.building).label("by_location"),
+            func.grouping(rows.c.bucket).label("by_capacity"),
+            count(rows.c.in_capacity, rows.c.in_utilities).label("location_count"),
+            count(rows.c.in_location, rows.c.in_utilities).label("capacity_count"),
+            count(rows.c.in_location, rows.c.in_capacity, rows.c.in_utilities).label("utility_count"),
+        )
+        .group_by(func.grouping_sets(
+            tuple_(rows.c.building, rows.c.floor), tuple_(rows.c.bucket), tuple_(rows.c.utility),
+        ))
+        .order_by(rows.c.building, rows.c.floor, rows.c.bucket, rows.c.utility)
+    )
+
+    buildings: dict[str, list[FacetCount]] = {}
+    capacity = {}
+    utility_counts = []
+    for row in (await db.execute(query)).all():
+        if row.by_location == 0:
+            buildings.setdefault(row.building, []).append(FacetCount(value=row.floor, count=row.location_count))
+        elif row.by_capacity == 0:
+            if row.bucket is not None:
+                capacity[row.bucket] = row.capacity_count
+        elif row.utility is not None:
+            utility_counts.append(FacetCount(value=row.utility, count=row.utility_count))
+
+    return SpaceFacets(
+        buildings=[
+            BuildingFacetCount(value=name, count=sum(f.count for f in floors), floors=floors)
+            for name, floors in buildings.items()
+        ],
+        capacity=[
+            CapacityFacetCount(
+                value=f"{low}-{high}" if high else f"{low}+", min=low, max=high, count=capacity.get(index, 0),
+            )
+            for index, (low, high) in enumerate(CAPACITY_BUCKETS)
+        ],
+        utilities=utility_counts,
+    )
+
+
+@router.get("", response_model=SpaceListResponse)
+async def list_spaces(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    primary_db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+    ids: Annotated[list[int] | None, Depends(get_batch_ids)],
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    q: str | None = Query(default=None, description="Search query"),
+    building: str | None = None,
+    floor: str | None = None,
+    capacity_min: int | None = Query(default=None, alias="capacityMin"),
+    capacity_max: int | None = Query(default=None, alias="capacityMax"),
+    utilities: str | None = Query(default=None, description="Comma-separated utility keys"),
+    status: SpaceStatus | None = None,
+    facets: bool = Query(default=False, description="Also return counts for each filter option"),
+):
+    """
+    List spaces with filtering & search. With ``facets=true`` the response
+    also counts the spaces behind each building, floor, capacity range and
+    utility under the current filters (cached with the catalog, except for
+    ``q`` searches).
+    """
+    filters = (q, building, floor, capacity_min, capacity_max, utilities, status)
+    query = _filter_spaces(select(Space).options(selectinload(Space.utilities)), *filters)
+
+    if ids is not None:
+        result = await db.execute(query.where(id_in(Space.id, ids)))
+        spaces = in_request_order(result.scalars().all(), ids)
+        return SpaceListResponse(
+            data=[SpaceResponse.from_orm_with_utilities(s) for s in spaces],
+            meta=PaginatedResponseMeta(total=len(spaces), limit=len(ids), offset=0)
+        )
 
     # Count total
     count_query = select(func.count()).select_from(query.subquery())
@@ -69,34 +210,134 @@ async def list_spaces(
     total = total_result.scalar() or 0
 
     # Apply pagination
-    query = query.offset(offset).limit(limit)
+    query = query.order_by(Space.id).offset(offset).limit(limit)
     result = await db.execute(query)
     spaces = result.scalars().all()
 
-    return PaginatedResponse(
+    facet_counts = None
+    if facets and q:
+        # Free-text searches are too varied to cache without evicting hot catalog entries
+        facet_counts = await _space_facets(db, *filters)
+    elif facets:
+        # Loaded from the primary: the cache outlives a lagging replica's view
+        facet_counts = await catalog_cache.get_or_load(
+            ("space_facets", *filters), lambda: _space_facets(primary_db, *filters)
+        )
+
+    return SpaceListResponse(
         data=[SpaceResponse.from_orm_with_utilities(s) for s in spaces],
-        meta=PaginatedResponseMeta(total=total, limit=limit, offset=offset)
+        meta=PaginatedResponseMeta(total=total, limit=limit, offset=offset),
+        facets=facet_counts,
     )
 
 
 @router.get("/config/filters", response_model=SpaceFilterConfigResponse)
 async def get_filter_config(
-    db: Annotated[AsyncSession, Depends(get_async_db)]
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)]
 ):
     """Get available filter options (buildings and floors) from existing spaces."""
-    # Get distinct buildings
-    buildings_query = select(Space.building).distinct().order_by(Space.building)
-    buildings_result = await db.execute(buildings_query)
-    buildings = [b for b in buildings_result.scalars().all() if b]
-
-    # Get distinct floors
-    floors_query = select(Space.floor).distinct().order_by(Space.floor)
-    floors_result = await db.execute(floors_query)
-    floors = [f for f in floors_result.scalars().all() if f]
-
-    return SpaceFilterConfigResponse(
-        buildings=buildings,
-        floors=floors
+    async def load() -> SpaceFilterConfigResponse:
+        # Get distinct buildings
+        buildings_query = select(Space.building).distinct().order_by(Space.building)
+        buildings_result = await db.execute(buildings_query)
+        buildings = [b for b in buildings_result.scalars().all() if b]
+
+        # Get distinct floors
+        floors_query = select(Space.floor).distinct().order_by(Space.floor)
+        floors_result = await db.execute(floors_query)
+        floors = [f for f in floors_result.scalars().all() if f]
+
+        return SpaceFilterConfigResponse(
+            buildings=buildings,
+            floors=floors
+        )
+
+    return await catalog_cache.get_or_load("filter_config", load)
+
+
+def _distinct_values(column):
+    """Sorted distinct non-empty values of a ``Space`` column, as a JSON array."""
+    values = select(column.label("value")).where(column != "").distinct().subquery()
+    return select(json_list(values.c.value, values.c.value)).scalar_subquery()
+
+
+@router.get("/bootstrap", response_model=SpacesBootstrapResponse)
+async def get_spaces_bootstrap(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    q: str | None = Query(default=None, description="Search query"),
+    building: str | None = None,
+    floor: str | None = None,
+    capacity_min: int | None = Query(default=None, alias="capacityMin"),
+    capacity_max: int | None = Query(default=None, alias="capacityMax"),
+    utilities: str | None = Query(default=None, description="Comma-separated utility keys"),
+    status: SpaceStatus | None = None,
+):
+    """
+    Everything the spaces page needs on first render: the filter options,
+    the utilities and the first page of spaces (same parameters as GET /spaces).
+
+    Served by one SQL statement: each part is a scalar subquery aggregated to
+    JSON, with each space's utility keys gathered by a lateral subquery.
+    """
+    filtered = _filter_spaces(
+        select(Space), q, building, floor, capacity_min, capacity_max, utilities, status,
+    ).subquery("filtered")
+    page = select(filtered).order_by(filtered.c.id).offset(offset).limit(limit).subquery("page")
+    utility_keys = (
+        select(json_list(Utility.key, Utility.key).label("utility_keys"))
+        .select_from(SpaceUtility)
+        .join(Utility)
+        .where(SpaceUtility.space_id == page.c.id)
+        .lateral("space_utility_keys")
+    )
+    space_json = json_object(
+        **{name: page.c[name] for name in SPACE_COLUMNS},
+        status=enum_value(page.c.status),
+        utilities=utility_keys.c.utility_keys,
+    )
+    utility_json = json_object(
+        id=Utility.id, key=Utility.key, label=Utility.label, description=Utility.description,
+    )
+
+    query = select(
+        _distinct_values(Space.building).label("buildings"),
+        _distinct_values(Space.floor).label("floors"),
+        select(json_list(utility_json, Utility.label)).scalar_subquery().label("utilities"),
+        select(func.count()).select_from(filtered).scalar_subquery().label("total"),
+        select(json_list(space_json, page.c.id))
+        .select_from(page.join(utility_keys, true()))
+        .scalar_subquery()
+        .label("spaces"),
+    )
+    row = (await db.execute(query)).one()
+
+    return SpacesBootstrapResponse(
+        filters=SpaceFilterConfigResponse(buildings=row.buildings, floors=row.floors),
+        utilities=[UtilityResponse.model_validate(u) for u in row.utilities],
+        spaces=PaginatedResponse(
+            data=[SpaceResponse.model_validate(s) for s in row.spaces],
+            meta=PaginatedResponseMeta(total=row.total, limit=limit, offset=offset),
+        ),
+    )
+
+
+@router.get("/changes", response_model=ChangesResponse[SpaceResponse])
+async def space_changes(
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+    since: str | None = Query(default=None, description="Cursor from the previous response; omit for a full copy"),
+    limit: int = Query(default=500, ge=1, le=1000),
+):
+    """Spaces created or updated, and ids of spaces deleted, since a cursor."""
+    changes = await fetch_changes(
+        db, select(Space).options(selectinload(Space.utilities)), Space, since, limit
+    )
+    return ChangesResponse(
+        data=[SpaceResponse.from_orm_with_utilities(s) for s in changes.rows],
+        deleted=changes.deleted,
+        cursor=changes.cursor,
+        has_more=changes.has_more,
     )
 
 
@@ -157,6 +398,22 @@ async def create_space(
     return SpaceResponse.from_orm_with_utilities(space)
 
 
+@router.post("/import", response_model=ImportResult)
+async def import_spaces_file(
+    file: UploadFile,
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    format: ImportFormat | None = None,
+):
+    """Bulk upsert spaces from a CSV or JSON file (admin only)."""
+    try:
+        rows = parse_rows(await file.read(), detect_format(file.filename, format))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise BadRequestException(detail=f"Invalid import file: {e}")
+
+    return await import_spaces(db, rows)
+
+
 @router.patch("/{space_id}", response_model=SpaceResponse)
 async def update_space(
     space_id: int,
@@ -178,10 +435,13 @@ async def update_space(
 
     # Update utilities if provided
     if request.utilities is not None:
+        # Links live in their own table; bump the space so /changes sees it
+        space.updated_at = func.now()
         # Remove existing
         await db.execute(
             SpaceUtility.__table__.delete().where(SpaceUtility.space_id == space_id)
         )
+        invalidate(db, InvalidationKind.SPACE, space_id)
 
         # Add new
         utility_result = await db.execute(
@@ -1,30 +1,37 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, UploadFile, status
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_async_db
-from app.core.exceptions import NotFoundException, ConflictException
+from app.core.cache import catalog_cache
+from app.core.database import get_async_db, get_primary_read_db
+from app.core.exceptions import NotFoundException, ConflictException, BadRequestException
 from app.dependencies import get_current_admin_user
-from app.models import Utility, User
+from app.models import Space, SpaceUtility, Utility, User
 from app.schemas import (
     UtilityResponse,
     CreateUtilityRequest,
     UpdateUtilityRequest,
+    ImportFormat,
+    ImportResult,
 )
+from app.services.imports import detect_format, parse_rows, import_utilities
 
 router = APIRouter()
 
 
 @router.get("", response_model=list[UtilityResponse])
 async def list_utilities(
-    db: Annotated[AsyncSession, Depends(get_async_db)]
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)]
 ):
     """List all utilities (WiFi, AC, whiteboard, etc.)."""
-    result = await db.execute(select(Utility).order_by(Utility.label))
-    utilities = result.scalars().all()
-    return [UtilityResponse.model_validate(u) for u in utilities]
+    async def load() -> list[UtilityResponse]:
+        result = await db.execute(select(Utility).order_by(Utility.label))
+        utilities = result.scalars().all()
+        return [UtilityResponse.model_validate(u) for u in utilities]
+
+    return await catalog_cache.get_or_load("utilities", load)
 
 
 @router.post("", response_model=UtilityResponse, status_code=status.HTTP_201_CREATED)
@@ -52,6 +59,22 @@ async def create_utility(
     return UtilityResponse.model_validate(utility)
 
 
+@router.post("/import", response_model=ImportResult)
+async def import_utilities_file(
+    file: UploadFile,
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    format: ImportFormat | None = None,
+):
+    """Bulk upsert utilities from a CSV or JSON file (admin only)."""
+    try:
+        rows = parse_rows(await file.read(), detect_format(file.filename, format))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise BadRequestException(detail=f"Invalid import file: {e}")
+
+    return await import_utilities(db, rows)
+
+
 @router.patch("/{utility_id}", response_model=UtilityResponse)
 async def update_utility(
     utility_id: int,
@@ -89,5 +112,11 @@ async def delete_utility(
     if not utility:
         raise NotFoundException(detail="Utility not found")
 
+    # The spaces' utility lists change when the links cascade away
+    await db.execute(
+        update(Space)
+        .where(Space.id.in_(select(SpaceUtility.space_id).where(SpaceUtility.utility_id == utility_id)))
+        .values(updated_at=func.now())
+    )
     await db.delete(utility)
     await db.flush()
@@ -1,7 +1,12 @@
 from app.schemas.common import (
     ApiError,
     PaginatedResponseMeta,
+    ChangesResponse,
     PaginationParams,
+    ExportFormat,
+    ImportFormat,
+    ImportRowError,
+    ImportResult,
 )
 from app.schemas.auth import (
     RegisterRequest,
@@ -23,9 +28,14 @@ from app.schemas.space import (
     CreateUtilityRequest,
     UpdateUtilityRequest,
     SpaceFilterConfigResponse,
+    SpacesBootstrapResponse,
+    SpaceFacets,
+    SpaceListResponse,
 )
 from app.schemas.booking import (
     BookingResponse,
+    BookingCalendarResponse,
+    BookingAlternative,
     CreateBookingRequest,
     UpdateBookingStatusRequest,
 )
@@ -39,12 +49,29 @@ from app.schemas.rating import (
     AddRatingRequest,
     UpdateRatingRequest,
 )
+from app.schemas.allocation import (
+    AllocationWindowResponse,
+    CreateAllocationWindowRequest,
+    AllocationRequestResponse,
+    AllocationResult,
+)
+from app.schemas.analytics import (
+    UtilizationGroupBy,
+    UtilizationRow,
+    UtilizationResponse,
+    AdminStatsResponse,
+)
 
 __all__ = [
     # Common
     "ApiError",
     "PaginatedResponseMeta",
+    "ChangesResponse",
     "PaginationParams",
+    "ExportFormat",
+    "ImportFormat",
+    "ImportRowError",
+    "ImportResult",
     # Auth
     "RegisterRequest",
     "LoginRequest",
@@ -63,8 +90,12 @@ __all__ = [
     "CreateUtilityRequest",
     "UpdateUtilityRequest",
     "SpaceFilterConfigResponse",
+    "SpacesBootstrapResponse",
+    "SpaceFacets",
+    "SpaceListResponse",
     # Booking
     "BookingResponse",
+    "BookingCalendarResponse",
     "CreateBookingRequest",
     "UpdateBookingStatusRequest",
     # Penalty
@@ -75,4 +106,14 @@ __all__ = [
     "RatingResponse",
     "AddRatingRequest",
     "UpdateRatingRequest",
+    # Allocation
+    "AllocationWindowResponse",
+    "CreateAllocationWindowRequest",
+    "AllocationRequestResponse",
+    "AllocationResult",
+    # Analytics
+    "UtilizationGroupBy",
+    "UtilizationRow",
+    "UtilizationResponse",
+    "AdminStatsResponse",
 ]
@@ -0,0 +1,56 @@
+from datetime import date, datetime, time
+
+from pydantic import BaseModel
+
+from app.models.enums import AllocationPolicy, AllocationWindowStatus, AllocationRequestStatus
+
+
+class AllocationWindowResponse(BaseModel):
+    """Allocation window response schema."""
+    id: int
+    space_id: int
+    booking_date: date
+    start_time: time | None = None
+    end_time: time | None = None
+    closes_at: datetime
+    policy: AllocationPolicy
+    status: AllocationWindowStatus
+    created_by: int | None = None
+    created_at: datetime
+    allocated_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
+
+
+class CreateAllocationWindowRequest(BaseModel):
+    """Request schema for designating an allocation window."""
+    space_id: int
+    booking_date: date
+    start_time: time | None = None  # Both or neither; neither covers the whole day
+    end_time: time | None = None
+    closes_at: datetime
+    policy: AllocationPolicy = AllocationPolicy.LOTTERY
+
+
+class AllocationRequestResponse(BaseModel):
+    """A booking request queued in an allocation window, and its outcome."""
+    id: int
+    window_id: int
+    user_id: int
+    start_time: time
+    end_time: time
+    attendees: int
+    purpose: str
+    status: AllocationRequestStatus
+    booking_id: int | None = None
+    requested_at: datetime
+    decided_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
+
+
+class AllocationResult(BaseModel):
+    """Outcome of allocating one window."""
+    window: AllocationWindowResponse
+    allocated: int
+    rejected: int
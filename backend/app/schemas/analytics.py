@@ -0,0 +1,48 @@
+import enum
+from datetime import date, datetime
+
+from pydantic import BaseModel
+
+
+class UtilizationGroupBy(str, enum.Enum):
+    """Dimensions utilization can be grouped by."""
+    SPACE = "space"
+    BUILDING = "building"
+    HOUR = "hour"
+    DATE = "date"
+
+
+class UtilizationRow(BaseModel):
+    """Aggregated usage for one group."""
+    key: str
+    label: str | None = None
+    booking_count: int
+    pending_count: int
+    approved_count: int
+    rejected_count: int
+    cancelled_count: int
+    completed_count: int
+    no_show_count: int
+    booked_minutes: int
+    occupancy_rate: float | None = None
+    no_show_rate: float | None = None
+
+
+class UtilizationResponse(BaseModel):
+    """Space utilization over a date range."""
+    date_from: date
+    date_to: date
+    group_by: UtilizationGroupBy
+    rows: list[UtilizationRow]
+
+
+class AdminStatsResponse(BaseModel):
+    """Headline counters for the admin dashboard."""
+    total_users: int
+    suspended_users: int
+    total_spaces: int
+    active_spaces: int
+    pending_bookings: int
+    today_bookings: int
+    active_penalties: int
+    generated_at: datetime
@@ -25,6 +25,7 @@ class BookingResponse(BaseModel):
     cancellation_reason: str | None = None
     check_in_at: datetime | None = None
     check_out_at: datetime | None = None
+    updated_at: datetime
     space: SpaceResponse | None = None
     user: UserSummaryResponse | None = None
 
@@ -40,16 +41,7 @@ class BookingResponse(BaseModel):
             space_response = SpaceResponse.from_orm_with_utilities(booking.space)
 
         if include_user and booking.user:
-            user_response = UserSummaryResponse(
-                id=booking.user.id,
-                full_name=booking.user.full_name,
-                email=booking.user.email,
-                student_id=booking.user.student_id,
-                department=booking.user.department,
-                profile_image_url=booking.user.profile_image_url,
-                status=booking.user.status,
-                total_bookings=len(booking.user.bookings) if booking.user.bookings else 0,
-            )
+            user_response = UserSummaryResponse.model_validate(booking.user)
 
         return cls(
             id=booking.id,
@@ -68,11 +60,41 @@ class BookingResponse(BaseModel):
             cancellation_reason=booking.cancellation_reason,
             check_in_at=booking.check_in_at,
             check_out_at=booking.check_out_at,
+            updated_at=booking.updated_at,
             space=space_response,
             user=user_response,
         )
 
 
+class BookingCalendarResponse(BaseModel):
+    """
+    Bookings in a date range as parallel arrays: entry ``i`` of each list
+    describes one booking. Days count from ``start_date``, times are minutes
+    after midnight and statuses index ``status_names``.
+    """
+    start_date: date
+    end_date: date
+    status_names: list[BookingStatus]
+    ids: list[int]
+    space_ids: list[int]
+    days: list[int]
+    start_minutes: list[int]
+    end_minutes: list[int]
+    statuses: list[int]
+
+
+class BookingAlternative(BaseModel):
+    """A free slot offered instead of a conflicting booking request."""
+    space_id: int
+    space_name: str
+    building: str
+    floor: str
+    capacity: int
+    booking_date: date
+    start_time: time
+    end_time: time
+
+
 class CreateBookingRequest(BaseModel):
     """Request schema for creating a booking."""
     space_id: int
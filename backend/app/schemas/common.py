@@ -1,3 +1,4 @@
+import enum
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, Field
@@ -25,7 +26,40 @@ class PaginatedResponse(BaseModel, Generic[T]):
     meta: PaginatedResponseMeta
 
 
+class ChangesResponse(BaseModel, Generic[T]):
+    """Rows written and ids deleted since a cursor."""
+    data: list[T]
+    deleted: list[int]
+    cursor: str
+    has_more: bool
+
+
 class PaginationParams(BaseModel):
     """Pagination query parameters."""
     limit: int = Field(default=20, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
+
+
+class ExportFormat(str, enum.Enum):
+    """Export file formats."""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ImportFormat(str, enum.Enum):
+    """Import file formats."""
+    CSV = "csv"
+    JSON = "json"
+
+
+class ImportRowError(BaseModel):
+    """A row that was skipped during an import."""
+    row: int  # 1-based, header excluded
+    message: str
+
+
+class ImportResult(BaseModel):
+    """Outcome of a bulk import."""
+    created: int = 0
+    updated: int = 0
+    errors: list[ImportRowError] = []
@@ -3,6 +3,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from app.models.enums import SpaceStatus
+from app.schemas.common import PaginatedResponse
 
 
 class UtilityResponse(BaseModel):
@@ -90,3 +91,46 @@ class SpaceFilterConfigResponse(BaseModel):
     """Response schema for space filter configuration."""
     buildings: list[str]
     floors: list[str]
+
+
+class FacetCount(BaseModel):
+    """How many spaces have one value of a facet."""
+    value: str
+    count: int
+
+
+class BuildingFacetCount(FacetCount):
+    """A building's count, with the counts of its floors."""
+    floors: list[FacetCount]
+
+
+class CapacityFacetCount(FacetCount):
+    """A capacity range's count; ``max`` is ``None`` for the open-ended range."""
+    min: int
+    max: int | None
+
+
+class SpaceFacets(BaseModel):
+    """
+    Counts for the filter options of the space list. The building and
+    capacity facets apply every current filter except their own, so their
+    other options stay selectable; the building and floor filters share the
+    ``buildings`` facet. Utilities combine with AND, so each utility count
+    applies every filter, selected utilities included: it is the number of
+    spaces left if that utility is added.
+    """
+    buildings: list[BuildingFacetCount]
+    capacity: list[CapacityFacetCount]
+    utilities: list[FacetCount]
+
+
+class SpaceListResponse(PaginatedResponse[SpaceResponse]):
+    """A page of spaces, with facet counts when asked for."""
+    facets: SpaceFacets | None = None
+
+
+class SpacesBootstrapResponse(BaseModel):
+    """Data for the first render of the spaces page."""
+    filters: SpaceFilterConfigResponse
+    utilities: list[UtilityResponse]
+    spaces: PaginatedResponse[SpaceResponse]
@@ -26,6 +26,11 @@ class UserResponse(BaseModel):
     phone: str | None = None
     profile_image_url: str | None = None
     joined_at: datetime
+    total_bookings: int = 0
+    average_rating: float | None = None
+    rating_count: int = 0
+    active_penalty_points: int = 0
+    no_show_count: int = 0
 
     model_config = {"from_attributes": True}
 
@@ -41,6 +46,9 @@ class UserSummaryResponse(BaseModel):
     status: UserStatus
     total_bookings: int = 0
     average_rating: float | None = None
+    rating_count: int = 0
+    active_penalty_points: int = 0
+    no_show_count: int = 0
 
     model_config = {"from_attributes": True}
 
@@ -74,11 +82,14 @@ class BookingHistoryItem(BaseModel):
 
 
 class AdminUserSummaryResponse(BaseModel):
-    """Aggregated user info for admin details view."""
+    """Aggregated user info for admin details view; each list is one page of its section."""
     user: UserResponse
     booking_history: list[BookingHistoryItem] = []
+    booking_history_total: int = 0
     penalties: list["PenaltyResponse"] = []
+    penalties_total: int = 0
     ratings: list["RatingResponse"] = []
+    ratings_total: int = 0
 
 
 # Avoid circular import
@@ -0,0 +1,35 @@
+"""
+Allocate batch allocation windows that have closed.
+Run with: uv run python -m app.scripts.allocate
+
+Windows are also allocated lazily by the first booking request that touches
+them after they close; run this regularly (e.g. every few minutes from cron)
+so results don't wait for that request.
+"""
+import argparse
+import asyncio
+
+from app.core.database import AsyncSessionLocal
+from app.services.allocations import allocate_due_windows
+
+
+async def main():
+    async with AsyncSessionLocal() as session:
+        try:
+            results = await allocate_due_windows(session)
+            await session.commit()
+            for result in results:
+                print(
+                    f"Window {result.window.id} (space {result.window.space_id}, "
+                    f"{result.window.booking_date}): {result.allocated} allocated, {result.rejected} rejected"
+                )
+            print(f"Allocated {len(results)} windows.")
+        except Exception as e:
+            await session.rollback()
+            print(f"\nError allocating windows: {e}")
+            raise
+
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(description=__doc__.strip().splitlines()[0]).parse_args()
+    asyncio.run(main())
@@ -0,0 +1,34 @@
+"""
+Rebuild the space usage rollups from the bookings table.
+Run with: uv run python -m app.scripts.backfill_usage_rollups [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+"""
+import argparse
+import asyncio
+from datetime import date
+
+from app.core.database import AsyncSessionLocal
+from app.services.usage import rebuild_usage_rollups
+
+
+async def main(date_from: date | None = None, date_to: date | None = None):
+    """Rebuild rollups for the given range (all bookings by default)."""
+    label = f"{date_from or 'beginning'} to {date_to or 'end'}"
+    print(f"Rebuilding usage rollups ({label})...")
+
+    async with AsyncSessionLocal() as session:
+        try:
+            rows = await rebuild_usage_rollups(session, date_from, date_to)
+            await session.commit()
+            print(f"Wrote {rows} rollup rows.")
+        except Exception as e:
+            await session.rollback()
+            print(f"\nError rebuilding rollups: {e}")
+            raise
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat)
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat)
+    args = parser.parse_args()
+    asyncio.run(main(args.date_from, args.date_to))
@@ -0,0 +1,44 @@
+"""
+Bulk import spaces or utilities from a CSV or JSON file.
+Run with: uv run python -m app.scripts.import_catalog {spaces,utilities} FILE [--format csv|json]
+"""
+import argparse
+import asyncio
+from pathlib import Path
+
+from app.core.database import AsyncSessionLocal
+from app.schemas import ImportFormat
+from app.services.imports import detect_format, parse_rows, import_spaces, import_utilities
+
+IMPORTERS = {
+    "spaces": import_spaces,
+    "utilities": import_utilities,
+}
+
+
+async def main(kind: str, path: Path, fmt: ImportFormat | None = None):
+    """Import ``path`` in a single transaction and print a summary."""
+    rows = parse_rows(path.read_bytes(), detect_format(path.name, fmt))
+    print(f"Importing {len(rows)} {kind} from {path}...")
+
+    async with AsyncSessionLocal() as session:
+        try:
+            result = await IMPORTERS[kind](session, rows)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            print(f"\nError importing {kind}: {e}")
+            raise
+
+    print(f"Created {result.created}, updated {result.updated}, skipped {len(result.errors)}.")
+    for error in result.errors:
+        print(f"  row {error.row}: {error.message}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("kind", choices=IMPORTERS)
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", type=ImportFormat, choices=[fmt.value for fmt in ImportFormat])
+    args = parser.parse_args()
+    asyncio.run(main(args.kind, args.path, args.format))
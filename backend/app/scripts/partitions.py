@@ -0,0 +1,69 @@
+"""
+Manage the monthly partitions of the bookings table.
+Run with: uv run python -m app.scripts.partitions {list,ensure,archive} [options]
+
+  list                         show the attached partitions and their row counts
+  ensure [--months-ahead N]    create partitions from this month to N months ahead
+  archive --before YYYY-MM-DD  detach months ending on or before the date into
+                               the archive schema
+
+Run ``ensure`` regularly (e.g. monthly from cron) so new bookings never land in
+the default partition; anything that does is moved out the next time it runs.
+"""
+import argparse
+import asyncio
+from datetime import date
+
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal
+from app.services.partitions import (
+    archive_partitions,
+    ensure_partitions,
+    list_partitions,
+    month_start,
+    next_month,
+)
+
+DEFAULT_MONTHS_AHEAD = 3
+
+
+async def show(session) -> None:
+    for partition in await list_partitions(session):
+        rows = (await session.execute(text(f"SELECT count(*) FROM {partition.name}"))).scalar()
+        span = f"{partition.start} .. {partition.end}" if partition.start else "DEFAULT"
+        print(f"{partition.name:<24} {span:<26} {rows} rows")
+
+
+async def main(command: str, months_ahead: int = DEFAULT_MONTHS_AHEAD, before: date | None = None):
+    async with AsyncSessionLocal() as session:
+        try:
+            if command == "list":
+                await show(session)
+                return
+            if command == "ensure":
+                end = month_start(date.today())
+                for _ in range(months_ahead):
+                    end = next_month(end)
+                names = await ensure_partitions(session, date.today(), end)
+                print(f"Created {len(names)} partitions{': ' + ', '.join(names) if names else ''}.")
+            else:
+                names = await archive_partitions(session, before)
+                print(f"Archived {len(names)} partitions{': ' + ', '.join(names) if names else ''}.")
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            print(f"\nError managing partitions: {e}")
+            raise
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser("list")
+    ensure = subcommands.add_parser("ensure")
+    ensure.add_argument("--months-ahead", type=int, default=DEFAULT_MONTHS_AHEAD)
+    archive = subcommands.add_parser("archive")
+    archive.add_argument("--before", type=date.fromisoformat, required=True)
+    args = parser.parse_args()
+    asyncio.run(main(args.command, getattr(args, "months_ahead", DEFAULT_MONTHS_AHEAD), getattr(args, "before", None)))
@@ -1,13 +1,17 @@
 """
 Seed script to initialize the database with default data.
 Run with: uv run python -m app.scripts.seed
+Large synthetic dataset: uv run python -m app.scripts.seed --synthetic [--users N --spaces N --years N ...]
 """
+import argparse
 import asyncio
+import time
 from sqlalchemy import select
 
 from app.core.database import AsyncSessionLocal
 from app.core.security import get_password_hash
 from app.models import User, Utility, Space, UserRole, UserStatus, SpaceStatus
+from app.scripts.synthetic import SyntheticConfig, generate_synthetic
 
 
 async def seed_utilities(session):
@@ -138,8 +142,8 @@ async def seed_sample_spaces(session):
     await session.flush()
 
 
-async def main():
-    """Run all seed functions."""
+async def main(synthetic: SyntheticConfig | None = None):
+    """Run all seed functions, then generate synthetic data if configured."""
     print("Starting database seed...")
 
     async with AsyncSessionLocal() as session:
@@ -153,6 +157,12 @@ async def main():
             print("\nSeeding sample spaces...")
             await seed_sample_spaces(session)
 
+            if synthetic:
+                print(f"\nGenerating synthetic dataset ({synthetic})...")
+                started = time.perf_counter()
+                await generate_synthetic(session, synthetic)
+                print(f"  generated in {time.perf_counter() - started:.1f}s")
+
             await session.commit()
             print("\nDatabase seeded successfully!")
 
@@ -163,4 +173,32 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    defaults = SyntheticConfig()
+    parser = argparse.ArgumentParser(description="Seed the database.")
+    parser.add_argument("--synthetic", action="store_true", help="also generate a large synthetic dataset")
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--spaces", type=int, default=defaults.spaces)
+    parser.add_argument("--years", type=float, default=defaults.years, help="years of booking history")
+    parser.add_argument("--future-days", type=int, default=defaults.future_days)
+    parser.add_argument("--occupancy", type=float, default=defaults.occupancy,
+                        help="average share of opening hours booked (0-1)")
+    parser.add_argument("--penalty-rate", type=float, default=defaults.penalty_rate,
+                        help="share of no-shows that get a penalty")
+    parser.add_argument("--rating-rate", type=float, default=defaults.rating_rate,
+                        help="share of completed bookings that get rated")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="random seed")
+    args = parser.parse_args()
+
+    config = None
+    if args.synthetic:
+        config = SyntheticConfig(
+            users=args.users,
+            spaces=args.spaces,
+            years=args.years,
+            future_days=args.future_days,
+            occupancy=args.occupancy,
+            penalty_rate=args.penalty_rate,
+            rating_rate=args.rating_rate,
+            seed=args.seed,
+        )
+    asyncio.run(main(config))
@@ -0,0 +1,80 @@
+"""
+Production server: uvicorn with one worker process per available CPU.
+Run with: uv run python -m app.scripts.serve [--workers N] [--host HOST] [--port PORT]
+
+Workers get uvloop and httptools when they are installed, a signing key
+shared by every worker, and a share of DB_CONNECTION_BUDGET for their pools
+(see ``engine_options``).
+"""
+import argparse
+import importlib.util
+import math
+import os
+import secrets
+from pathlib import Path
+
+import uvicorn
+from loguru import logger
+
+from app.core.config import settings
+
+CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+
+def available_cpus(cpu_max: Path = CGROUP_CPU_MAX) -> int:
+    """CPUs this process may use: its affinity mask, capped by a cgroup v2 quota."""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    try:
+        quota, period = cpu_max.read_text().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def default_workers() -> int:
+    """WEB_CONCURRENCY if set, else one worker per available CPU."""
+    return settings.WEB_CONCURRENCY or available_cpus()
+
+
+def event_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_parser() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def shared_secret_key() -> None:
+    """Make every worker sign tokens with the same key."""
+    if "SECRET_KEY" in os.environ:
+        return
+    # Workers re-read settings from the environment they inherit
+    os.environ["SECRET_KEY"] = secrets.token_urlsafe(32)
+    logger.warning("SECRET_KEY is not set; using a random key, so tokens won't survive a restart")
+
+
+def main(workers: int, host: str, port: int) -> None:
+    shared_secret_key()
+    # Read back by each worker to size its share of the connection budget
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    loop, http = event_loop(), http_parser()
+    logger.info("Starting {} workers (loop={}, http={})", workers, loop, http)
+    uvicorn.run(
+        "app.main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the API with multiple worker processes.")
+    parser.add_argument("--workers", type=int, default=None, help="default: WEB_CONCURRENCY or available CPUs")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    main(args.workers or default_workers(), args.host, args.port)
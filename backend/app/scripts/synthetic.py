@@ -0,0 +1,367 @@
+"""
+Synthetic dataset generator used by ``seed.py --synthetic``.
+
+Produces production-sized data for performance work: users, spaces with
+utilities, years of bookings, penalties for no-shows and ratings for
+completed bookings. Rows are generated in Python with a seeded RNG and
+bulk-loaded with ``COPY``; derived tables (usage rollups, user stats) are
+rebuilt from the loaded rows at the end.
+
+Distributions are shaped to look like a university library:
+- bookings cluster around late-morning and mid-afternoon peaks
+- weekdays are busier than weekends, exam months busier than breaks
+- a few popular rooms take a large share of bookings (log-normal popularity)
+- bookings in the same room never overlap
+"""
+import math
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Iterator
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.models import (
+    User,
+    Utility,
+    Space,
+    SpaceUtility,
+    Booking,
+    UserPenalty,
+    UserRating,
+    UserRole,
+    BookingStatus,
+    PenaltyStatus,
+)
+from app.services.usage import rebuild_usage_rollups
+from app.services.user_stats import rebuild_user_stats
+
+# Rows sent per COPY call
+COPY_BATCH_SIZE = 50_000
+
+SLOT_MINUTES = 30
+
+BUILDINGS = ["A1", "A2", "A3", "A4", "B1", "B4", "B6", "B9", "C4", "C5", "C6", "H1", "H2", "H3", "H6"]
+DEPARTMENTS = [
+    "Computer Science", "Computer Engineering", "Electrical Engineering", "Mechanical Engineering",
+    "Civil Engineering", "Chemical Engineering", "Industrial Management", "Applied Science",
+    "Environmental Engineering", "Transportation Engineering",
+]
+FIRST_NAMES = [
+    "An", "Binh", "Chi", "Dung", "Giang", "Ha", "Hieu", "Hoa", "Huy", "Khanh", "Lan", "Linh",
+    "Long", "Mai", "Minh", "Nam", "Ngoc", "Phuc", "Quan", "Son", "Tam", "Thao", "Trang", "Tuan", "Vy",
+]
+LAST_NAMES = ["Nguyen", "Tran", "Le", "Pham", "Hoang", "Huynh", "Phan", "Vu", "Vo", "Dang", "Bui", "Do", "Ho", "Ngo"]
+PURPOSES = [
+    "Group study", "Exam revision", "Project meeting", "Thesis writing", "Lab report",
+    "Assignment", "Club meeting", "Interview practice", "Self study", "Presentation rehearsal",
+]
+RATING_COMMENTS = {
+    5: ["Left the room spotless", "Very considerate", None],
+    4: ["Good", "Tidy", None],
+    3: ["Some mess left behind", None],
+    2: ["Noisy group", "Left rubbish"],
+    1: ["Damaged equipment", "Very disruptive"],
+}
+
+# Capacity choices for generated rooms, and their weights
+CAPACITIES = ([2, 4, 6, 8, 10, 20, 40], [10, 30, 25, 15, 10, 7, 3])
+# Booking length in slots, and weights
+DURATIONS = ([1, 2, 3, 4, 6], [15, 35, 25, 17, 8])
+# Monday..Sunday
+WEEKDAY_FACTOR = [1.0, 1.0, 1.0, 0.95, 0.8, 0.35, 0.25]
+# January..December: exam peaks, summer and new-year breaks
+MONTH_FACTOR = [1.2, 0.5, 0.9, 1.0, 1.3, 1.2, 0.5, 0.4, 0.9, 1.0, 1.1, 1.3]
+# Outcome weights for bookings in the past and the future
+PAST_STATUSES = (
+    [BookingStatus.COMPLETED, BookingStatus.NO_SHOW, BookingStatus.CANCELLED, BookingStatus.REJECTED],
+    [74, 7, 14, 5],
+)
+FUTURE_STATUSES = (
+    [BookingStatus.PENDING, BookingStatus.APPROVED, BookingStatus.CANCELLED],
+    [40, 50, 10],
+)
+RATING_SCORES = ([5, 4, 3, 2, 1], [40, 35, 15, 6, 4])
+
+
+@dataclass
+class SyntheticConfig:
+    """Knobs for the generated dataset."""
+    users: int = 5_000
+    spaces: int = 200
+    years: float = 2.0
+    future_days: int = 14
+    occupancy: float = 0.35  # Average share of opening hours booked
+    penalty_rate: float = 0.6  # Share of no-shows that get a penalty
+    rating_rate: float = 0.3  # Share of completed bookings that get rated
+    seed: int = 42
+
+
+def hour_weight(hour: int) -> float:
+    """Relative demand for a start hour: late-morning and mid-afternoon peaks."""
+    return (
+        0.25
+        + math.exp(-(((hour - 10) / 1.8) ** 2))
+        + 0.9 * math.exp(-(((hour - 15) / 2.2) ** 2))
+    )
+
+
+def _utc(day: date, at: time) -> datetime:
+    return datetime.combine(day, at, tzinfo=timezone.utc)
+
+
+async def _reserve_ids(session: AsyncSession, table: str, count: int) -> list[int]:
+    """
+    Draw ``count`` ids from ``table``'s id sequence. ``nextval`` is atomic, so
+    concurrent writers can't be handed the same ids; theirs may interleave
+    with ours, which is why the ids are returned rather than assumed contiguous.
+    """
+    if not count:
+        return []
+    result = await session.execute(
+        text("SELECT nextval(pg_get_serial_sequence(:table, 'id')) FROM generate_series(1, :count)"),
+        {"table": table, "count": count},
+    )
+    return list(result.scalars())
+
+
+async def _copy(session: AsyncSession, table: str, columns: list[str], rows: Iterable[tuple]) -> int:
+    """Stream ``rows`` into ``table`` with COPY in batches; returns the row count."""
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    total = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= COPY_BATCH_SIZE:
+            await raw.driver_connection.copy_records_to_table(table, records=batch, columns=columns)
+            total += len(batch)
+            batch = []
+    if batch:
+        await raw.driver_connection.copy_records_to_table(table, records=batch, columns=columns)
+        total += len(batch)
+    return total
+
+
+class SyntheticDataset:
+    """Generates and loads one synthetic dataset."""
+
+    def __init__(self, session: AsyncSession, config: SyntheticConfig):
+        self.session = session
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.today = date.today()
+        self.first_day = self.today - timedelta(days=round(config.years * 365))
+        self.last_day = self.today + timedelta(days=config.future_days)
+        # Keeps emails, student ids and room names unique across runs
+        self.run_tag = uuid.uuid4().hex[:6]
+        self.admin_id: int | None = None
+        self.user_ids: list[int] = []
+        self.spaces: list[tuple[int, int, float]] = []  # (id, capacity, popularity)
+
+        self.open_slot = settings.BOOKING_DAY_START_HOUR * 60 // SLOT_MINUTES
+        self.close_slot = settings.BOOKING_DAY_END_HOUR * 60 // SLOT_MINUTES
+        self.mean_duration = sum(d * w for d, w in zip(*DURATIONS)) / sum(DURATIONS[1])
+        open_hours = range(settings.BOOKING_DAY_START_HOUR, settings.BOOKING_DAY_END_HOUR) or range(24)
+        self.mean_hour_weight = sum(map(hour_weight, open_hours)) / len(open_hours)
+
+    async def generate(self) -> dict[str, int]:
+        """Load everything and return row counts per table."""
+        counts = {}
+        self.admin_id = (await self.session.execute(
+            select(User.id).where(User.role == UserRole.ADMIN).order_by(User.id).limit(1)
+        )).scalar_one()
+
+        counts["users"] = await self.load_users()
+        print(f"  users: {counts['users']}")
+        counts["spaces"], counts["space_utilities"] = await self.load_spaces()
+        print(f"  spaces: {counts['spaces']} ({counts['space_utilities']} utility links)")
+        counts["bookings"], counts["penalties"], counts["ratings"] = await self.load_bookings()
+        print(f"  bookings: {counts['bookings']}, penalties: {counts['penalties']}, ratings: {counts['ratings']}")
+
+        print("  rebuilding usage rollups and user stats...")
+        counts["space_usage_rollups"] = await rebuild_usage_rollups(self.session)
+        counts["user_stats"] = await rebuild_user_stats(self.session)
+        await self.session.execute(text("ANALYZE"))
+        return counts
+
+    async def load_users(self) -> int:
+        config, rng = self.config, self.rng
+        self.user_ids = await _reserve_ids(self.session, User.__tablename__, config.users)
+        # One bcrypt hash for everyone; hashing per row would dominate the run
+        password_hash = get_password_hash("password123")
+        span = (self.today - self.first_day).days or 1
+
+        def rows() -> Iterator[tuple]:
+            for n, user_id in enumerate(self.user_ids):
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                joined = self.first_day + timedelta(days=rng.randrange(span))
+                yield (
+                    user_id,
+                    "STUDENT",
+                    "SUSPENDED" if rng.random() < 0.02 else "ACTIVE",
+                    f"{first.lower()}.{last.lower()}.{self.run_tag}.{n}@synthetic.studyspace.com",
+                    password_hash,
+                    f"{last} {first}",
+                    first,
+                    last,
+                    f"S{self.run_tag}{n:07d}",
+                    rng.choice(DEPARTMENTS),
+                    rng.randint(1, 5),
+                    _utc(joined, time(rng.randrange(24), rng.randrange(60))),
+                )
+
+        return await _copy(self.session, User.__tablename__, [
+            "id", "role", "status", "email", "password_hash", "full_name", "first_name",
+            "last_name", "student_id", "department", "year_of_study", "joined_at",
+        ], rows())
+
+    async def load_spaces(self) -> tuple[int, int]:
+        config, rng = self.config, self.rng
+        space_ids = await _reserve_ids(self.session, Space.__tablename__, config.spaces)
+        utility_ids = (await self.session.execute(select(Utility.id))).scalars().all()
+        created = _utc(self.first_day, time(0))
+
+        space_rows, link_rows = [], []
+        for n, space_id in enumerate(space_ids):
+            building = rng.choice(BUILDINGS)
+            floor = rng.randint(1, 6)
+            capacity = rng.choices(*CAPACITIES)[0]
+            # Log-normal popularity, mean ~1: a few rooms are in heavy demand
+            popularity = min(rng.lognormvariate(-0.18, 0.6), 3.0)
+            self.spaces.append((space_id, capacity, popularity))
+            space_rows.append((
+                space_id,
+                f"{building}-{floor}{n:04d}-{self.run_tag}",
+                building,
+                str(floor),
+                f"Building {building}, floor {floor}",
+                capacity,
+                "ACTIVE" if rng.random() < 0.95 else rng.choice(["INACTIVE", "MAINTENANCE"]),
+                created,
+                created,
+            ))
+            for utility_id in rng.sample(utility_ids, rng.randint(0, len(utility_ids))):
+                link_rows.append((space_id, utility_id))
+
+        spaces = await _copy(self.session, Space.__tablename__, [
+            "id", "name", "building", "floor", "location", "capacity", "status", "created_at", "updated_at",
+        ], space_rows)
+        links = await _copy(self.session, SpaceUtility.__tablename__, ["space_id", "utility_id"], link_rows)
+        return spaces, links
+
+    def _space_day(self, capacity: int, popularity: float, day: date) -> Iterator[tuple]:
+        """Non-overlapping (start, end, attendees) bookings for one room on one day."""
+        rng = self.rng
+        target = self.config.occupancy * popularity * WEEKDAY_FACTOR[day.weekday()] * MONTH_FACTOR[day.month - 1]
+        target = min(target, 0.9)
+        if target <= 0:
+            return
+        # Chance of a booking starting at a free slot, for the target occupancy
+        start_rate = target / (self.mean_duration * (1 - target))
+
+        slot = self.open_slot
+        while slot < self.close_slot:
+            hour = slot * SLOT_MINUTES // 60
+            if rng.random() < start_rate * hour_weight(hour) / self.mean_hour_weight:
+                length = min(rng.choices(*DURATIONS)[0], self.close_slot - slot)
+                start = slot * SLOT_MINUTES
+                end = min((slot + length) * SLOT_MINUTES, 24 * 60 - 1)
+                attendees = max(1, min(capacity, round(rng.triangular(1, capacity, 1 + capacity / 3))))
+                yield time(start // 60, start % 60), time(end // 60, end % 60), attendees
+                slot += length
+            else:
+                slot += 1
+
+    async def load_bookings(self) -> tuple[int, int, int]:
+        config, rng = self.config, self.rng
+        penalties, ratings = [], []
+        days = (self.last_day - self.first_day).days + 1
+        # Future bookings can be "requested" later today; no write is stamped after the load
+        loaded_at = datetime.now(timezone.utc)
+        # A small group of heavy users makes a large share of bookings
+        user_ids = self.user_ids
+        heavy_users = user_ids[:max(1, len(user_ids) // 20)]
+
+        def day_rows(day: date, penalties: list[tuple], ratings: list[tuple]) -> Iterator[tuple]:
+            """A day's bookings, with their position in the day standing in for the id."""
+            past = day < self.today
+            statuses = PAST_STATUSES if past else FUTURE_STATUSES
+            booking_no = 0
+            for space_id, capacity, popularity in self.spaces:
+                for start, end, attendees in self._space_day(capacity, popularity, day):
+                    user_id = rng.choice(heavy_users if rng.random() < 0.3 else user_ids)
+                    status = rng.choices(*statuses)[0]
+                    begins = _utc(day, start)
+                    requested = begins - timedelta(hours=rng.randint(1, 14 * 24))
+                    approved = status in (BookingStatus.APPROVED, BookingStatus.COMPLETED, BookingStatus.NO_SHOW)
+                    cancelled = status == BookingStatus.CANCELLED
+                    completed = status == BookingStatus.COMPLETED
+                    approved_at = requested + timedelta(hours=rng.randint(1, 12)) if approved else None
+                    cancelled_at = requested + timedelta(hours=rng.randint(1, 48)) if cancelled else None
+                    check_in_at = begins + timedelta(minutes=rng.randint(0, 10)) if completed else None
+                    check_out_at = _utc(day, end) if completed else None
+                    yield (
+                        booking_no, user_id, space_id, day, start, end, status.name, attendees,
+                        rng.choice(PURPOSES), requested,
+                        self.admin_id if approved else None,
+                        approved_at,
+                        cancelled_at,
+                        "Plans changed" if cancelled else None,
+                        check_in_at,
+                        check_out_at,
+                        min(loaded_at, max(
+                            t for t in (requested, approved_at, cancelled_at, check_in_at, check_out_at) if t
+                        )),
+                    )
+
+                    if status == BookingStatus.NO_SHOW and rng.random() < config.penalty_rate:
+                        recent = (self.today - day).days < 90
+                        penalties.append((
+                            user_id, booking_no, self.admin_id, "No-show", rng.choice([5, 5, 10]),
+                            PenaltyStatus.ACTIVE.name if recent else rng.choice(["RESOLVED", "EXPIRED"]),
+                            _utc(day, end) + timedelta(hours=2),
+                        ))
+                    elif completed and rng.random() < config.rating_rate:
+                        score = rng.choices(*RATING_SCORES)[0]
+                        ratings.append((
+                            user_id, booking_no, self.admin_id, score,
+                            rng.choice(RATING_COMMENTS[score]), _utc(day, end) + timedelta(hours=1),
+                        ))
+                    booking_no += 1
+
+        bookings = []
+        booking_count = 0
+        for offset in range(days):
+            day = self.first_day + timedelta(days=offset)
+            day_penalties, day_ratings = [], []
+            rows = list(day_rows(day, day_penalties, day_ratings))
+            # Ids are drawn once the day's bookings are known, so none go unused
+            ids = await _reserve_ids(self.session, Booking.__tablename__, len(rows))
+            bookings.extend((ids[n], *row) for n, *row in rows)
+            penalties.extend((user_id, ids[n], *rest) for user_id, n, *rest in day_penalties)
+            ratings.extend((user_id, ids[n], *rest) for user_id, n, *rest in day_ratings)
+            if len(bookings) >= COPY_BATCH_SIZE or offset == days - 1:
+                booking_count += await _copy(self.session, Booking.__tablename__, [
+                    "id", "user_id", "space_id", "booking_date", "start_time", "end_time", "status",
+                    "attendees", "purpose", "requested_at", "approved_by", "approved_at", "cancelled_at",
+                    "cancellation_reason", "check_in_at", "check_out_at", "updated_at",
+                ], bookings)
+                bookings = []
+
+        penalty_count = await _copy(self.session, UserPenalty.__tablename__, [
+            "user_id", "booking_id", "created_by", "reason", "points", "status", "created_at",
+        ], penalties)
+        rating_count = await _copy(self.session, UserRating.__tablename__, [
+            "rated_user_id", "booking_id", "created_by", "rating", "comment", "created_at",
+        ], ratings)
+        return booking_count, penalty_count, rating_count
+
+
+async def generate_synthetic(session: AsyncSession, config: SyntheticConfig) -> dict[str, int]:
+    """Generate a synthetic dataset in ``session``'s transaction."""
+    return await SyntheticDataset(session, config).generate()
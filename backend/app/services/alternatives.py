@@ -0,0 +1,133 @@
+"""
+Alternatives offered when a booking request conflicts with another booking.
+
+Two kinds of candidate are ranked together in one statement:
+
+- the requested space at other start times the same day, on a
+  ``BOOKING_ALTERNATIVE_STEP_MINUTES`` grid within opening hours;
+- similar spaces at the requested time: active, in the same building, big
+  enough for the attendees and offering at least the requested space's
+  utilities.
+
+Candidates overlapping a booking that blocks its slot are dropped. The rest
+are ordered by how far they move the start time, then the requested space
+before others, then the smallest space that fits.
+"""
+from datetime import date, datetime, time
+
+from sqlalchemy import BigInteger, Integer, Time, column, exists, func, literal, select, union_all, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models import Booking, BookingStatus, Space, SpaceStatus, SpaceUtility
+from app.schemas import BookingAlternative
+
+# Statuses whose bookings a new booking may not overlap
+BLOCKING_STATUSES = (BookingStatus.PENDING, BookingStatus.APPROVED)
+
+
+def _minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def _time(minutes: int) -> time:
+    return time(minutes // 60, minutes % 60)
+
+
+def candidate_starts(booking_date: date, start_time: time, end_time: time) -> list[int]:
+    """
+    Start minutes, other than the requested one, at which a booking of the
+    same length fits in opening hours (and hasn't begun, for today).
+    """
+    step = settings.BOOKING_ALTERNATIVE_STEP_MINUTES
+    duration = _minutes(end_time) - _minutes(start_time)
+    first = settings.BOOKING_DAY_START_HOUR * 60
+    last = settings.BOOKING_DAY_END_HOUR * 60 - duration
+    if booking_date == date.today():
+        # Only grid starts after the current minute
+        first = max(first, (_minutes(datetime.now().time()) // step + 1) * step)
+    return [start for start in range(first, last + 1, step) if start != _minutes(start_time)]
+
+
+async def suggest_alternatives(
+    db: AsyncSession,
+    space: Space,
+    booking_date: date,
+    start_time: time,
+    end_time: time,
+    attendees: int,
+) -> list[BookingAlternative]:
+    """The best ``BOOKING_ALTERNATIVES_LIMIT`` free alternatives to a conflicting request."""
+    requested = _minutes(start_time)
+    duration = _minutes(end_time) - requested
+
+    branches = []
+    starts = candidate_starts(booking_date, start_time, end_time)
+    if starts:
+        shifted = values(
+            column("space_id", BigInteger),
+            column("start_time", Time),
+            column("end_time", Time),
+            column("shift", Integer),
+            name="shifted",
+        ).data([
+            (space.id, _time(start), _time(start + duration), abs(start - requested))
+            for start in starts
+        ])
+        branches.append(select(shifted))
+
+    similar = select(
+        Space.id.label("space_id"),
+        literal(start_time, Time).label("start_time"),
+        literal(end_time, Time).label("end_time"),
+        literal(0, Integer).label("shift"),
+    ).where(
+        Space.id != space.id,
+        Space.building == space.building,
+        Space.status == SpaceStatus.ACTIVE,
+        Space.capacity >= attendees,
+    )
+    required = [utility.id for utility in space.utilities]
+    if required:
+        similar = similar.where(Space.id.in_(
+            select(SpaceUtility.space_id)
+            .where(SpaceUtility.utility_id.in_(required))
+            .group_by(SpaceUtility.space_id)
+            .having(func.count() == len(required))
+        ))
+    branches.append(similar)
+
+    candidates = union_all(*branches).subquery("candidates")
+    taken = exists().where(
+        Booking.space_id == candidates.c.space_id,
+        Booking.booking_date == booking_date,
+        Booking.status.in_(BLOCKING_STATUSES),
+        Booking.start_time < candidates.c.end_time,
+        Booking.end_time > candidates.c.start_time,
+    )
+    query = (
+        select(
+            candidates.c.space_id,
+            Space.name.label("space_name"),
+            Space.building,
+            Space.floor,
+            Space.capacity,
+            candidates.c.start_time,
+            candidates.c.end_time,
+        )
+        .join(Space, Space.id == candidates.c.space_id)
+        .where(~taken)
+        .order_by(
+            candidates.c.shift,
+            candidates.c.space_id != space.id,
+            Space.capacity,
+            candidates.c.space_id,
+            candidates.c.start_time,
+        )
+        .limit(settings.BOOKING_ALTERNATIVES_LIMIT)
+    )
+    rows = (await db.execute(query)).all()
+    return [
+        BookingAlternative(booking_date=booking_date, **row._mapping)
+        for row in rows
+    ]
@@ -0,0 +1,106 @@
+"""
+Changes-since feeds for clients that keep a local copy of a table.
+
+A client syncs once without a cursor to get every row. After that it passes
+the returned cursor back and gets only the rows written since, plus the ids
+of rows deleted since (from ``tombstones``). Cursors are opaque to clients.
+
+Rows are ordered by ``(updated_at, id)``, where ``updated_at`` is the start
+time of the transaction that wrote them. A transaction that is still open
+can commit rows stamped earlier than rows that are already visible. A feed
+therefore only returns rows older than the start of the oldest open
+transaction (the *horizon*), so nothing can appear behind a cursor it has
+handed out. The horizon is read from ``pg_stat_activity`` on the primary,
+which is why feeds must not be served by a replica.
+"""
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import BadRequestException
+from app.models import Tombstone
+
+# Read in a statement of its own, before the rows: in READ COMMITTED the row
+# query then sees every transaction that had finished by this point
+_HORIZON = text("""
+    SELECT least(statement_timestamp(), min(xact_start))
+    FROM pg_stat_activity
+    WHERE datname = current_database()
+      AND backend_type = 'client backend'
+      AND pid <> pg_backend_pid()
+""")
+
+
+@dataclass
+class Changes:
+    rows: list[Any]
+    deleted: list[int]
+    cursor: str
+    has_more: bool
+
+
+def encode_cursor(at: datetime, row_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{at.isoformat()}|{row_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """The ``(updated_at, id)`` position a cursor stands for."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        at, row_id = raw.split("|")
+        position = datetime.fromisoformat(at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestException(detail="Invalid cursor")
+    if position[0].tzinfo is None:
+        raise BadRequestException(detail="Invalid cursor")
+    return position
+
+
+async def fetch_changes(db: AsyncSession, query: Select, model: type, since: str | None, limit: int) -> Changes:
+    """
+    The next page of ``query`` (a ``select(model)`` with any scoping
+    filters) after the ``since`` cursor, and the ids deleted in that span.
+    """
+    start = decode_cursor(since) if since else None
+    horizon = (await db.execute(_HORIZON)).scalar_one()
+
+    def at(columns, position):
+        return tuple_(*position, types=[column.type for column in columns])
+
+    columns = (model.updated_at, model.id)
+    query = query.where(model.updated_at < horizon)
+    if start:
+        query = query.where(tuple_(*columns) > at(columns, start))
+    result = await db.execute(query.order_by(model.updated_at, model.id).limit(limit + 1))
+    rows = list(result.scalars().all())
+
+    has_more = len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+        end = (rows[-1].updated_at, rows[-1].id)
+    else:
+        # Everything before the horizon has been seen; rows stamped exactly
+        # at the horizon sort after (horizon, 0) and come next time
+        end = (horizon, 0)
+
+    deleted = []
+    if start:
+        # A fresh copy has nothing to delete
+        columns = (Tombstone.deleted_at, Tombstone.row_id)
+        result = await db.execute(
+            select(Tombstone.row_id)
+            .where(
+                Tombstone.table_name == model.__tablename__,
+                tuple_(*columns) > at(columns, start),
+                tuple_(*columns) <= at(columns, end),
+            )
+            .order_by(Tombstone.deleted_at, Tombstone.row_id)
+        )
+        deleted = list(result.scalars().all())
+
+    return Changes(rows=rows, deleted=deleted, cursor=encode_cursor(*end), has_more=has_more)
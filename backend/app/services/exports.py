@@ -0,0 +1,73 @@
+"""
+Streaming table exports.
+
+Rows are read through a server-side cursor in batches of
+``settings.EXPORT_BATCH_SIZE`` and encoded one batch at a time, so memory
+stays flat regardless of how many rows match and the first chunk is sent as
+soon as the first batch arrives.
+"""
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime, time
+from typing import Any, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.schemas import ExportFormat
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def _plain(value: Any) -> Any:
+    """Convert a column value to a JSON/CSV friendly value."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    return value
+
+
+async def iter_export(
+    db: AsyncSession,
+    query: Select,
+    fmt: ExportFormat,
+    batch_size: int | None = None,
+) -> AsyncIterator[str]:
+    """Yield ``query`` encoded as ``fmt``, one chunk per fetched batch."""
+    batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    result = await db.stream(query, execution_options={"yield_per": batch_size})
+    columns = list(result.keys())
+
+    if fmt == ExportFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        yield buffer.getvalue()
+
+    async for partition in result.partitions():
+        buffer = io.StringIO()
+        if fmt == ExportFormat.CSV:
+            writer = csv.writer(buffer)
+            writer.writerows([_plain(value) for value in row] for row in partition)
+        else:
+            for row in partition:
+                buffer.write(json.dumps({c: _plain(v) for c, v in zip(columns, row)}))
+                buffer.write("\n")
+        yield buffer.getvalue()
+
+
+def export_response(db: AsyncSession, query: Select, fmt: ExportFormat, name: str) -> StreamingResponse:
+    """Stream ``query`` as a downloadable ``name.<fmt>`` attachment."""
+    return StreamingResponse(
+        iter_export(db, query, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt.value}"'},
+    )
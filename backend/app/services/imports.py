@@ -0,0 +1,352 @@
+"""
+Bulk import of spaces and utilities.
+
+Rows are validated in Python, loaded into a temporary staging table with
+``COPY`` and merged into the catalog with a handful of set-based statements,
+all in the caller's transaction. Rows that fail validation or reference
+unknown utilities are skipped and reported; the rest are imported.
+
+Spaces are matched on (building, name); utilities on their key. Rows whose
+(building, name) already appears more than once in the catalog are reported,
+not imported.
+"""
+import csv
+import io
+import json
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import (
+    Table,
+    Column,
+    MetaData,
+    Integer,
+    BigInteger,
+    Text,
+    select,
+    update,
+    delete,
+    insert as core_insert,
+    func,
+    cast,
+    true,
+    text,
+    literal_column,
+    and_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.invalidation import InvalidationKind, invalidate
+from app.core.metrics import timed_job
+from app.models import Space, Utility, SpaceUtility
+from app.schemas import (
+    CreateSpaceRequest,
+    CreateUtilityRequest,
+    ImportFormat,
+    ImportRowError,
+    ImportResult,
+)
+
+# Separator for utility keys in the CSV ``utilities`` column
+UTILITY_SEPARATOR = "|"
+
+_staging = MetaData()
+
+space_staging = Table(
+    "space_import",
+    _staging,
+    Column("row_no", Integer, nullable=False),
+    Column("space_id", BigInteger),
+    Column("name", Text, nullable=False),
+    Column("building", Text, nullable=False),
+    Column("floor", Text, nullable=False),
+    Column("location", Text),
+    Column("capacity", Integer, nullable=False),
+    Column("image_url", Text),
+    Column("status", Text, nullable=False),
+    Column("utilities", ARRAY(Text)),  # NULL = leave links unchanged
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+utility_staging = Table(
+    "utility_import",
+    _staging,
+    Column("row_no", Integer, nullable=False),
+    Column("key", Text, nullable=False),
+    Column("label", Text, nullable=False),
+    Column("description", Text),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+def detect_format(filename: str | None, fmt: ImportFormat | None = None) -> ImportFormat:
+    """Use ``fmt`` if given, otherwise guess from the file extension (CSV by default)."""
+    if fmt is not None:
+        return fmt
+    if filename and filename.lower().endswith(".json"):
+        return ImportFormat.JSON
+    return ImportFormat.CSV
+
+
+def parse_rows(content: bytes | str, fmt: ImportFormat) -> list[dict[str, Any]]:
+    """Decode an upload into a list of raw row dicts. Raises ``ValueError`` on malformed input."""
+    if isinstance(content, bytes):
+        content = content.decode("utf-8-sig")
+
+    if fmt == ImportFormat.JSON:
+        rows = json.loads(content)
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("JSON imports must be a list of objects")
+        return rows
+
+    rows = []
+    for row in csv.DictReader(io.StringIO(content)):
+        # Blank and absent (short row) cells are missing values; the extra
+        # cells of a long row stay under the None key for _validate to report
+        extra = row.pop(None, None)
+        row = {key: ((value or "").strip() or None) for key, value in row.items() if key}
+        if extra:
+            row[None] = extra
+        if "utilities" in row:
+            keys = row["utilities"] or ""
+            row["utilities"] = [key.strip() for key in keys.split(UTILITY_SEPARATOR) if key.strip()]
+        rows.append(row)
+    return rows
+
+
+def _validate(
+    rows: list[dict[str, Any]],
+    schema: type[BaseModel],
+    natural_key: tuple[str, ...],
+    errors: list[ImportRowError],
+) -> list[tuple[int, BaseModel, dict]]:
+    """Validate rows against ``schema``, recording errors and in-file duplicates."""
+    valid = []
+    seen: dict[tuple, int] = {}
+    for row_no, raw in enumerate(rows, start=1):
+        if None in raw:
+            errors.append(ImportRowError(
+                row=row_no, message=f"Row has {len(raw[None])} more cells than the header"
+            ))
+            continue
+        raw = {key: value for key, value in raw.items() if value is not None}
+        try:
+            item = schema.model_validate(raw)
+        except ValidationError as e:
+            message = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            )
+            errors.append(ImportRowError(row=row_no, message=message))
+            continue
+
+        key = tuple(getattr(item, field) for field in natural_key)
+        if key in seen:
+            errors.append(ImportRowError(row=row_no, message=f"Duplicate of row {seen[key]}"))
+            continue
+        seen[key] = row_no
+        valid.append((row_no, item, raw))
+    return valid
+
+
+async def _copy(db: AsyncSession, table: Table, records: list[tuple]) -> None:
+    """Create ``table`` in the current transaction and fill it with ``COPY``."""
+    connection = await db.connection()
+    await connection.run_sync(lambda sync_connection: table.create(sync_connection))
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table.name,
+        records=records,
+        columns=[column.name for column in table.columns],
+    )
+
+
+async def _drop(db: AsyncSession, table: Table) -> None:
+    connection = await db.connection()
+    await connection.run_sync(lambda sync_connection: table.drop(sync_connection))
+
+
+def _expire_loaded(db: AsyncSession, model: type) -> None:
+    """Expire already-loaded instances of ``model`` so they reload the merged values."""
+    for obj in list(db.sync_session.identity_map.values()):
+        if isinstance(obj, model):
+            db.expire(obj)
+
+
+@timed_job("import_utilities")
+async def import_utilities(db: AsyncSession, rows: list[dict[str, Any]]) -> ImportResult:
+    """Upsert utilities by key."""
+    result = ImportResult()
+    valid = _validate(rows, CreateUtilityRequest, ("key",), result.errors)
+
+    if valid:
+        await _copy(db, utility_staging, [
+            (row_no, item.key, item.label, item.description)
+            for row_no, item, _ in valid
+        ])
+
+        staged = utility_staging.c
+        stmt = insert(Utility).from_select(
+            ["key", "label", "description"],
+            select(staged.key, staged.label, staged.description).order_by(staged.row_no),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Utility.key],
+            set_={"label": stmt.excluded.label, "description": stmt.excluded.description},
+        )
+        # xmax is 0 for freshly inserted rows
+        inserted = (await db.execute(
+            stmt.returning(literal_column("xmax = 0"))
+        )).scalars().all()
+        result.created = sum(inserted)
+        result.updated = len(inserted) - result.created
+
+        await _drop(db, utility_staging)
+        _expire_loaded(db, Utility)
+        invalidate(db, InvalidationKind.UTILITY)
+
+    result.errors.sort(key=lambda error: error.row)
+    return result
+
+
+@timed_job("import_spaces")
+async def import_spaces(db: AsyncSession, rows: list[dict[str, Any]]) -> ImportResult:
+    """Upsert spaces by (building, name), replacing utility links for rows that list them."""
+    result = ImportResult()
+    valid = _validate(rows, CreateSpaceRequest, ("building", "name"), result.errors)
+
+    if valid:
+        # Serialize concurrent imports matching on (building, name); bookings are unaffected
+        await db.execute(text(f"LOCK TABLE {Space.__tablename__} IN SHARE ROW EXCLUSIVE MODE"))
+
+        await _copy(db, space_staging, [
+            (
+                row_no,
+                None,
+                item.name,
+                item.building,
+                item.floor,
+                item.location,
+                item.capacity,
+                item.image_url,
+                item.status.name,
+                item.utilities if "utilities" in raw else None,
+            )
+            for row_no, item, raw in valid
+        ])
+        staged = space_staging.c
+
+        # Rows referencing unknown utilities are reported and dropped
+        keys = func.unnest(staged.utilities).table_valued("key").render_derived(name="keys")
+        unknown = await db.execute(
+            select(staged.row_no, func.array_agg(keys.c.key))
+            .select_from(space_staging)
+            .join(keys, true())
+            .outerjoin(Utility, Utility.key == keys.c.key)
+            .where(Utility.id.is_(None))
+            .group_by(staged.row_no)
+        )
+        rejected = []
+        for row_no, missing in unknown.all():
+            rejected.append(row_no)
+            result.errors.append(ImportRowError(
+                row=row_no,
+                message=f"Unknown utilities: {', '.join(sorted(missing))}",
+            ))
+
+        # (building, name) isn't unique in the catalog; rows matching several
+        # existing spaces can't say which one to update, so they are dropped too
+        ambiguous = await db.execute(
+            select(staged.row_no, func.count())
+            .select_from(space_staging)
+            .join(Space, and_(Space.building == staged.building, Space.name == staged.name))
+            .where(staged.row_no.not_in(rejected))
+            .group_by(staged.row_no)
+            .having(func.count() > 1)
+        )
+        for row_no, matches in ambiguous.all():
+            rejected.append(row_no)
+            result.errors.append(ImportRowError(
+                row=row_no,
+                message=f"Matches {matches} existing spaces with this building and name",
+            ))
+        if rejected:
+            await db.execute(delete(space_staging).where(staged.row_no.in_(rejected)))
+
+        def match_existing():
+            return (
+                update(space_staging)
+                .values(space_id=Space.id)
+                .where(
+                    staged.space_id.is_(None),
+                    Space.building == staged.building,
+                    Space.name == staged.name,
+                )
+            )
+
+        await db.execute(match_existing())
+
+        updated = await db.execute(
+            update(Space)
+            .values(
+                floor=staged.floor,
+                location=staged.location,
+                capacity=staged.capacity,
+                image_url=staged.image_url,
+                status=cast(staged.status, Space.status.type),
+                updated_at=func.now(),
+            )
+            .where(Space.id == staged.space_id)
+        )
+        result.updated = updated.rowcount
+
+        created = await db.execute(
+            core_insert(Space).from_select(
+                ["name", "building", "floor", "location", "capacity",
+                 "image_url", "status", "created_at", "updated_at"],
+                select(
+                    staged.name,
+                    staged.building,
+                    staged.floor,
+                    staged.location,
+                    staged.capacity,
+                    staged.image_url,
+                    cast(staged.status, Space.status.type),
+                    func.now(),
+                    func.now(),
+                )
+                .where(staged.space_id.is_(None))
+                .order_by(staged.row_no),
+            )
+        )
+        result.created = created.rowcount
+        await db.execute(match_existing())
+
+        # Replace utility links for rows that list utilities
+        await db.execute(
+            delete(SpaceUtility).where(
+                SpaceUtility.space_id == staged.space_id,
+                staged.utilities.is_not(None),
+            )
+        )
+        await db.execute(
+            insert(SpaceUtility)
+            .from_select(
+                ["space_id", "utility_id"],
+                select(staged.space_id, Utility.id)
+                .select_from(space_staging)
+                .join(keys, true())
+                .join(Utility, Utility.key == keys.c.key),
+            )
+            .on_conflict_do_nothing()
+        )
+
+        await _drop(db, space_staging)
+        _expire_loaded(db, Space)
+        invalidate(db, InvalidationKind.SPACE)
+
+    result.errors.sort(key=lambda error: error.row)
+    return result
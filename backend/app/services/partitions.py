@@ -0,0 +1,114 @@
+"""
+Monthly partitions of the bookings table.
+
+``bookings`` is range-partitioned by ``booking_date``: one partition per
+month (``bookings_2026_10``) plus ``bookings_default`` for dates that have no
+partition yet. Queries that filter on ``booking_date`` only touch the months
+they ask for, and every partition's indexes stay the size of one month.
+
+``ensure_partitions`` creates the partitions for a range of months. Rows that
+already landed in the default partition are moved into the new partition in
+the same transaction. ``archive_partitions`` detaches whole months before a
+cutoff and moves them to the ``archive`` schema. They stay queryable there
+(``archive.bookings_2024_09``), but the app no longer sees them.
+"""
+import re
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Booking
+
+TABLE = Booking.__tablename__
+DEFAULT_PARTITION = f"{TABLE}_default"
+ARCHIVE_SCHEMA = "archive"
+
+_BOUND = re.compile(r"FOR VALUES FROM \('(?P<start>[\d-]+)'\) TO \('(?P<end>[\d-]+)'\)")
+
+
+@dataclass
+class Partition:
+    name: str
+    # None for the default partition
+    start: date | None
+    end: date | None
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{TABLE}_{month:%Y_%m}"
+
+
+async def list_partitions(db: AsyncSession) -> list[Partition]:
+    """The attached partitions, ranged ones in date order and the default last."""
+    result = await db.execute(text(f"""
+        SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+        FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE pg_inherits.inhparent = '{TABLE}'::regclass
+    """))
+    partitions = []
+    for name, bound in result.all():
+        match = _BOUND.search(bound)
+        if match:
+            partitions.append(Partition(
+                name, date.fromisoformat(match["start"]), date.fromisoformat(match["end"])
+            ))
+        else:
+            partitions.append(Partition(name, None, None))
+    return sorted(partitions, key=lambda p: (p.start is None, p.start or date.min))
+
+
+async def ensure_partitions(db: AsyncSession, start: date, end: date) -> list[str]:
+    """Create the monthly partitions covering ``start``..``end``. Returns the new names."""
+    partitions = await list_partitions(db)
+    existing = {p.start for p in partitions}
+    has_default = any(p.start is None for p in partitions)
+
+    created = []
+    month = month_start(start)
+    while month <= end:
+        if month not in existing:
+            name, upper = partition_name(month), next_month(month)
+            # Built detached so rows already in the default partition can be
+            # moved into it before it takes over the range
+            await db.execute(text(
+                f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            ))
+            if has_default:
+                await db.execute(text(f"""
+                    WITH moved AS (
+                        DELETE FROM {DEFAULT_PARTITION}
+                        WHERE booking_date >= '{month}' AND booking_date < '{upper}'
+                        RETURNING *
+                    )
+                    INSERT INTO {name} SELECT * FROM moved
+                """))
+            await db.execute(text(
+                f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{month}') TO ('{upper}')"
+            ))
+            created.append(name)
+        month = next_month(month)
+    return created
+
+
+async def archive_partitions(db: AsyncSession, before: date) -> list[str]:
+    """Detach the monthly partitions that end on or before ``before`` into the archive schema."""
+    await db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+    archived = []
+    for partition in await list_partitions(db):
+        if partition.end is None or partition.end > before:
+            continue
+        await db.execute(text(f"ALTER TABLE {TABLE} DETACH PARTITION {partition.name}"))
+        await db.execute(text(f"ALTER TABLE {partition.name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+        archived.append(f"{ARCHIVE_SCHEMA}.{partition.name}")
+    return archived
@@ -0,0 +1,226 @@
+"""
+Incremental maintenance of the space usage rollups.
+
+Booking routes take a ``UsageSnapshot`` before changing a booking and call
+``record_booking_usage`` afterwards; the difference between the two states is
+merged into ``space_usage_rollups`` in the same transaction.
+"""
+from collections import defaultdict
+from datetime import date, time
+from typing import NamedTuple
+
+from sqlalchemy import (
+    select,
+    delete,
+    func,
+    true,
+    cast,
+    Integer,
+    and_,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import timed_job
+from app.models import Booking, BookingStatus, SpaceUsageRollup
+
+# Rollup counter column for each booking status
+STATUS_COLUMNS: dict[BookingStatus, str] = {
+    BookingStatus.PENDING: "pending_count",
+    BookingStatus.APPROVED: "approved_count",
+    BookingStatus.REJECTED: "rejected_count",
+    BookingStatus.CANCELLED: "cancelled_count",
+    BookingStatus.COMPLETED: "completed_count",
+    BookingStatus.NO_SHOW: "no_show_count",
+}
+
+# Statuses that hold the space for the booked time
+OCCUPYING_STATUSES = (
+    BookingStatus.PENDING,
+    BookingStatus.APPROVED,
+    BookingStatus.COMPLETED,
+    BookingStatus.NO_SHOW,
+)
+
+
+class UsageSnapshot(NamedTuple):
+    """The booking fields that rollups depend on."""
+    space_id: int
+    booking_date: date
+    start_time: time
+    end_time: time
+    status: BookingStatus
+
+
+def usage_snapshot(booking: Booking) -> UsageSnapshot:
+    """Capture a booking's state before it is changed."""
+    return UsageSnapshot(
+        space_id=booking.space_id,
+        booking_date=booking.booking_date,
+        start_time=booking.start_time,
+        end_time=booking.end_time,
+        status=booking.status,
+    )
+
+
+def _seconds(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _contributions(snapshot: UsageSnapshot, sign: int, deltas: dict) -> None:
+    """Add (or subtract, with ``sign=-1``) a booking's counters to ``deltas``."""
+    start_hour = snapshot.start_time.hour
+    deltas[(snapshot.space_id, snapshot.booking_date, start_hour)][STATUS_COLUMNS[snapshot.status]] += sign
+
+    if snapshot.status not in OCCUPYING_STATUSES:
+        return
+
+    start = _seconds(snapshot.start_time)
+    end = _seconds(snapshot.end_time)
+    for hour in range(start_hour, (end - 1) // 3600 + 1):
+        overlap = min(end, (hour + 1) * 3600) - max(start, hour * 3600)
+        deltas[(snapshot.space_id, snapshot.booking_date, hour)]["booked_minutes"] += sign * (overlap // 60)
+
+
+async def record_booking_usage(
+    db: AsyncSession,
+    before: UsageSnapshot | None,
+    after: Booking | UsageSnapshot | None,
+) -> None:
+    """Merge the change from ``before`` to ``after`` into the rollups (``None`` = no booking)."""
+    if isinstance(after, Booking):
+        after = usage_snapshot(after)
+    if before == after:
+        return
+
+    deltas: dict = defaultdict(lambda: defaultdict(int))
+    if before is not None:
+        _contributions(before, -1, deltas)
+    if after is not None:
+        _contributions(after, 1, deltas)
+    await _merge(db, deltas)
+
+
+async def record_new_bookings_usage(db: AsyncSession, bookings: list[Booking]) -> None:
+    """Merge many new bookings into the rollups in one statement."""
+    deltas: dict = defaultdict(lambda: defaultdict(int))
+    for booking in bookings:
+        _contributions(usage_snapshot(booking), 1, deltas)
+    await _merge(db, deltas)
+
+
+async def _merge(db: AsyncSession, deltas: dict) -> None:
+    """Add ``deltas`` (counters by space, day and hour) to the rollups."""
+    columns = [*STATUS_COLUMNS.values(), "booked_minutes"]
+    rows = [
+        {
+            "space_id": space_id,
+            "usage_date": usage_date,
+            "hour": hour,
+            **{column: counters.get(column, 0) for column in columns},
+        }
+        for (space_id, usage_date, hour), counters in deltas.items()
+        if any(counters.values())
+    ]
+    if not rows:
+        return
+
+    stmt = insert(SpaceUsageRollup).values(rows)
+    table = SpaceUsageRollup.__table__
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.space_id, table.c.usage_date, table.c.hour],
+        set_={column: table.c[column] + stmt.excluded[column] for column in columns},
+    )
+    await db.execute(stmt)
+
+
+@timed_job("rebuild_usage_rollups")
+async def rebuild_usage_rollups(
+    db: AsyncSession,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> int:
+    """
+    Recompute rollups from ``bookings`` for a date range (everything by default).
+
+    Locks the rollup table for the rest of the transaction so concurrent
+    incremental updates are applied after the rebuild instead of being lost.
+    Returns the number of rollup rows written.
+    """
+    # Readers are unaffected; writers queue until the rebuild commits
+    await db.execute(text(f"LOCK TABLE {SpaceUsageRollup.__tablename__} IN EXCLUSIVE MODE"))
+
+    range_filter = []
+    rollup_filter = []
+    if date_from is not None:
+        range_filter.append(Booking.booking_date >= date_from)
+        rollup_filter.append(SpaceUsageRollup.usage_date >= date_from)
+    if date_to is not None:
+        range_filter.append(Booking.booking_date <= date_to)
+        rollup_filter.append(SpaceUsageRollup.usage_date <= date_to)
+
+    await db.execute(delete(SpaceUsageRollup).where(*rollup_filter))
+
+    start_seconds = cast(func.extract("epoch", Booking.start_time), Integer)
+    end_seconds = cast(func.extract("epoch", Booking.end_time), Integer)
+    start_hour = cast(func.extract("hour", Booking.start_time), Integer)
+
+    # Status counts, attributed to the starting hour
+    counts = (
+        select(
+            Booking.space_id.label("space_id"),
+            Booking.booking_date.label("usage_date"),
+            start_hour.label("hour"),
+            *[
+                func.count().filter(Booking.status == status).label(column)
+                for status, column in STATUS_COLUMNS.items()
+            ],
+        )
+        .where(*range_filter)
+        .group_by(Booking.space_id, Booking.booking_date, start_hour)
+        .subquery("counts")
+    )
+
+    # Booked minutes, spread over every overlapped hour
+    hours = (
+        func.generate_series(start_hour, (end_seconds - 1) // 3600)
+        .table_valued("value")
+        .render_derived(name="hours")
+    )
+    overlap = (
+        func.least(end_seconds, (hours.c.value + 1) * 3600)
+        - func.greatest(start_seconds, hours.c.value * 3600)
+    )
+    minutes = (
+        select(
+            Booking.space_id.label("space_id"),
+            Booking.booking_date.label("usage_date"),
+            hours.c.value.label("hour"),
+            cast(func.sum(overlap // 60), Integer).label("booked_minutes"),
+        )
+        .select_from(Booking)
+        .join(hours, true())
+        .where(Booking.status.in_(OCCUPYING_STATUSES), *range_filter)
+        .group_by(Booking.space_id, Booking.booking_date, hours.c.value)
+        .subquery("minutes")
+    )
+
+    key_columns = ("space_id", "usage_date", "hour")
+    merged = select(
+        *[func.coalesce(counts.c[column], minutes.c[column]).label(column) for column in key_columns],
+        *[func.coalesce(counts.c[column], 0).label(column) for column in STATUS_COLUMNS.values()],
+        func.coalesce(minutes.c.booked_minutes, 0).label("booked_minutes"),
+    ).select_from(
+        counts.outerjoin(
+            minutes,
+            and_(*[counts.c[column] == minutes.c[column] for column in key_columns]),
+            full=True,
+        )
+    )
+
+    columns = [*key_columns, *STATUS_COLUMNS.values(), "booked_minutes"]
+    result = await db.execute(
+        insert(SpaceUsageRollup).from_select(columns, merged)
+    )
+    return result.rowcount
@@ -0,0 +1,142 @@
+"""
+Maintenance of the materialized per-user stats.
+
+Counters are adjusted with an atomic upsert in the caller's transaction, so
+concurrent requests never lose an update and a user's stats row is created on
+first use.
+"""
+from collections import Counter
+
+from sqlalchemy import select, func, literal, union_all, text, Integer
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
+from app.core.invalidation import InvalidationKind, invalidate
+from app.core.metrics import timed_job
+from app.models import (
+    User,
+    UserStats,
+    Booking,
+    BookingStatus,
+    UserPenalty,
+    PenaltyStatus,
+    UserRating,
+)
+
+COUNTERS = (
+    "booking_count",
+    "rating_count",
+    "rating_sum",
+    "active_penalty_points",
+    "no_show_count",
+)
+
+
+async def adjust_user_stats(db: AsyncSession, user_id: int, **deltas: int) -> None:
+    """Add ``deltas`` (keyword per counter in ``COUNTERS``) to a user's stats."""
+    deltas = {column: delta for column, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    table = UserStats.__table__
+    stmt = insert(UserStats).values(
+        user_id=user_id,
+        **{column: deltas.get(column, 0) for column in COUNTERS},
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id],
+        set_={
+            **{column: table.c[column] + stmt.excluded[column] for column in deltas},
+            "updated_at": func.now(),
+        },
+    )
+    # Refresh the session's copy so already-loaded users see the new counters
+    result = await db.execute(
+        stmt.returning(UserStats),
+        execution_options={"populate_existing": True},
+    )
+    stats = result.scalar_one()
+    user = db.sync_session.identity_map.get(identity_key(User, user_id))
+    if user is not None:
+        set_committed_value(user, "stats", stats)
+    invalidate(db, InvalidationKind.USER, user_id)
+
+
+async def record_new_bookings(db: AsyncSession, user_ids: list[int]) -> None:
+    """Count a new booking for each entry of ``user_ids`` in one upsert."""
+    counts = Counter(user_ids)
+    if not counts:
+        return
+
+    table = UserStats.__table__
+    stmt = insert(UserStats).values([
+        {"user_id": user_id, **{column: 0 for column in COUNTERS}, "booking_count": count}
+        for user_id, count in counts.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id],
+        set_={"booking_count": table.c.booking_count + stmt.excluded.booking_count, "updated_at": func.now()},
+    )
+    result = await db.execute(
+        stmt.returning(UserStats),
+        execution_options={"populate_existing": True},
+    )
+    for stats in result.scalars():
+        user = db.sync_session.identity_map.get(identity_key(User, stats.user_id))
+        if user is not None:
+            set_committed_value(user, "stats", stats)
+        invalidate(db, InvalidationKind.USER, stats.user_id)
+
+
+def active_points(status: PenaltyStatus, points: int) -> int:
+    """Points a penalty contributes to the active total."""
+    return points if status == PenaltyStatus.ACTIVE else 0
+
+
+async def record_booking_status(
+    db: AsyncSession,
+    user_id: int,
+    before: BookingStatus | None,
+    after: BookingStatus | None,
+) -> None:
+    """Update booking counters for a booking going from ``before`` to ``after`` (``None`` = no booking)."""
+    await adjust_user_stats(
+        db,
+        user_id,
+        booking_count=(after is not None) - (before is not None),
+        no_show_count=(after == BookingStatus.NO_SHOW) - (before == BookingStatus.NO_SHOW),
+    )
+
+
+@timed_job("rebuild_user_stats")
+async def rebuild_user_stats(db: AsyncSession) -> int:
+    """Recompute every user's stats from source tables. Returns the number of rows written."""
+    await db.execute(text(f"LOCK TABLE {UserStats.__tablename__} IN EXCLUSIVE MODE"))
+    await db.execute(UserStats.__table__.delete())
+
+    zero = literal(0)
+    contributions = union_all(
+        select(
+            Booking.user_id.label("user_id"),
+            literal(1).label("booking_count"),
+            zero.label("rating_count"),
+            zero.label("rating_sum"),
+            zero.label("active_penalty_points"),
+            (Booking.status == BookingStatus.NO_SHOW).cast(Integer).label("no_show_count"),
+        ),
+        select(UserRating.rated_user_id, zero, literal(1), UserRating.rating, zero, zero),
+        select(UserPenalty.user_id, zero, zero, zero, UserPenalty.points, zero)
+        .where(UserPenalty.status == PenaltyStatus.ACTIVE),
+    ).subquery("contributions")
+
+    totals = select(
+        contributions.c.user_id,
+        *[func.sum(contributions.c[column]) for column in COUNTERS],
+    ).group_by(contributions.c.user_id)
+
+    result = await db.execute(
+        insert(UserStats).from_select(["user_id", *COUNTERS], totals)
+    )
+    return result.rowcount
@@ -0,0 +1,134 @@
+"""
+The admin user summary as a single statement.
+
+PostgreSQL builds the whole ``AdminUserSummaryResponse`` document: the user
+(with its stats row) and one ``json_agg`` page per section, each next to the
+section's total. The route passes the text through untouched, so the cost is
+one round trip however long the user's history is.
+"""
+from sqlalchemy import Float, Select, Text, cast, func, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.json_sql import enum_value, json_list, json_object
+from app.models import Booking, BookingStatus, Space, User, UserPenalty, UserRating, UserStats
+
+# Booking statuses shown in the history section
+HISTORY_STATUSES = (BookingStatus.COMPLETED, BookingStatus.CANCELLED, BookingStatus.NO_SHOW)
+
+
+def _section(
+    rows: Select, order_by: list, item, limit: int | None, offset: int
+) -> tuple[ColumnElement, ColumnElement]:
+    """One page (all rows if ``limit`` is None) of ``rows`` as a JSON array built by ``item``, and the row count."""
+    page = rows.add_columns(
+        func.row_number().over(order_by=order_by).label("position")
+    ).order_by(*order_by).offset(offset).limit(limit).subquery()
+    items = select(json_list(item(page.c), page.c.position)).scalar_subquery()
+    total = select(func.count()).select_from(rows.subquery()).scalar_subquery()
+    return items, total
+
+
+def _time_range(start, end) -> ColumnElement:
+    return func.concat(func.to_char(start, "HH24:MI"), " - ", func.to_char(end, "HH24:MI"))
+
+
+def user_summary_query(
+    user_id: int,
+    limit: int,
+    booking_offset: int = 0,
+    penalty_limit: int | None = None,
+    penalty_offset: int = 0,
+    rating_limit: int | None = None,
+    rating_offset: int = 0,
+) -> Select:
+    """A one-row, one-column query: the summary as JSON text, or no row for an unknown user."""
+    history, history_total = _section(
+        select(
+            Booking.id,
+            Booking.booking_date,
+            Booking.start_time,
+            Booking.end_time,
+            Booking.status,
+            Space.name.label("space_name"),
+        )
+        .outerjoin(Space, Space.id == Booking.space_id)
+        .where(Booking.user_id == user_id, Booking.status.in_(HISTORY_STATUSES)),
+        [Booking.booking_date.desc(), Booking.id.desc()],
+        lambda c: json_object(
+            id=c.id,
+            space_name=func.coalesce(c.space_name, "Unknown"),
+            date=func.to_char(c.booking_date, "YYYY-MM-DD"),
+            time=_time_range(c.start_time, c.end_time),
+            status=enum_value(c.status),
+        ),
+        limit,
+        booking_offset,
+    )
+    penalties, penalties_total = _section(
+        select(UserPenalty).where(UserPenalty.user_id == user_id),
+        [UserPenalty.created_at.desc(), UserPenalty.id.desc()],
+        lambda c: json_object(
+            id=c.id,
+            user_id=c.user_id,
+            booking_id=c.booking_id,
+            reason=c.reason,
+            points=c.points,
+            status=enum_value(c.status),
+            created_at=c.created_at,
+            created_by=c.created_by,
+        ),
+        penalty_limit,
+        penalty_offset,
+    )
+    ratings, ratings_total = _section(
+        select(UserRating).where(UserRating.rated_user_id == user_id),
+        [UserRating.created_at.desc(), UserRating.id.desc()],
+        lambda c: json_object(
+            id=c.id,
+            rated_user_id=c.rated_user_id,
+            booking_id=c.booking_id,
+            rating=c.rating,
+            comment=c.comment,
+            created_at=c.created_at,
+            created_by=c.created_by,
+        ),
+        rating_limit,
+        rating_offset,
+    )
+
+    user = json_object(
+        id=User.id,
+        role=enum_value(User.role),
+        status=enum_value(User.status),
+        email=cast(User.email, Text),
+        full_name=User.full_name,
+        first_name=User.first_name,
+        last_name=User.last_name,
+        student_id=User.student_id,
+        department=User.department,
+        year_of_study=User.year_of_study,
+        phone=User.phone,
+        profile_image_url=User.profile_image_url,
+        joined_at=User.joined_at,
+        # Same defaults as the User properties when there is no stats row yet
+        total_bookings=func.coalesce(UserStats.booking_count, 0),
+        average_rating=cast(UserStats.rating_sum, Float) / func.nullif(UserStats.rating_count, 0),
+        rating_count=func.coalesce(UserStats.rating_count, 0),
+        active_penalty_points=func.coalesce(UserStats.active_penalty_points, 0),
+        no_show_count=func.coalesce(UserStats.no_show_count, 0),
+    )
+    document = json_object(
+        user=user,
+        booking_history=history,
+        booking_history_total=history_total,
+        penalties=penalties,
+        penalties_total=penalties_total,
+        ratings=ratings,
+        ratings_total=ratings_total,
+    )
+    return (
+        select(cast(document, Text))
+        .select_from(User)
+        .outerjoin(UserStats, UserStats.user_id == User.id)
+        .where(User.id == user_id)
+    )
@@ -0,0 +1,135 @@
+"""
+Benchmark harness: drives the ASGI app in-process and collects per-request
+latency and SQL statement counts.
+"""
+import asyncio
+import contextvars
+import math
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Awaitable, Callable
+
+from httpx import AsyncClient, Response
+from sqlalchemy import event
+
+from app.core.database import async_engine
+
+# (statement, parameters) executed by the request running in the current task
+_statements: contextvars.ContextVar[list[tuple] | None] = contextvars.ContextVar("statements", default=None)
+
+
+@event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    captured = _statements.get()
+    if captured is not None:
+        captured.append((statement, parameters))
+
+
+async def capture(request: Awaitable[Response]) -> tuple[Response, list[tuple]]:
+    """Await ``request`` and return its response with the SQL it executed."""
+    captured: list[tuple] = []
+    token = _statements.set(captured)
+    try:
+        return await request, captured
+    finally:
+        _statements.reset(token)
+
+
+@dataclass
+class ScenarioResult:
+    """Aggregated measurements for one scenario."""
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    throughput_rps: float
+    statements_per_request: float
+    status_codes: dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+# A request function gets the client and the request's index and returns the response
+RequestFn = Callable[[AsyncClient, int], Awaitable[Response]]
+
+
+async def run_scenario(
+    client: AsyncClient,
+    request: RequestFn,
+    requests: int,
+    concurrency: int,
+    ok_statuses: tuple[int, ...] = (200, 201),
+) -> ScenarioResult:
+    """Issue ``requests`` calls from ``concurrency`` workers and aggregate the results."""
+    latencies: list[float] = []
+    statements: list[int] = []
+    status_codes: dict[str, int] = {}
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index, errors
+        while next_index < requests:
+            index, next_index = next_index, next_index + 1
+            started = time.perf_counter()
+            response, executed = await capture(request(client, index))
+            latencies.append((time.perf_counter() - started) * 1000)
+            statements.append(len(executed))
+            code = str(response.status_code)
+            status_codes[code] = status_codes.get(code, 0) + 1
+            if response.status_code not in ok_statuses:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return ScenarioResult(
+        requests=requests,
+        errors=errors,
+        p50_ms=round(percentile(latencies, 50), 2),
+        p95_ms=round(percentile(latencies, 95), 2),
+        p99_ms=round(percentile(latencies, 99), 2),
+        throughput_rps=round(requests / wall, 1) if wall else 0.0,
+        statements_per_request=round(sum(statements) / len(statements), 2) if statements else 0.0,
+        status_codes=status_codes,
+    )
+
+
+def compare(
+    name: str,
+    result: ScenarioResult,
+    baseline: dict | None,
+    tolerance: float,
+) -> list[str]:
+    """Return regression messages for ``result`` against a stored baseline."""
+    if baseline is None:
+        return []
+    problems = []
+    for metric in ("p50_ms", "p95_ms", "p99_ms"):
+        limit = baseline[metric] * (1 + tolerance)
+        if getattr(result, metric) > limit:
+            problems.append(f"{name}: {metric} {getattr(result, metric)} > {limit:.2f} (baseline {baseline[metric]})")
+    floor = baseline["throughput_rps"] * (1 - tolerance)
+    if result.throughput_rps < floor:
+        problems.append(f"{name}: throughput {result.throughput_rps} rps < {floor:.1f} (baseline {baseline['throughput_rps']})")
+    # Statement counts are deterministic; allow only rounding noise
+    if result.statements_per_request > baseline["statements_per_request"] + 0.5:
+        problems.append(
+            f"{name}: {result.statements_per_request} SQL statements/request "
+            f"(baseline {baseline['statements_per_request']})"
+        )
+    if result.errors > baseline.get("errors", 0):
+        problems.append(f"{name}: {result.errors} unexpected responses {result.status_codes}")
+    return problems
@@ -0,0 +1,207 @@
+"""
+Query-plan regression checks.
+
+Replays each benchmark scenario against the configured (synthetic) dataset,
+captures the SQL every route emits, runs ``EXPLAIN (FORMAT JSON)`` on it and
+checks:
+
+- no sequential scan on ``bookings`` (the table that grows without bound)
+- the estimated total cost of each statement stays under the route's ceiling
+
+Plans are also rendered as indented node trees, without costs or row
+estimates, into ``benchmarks/plans/<scenario>.txt``. Commit them: a migration
+or ORM change that turns an index scan into a seq scan shows up as a diff.
+Monthly partitions are rendered as ``bookings_YYYY_MM`` and consecutive
+partitions planned alike as one branch, so the files don't change as months
+pass. A seq scan on a non-empty partition counts as one on its parent table.
+
+    uv run python -m benchmarks.plans            # check and compare with stored plans
+    uv run python -m benchmarks.plans --update   # rewrite stored plans
+"""
+import argparse
+import asyncio
+import difflib
+import json
+import random
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
+
+from app.core.database import async_engine, get_async_db, get_read_db
+from app.main import app
+from benchmarks.harness import capture
+from benchmarks.run import build_scenarios, load_fixtures, rollback_db
+
+PLAN_DIR = Path(__file__).with_name("plans")
+
+# Tables that must never be read with a sequential scan
+NO_SEQ_SCAN = {"bookings"}
+
+# Estimated cost ceiling for any single statement a scenario runs
+COST_CEILINGS = {
+    "list_spaces": 2_000,
+    "list_bookings": 10_000,
+    "booking_calendar": 1_000,
+    "create_booking": 500,
+    "login": 100,
+    "admin_list_users": 2_000,
+    "admin_get_user_summary": 5_000,
+}
+
+# Only statements that read rows are worth explaining
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|UPDATE|DELETE)\b", re.IGNORECASE)
+# Expanded IN lists differ in length from request to request
+_PARAM_LIST = re.compile(r"\$\d+(?:::[\w ]+)?(?:, \$\d+(?:::[\w ]+)?)+")
+# Monthly bookings partitions (and their indexes) are named after their month
+_PARTITION = re.compile(r"\bbookings_\d{4}_\d{2}")
+
+
+@dataclass
+class StatementPlan:
+    """The plan of one distinct statement."""
+    sql: str
+    cost: float
+    tree: list[str]
+    seq_scans: set[str] = field(default_factory=set)
+
+
+def normalize(sql: str) -> str:
+    """Collapse whitespace and variable-length parameter lists."""
+    sql = " ".join(sql.split())
+    return _PARAM_LIST.sub("$...", sql)
+
+
+def render(node: dict, depth: int = 0, lines: list[str] | None = None, seq_scans: set[str] | None = None):
+    """Render a plan node tree without costs; collect relations read by Seq Scan."""
+    lines = [] if lines is None else lines
+    seq_scans = set() if seq_scans is None else seq_scans
+    label = node["Node Type"]
+    if "Join Type" in node and node["Node Type"].endswith("Join"):
+        label = f"{node['Join Type']} {label}"
+    if "Index Name" in node:
+        label += f" using {_PARTITION.sub('bookings_YYYY_MM', node['Index Name'])}"
+    if "Relation Name" in node:
+        label += f" on {_PARTITION.sub('bookings_YYYY_MM', node['Relation Name'])}"
+        if node["Node Type"] == "Seq Scan":
+            seq_scans.add(node["Relation Name"])
+    if "Sort Key" in node:
+        label += f" ({', '.join(node['Sort Key'])})"
+    lines.append("  " * depth + label)
+    previous = None
+    for child in node.get("Plans", []):
+        branch, _ = render(child, depth + 1, None, seq_scans)
+        # Partitions planned alike show once, however many months there are
+        if branch != previous:
+            lines.extend(branch)
+        previous = branch
+    return lines, seq_scans
+
+
+# Seq-scanned partitions as their parent table; empty partitions cost nothing to scan
+_PARTITION_PARENTS = text("""
+    SELECT child.relname, CASE WHEN child.relpages > 0 THEN parent.relname END
+    FROM pg_inherits
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    WHERE child.relname = ANY(:names)
+""")
+
+
+async def explain(statement: str, parameters) -> StatementPlan:
+    async with async_engine.connect() as connection:
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        root = plan[0]["Plan"]
+        tree, seq_scans = render(root)
+        parents = dict((await connection.execute(_PARTITION_PARENTS, {"names": list(seq_scans)})).all())
+        await connection.rollback()
+    seq_scans = {parents.get(name, name) for name in seq_scans} - {None}
+    return StatementPlan(sql=normalize(statement), cost=root["Total Cost"], tree=tree, seq_scans=seq_scans)
+
+
+async def scenario_plans(client: AsyncClient, request, requests: int) -> list[StatementPlan]:
+    """Distinct statement plans across ``requests`` calls of one scenario."""
+    seen: dict[str, tuple] = {}
+    for index in range(requests):
+        _, executed = await capture(request(client, index))
+        for statement, parameters in executed:
+            if _EXPLAINABLE.match(statement):
+                seen.setdefault(normalize(statement), (statement, parameters))
+    return [await explain(statement, parameters) for statement, parameters in seen.values()]
+
+
+def snapshot(plans: list[StatementPlan]) -> str:
+    blocks = [f"-- {plan.sql}\n" + "\n".join(plan.tree) for plan in sorted(plans, key=lambda p: p.sql)]
+    return "\n\n".join(blocks) + "\n"
+
+
+def check(name: str, plans: list[StatementPlan]) -> list[str]:
+    problems = []
+    ceiling = COST_CEILINGS.get(name)
+    for plan in plans:
+        for table in sorted(plan.seq_scans & NO_SEQ_SCAN):
+            problems.append(f"{name}: Seq Scan on {table}\n    {plan.sql}")
+        if ceiling is not None and plan.cost > ceiling:
+            problems.append(f"{name}: cost {plan.cost:.0f} > ceiling {ceiling}\n    {plan.sql}")
+    return problems
+
+
+async def main(args: argparse.Namespace) -> int:
+    fixtures = await load_fixtures(args.sample)
+    scenarios = build_scenarios(fixtures, random.Random(args.seed))
+    selected = args.scenario or list(scenarios)
+    unknown = set(selected) - set(scenarios)
+    if unknown:
+        sys.exit(f"Unknown scenarios: {', '.join(sorted(unknown))} (available: {', '.join(scenarios)})")
+
+    problems, changed = [], []
+    PLAN_DIR.mkdir(exist_ok=True)
+    app.dependency_overrides[get_async_db] = rollback_db
+    app.dependency_overrides[get_read_db] = rollback_db
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://plans") as client:
+            for name in selected:
+                request, _ = scenarios[name]
+                plans = await scenario_plans(client, request, args.requests)
+                problems += check(name, plans)
+
+                path = PLAN_DIR / f"{name}.txt"
+                current = snapshot(plans)
+                stored = path.read_text() if path.exists() else ""
+                if args.update:
+                    path.write_text(current)
+                elif current != stored:
+                    changed.append(name)
+                    sys.stdout.writelines(difflib.unified_diff(
+                        stored.splitlines(keepends=True),
+                        current.splitlines(keepends=True),
+                        fromfile=f"{path} (stored)",
+                        tofile=f"{path} (current)",
+                    ))
+                print(f"{name}: {len(plans)} statements, max cost {max((p.cost for p in plans), default=0):.0f}")
+    finally:
+        app.dependency_overrides.clear()
+
+    if problems:
+        print("\nPLAN CHECK FAILURES:")
+        for problem in problems:
+            print(f"  {problem}")
+    if changed:
+        print(f"\nPlans changed for: {', '.join(changed)} (re-run with --update to accept)")
+    return 1 if problems or changed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query-plan regression checks.")
+    parser.add_argument("scenario", nargs="*", help="scenarios to check (default: all)")
+    parser.add_argument("--requests", type=int, default=20, help="requests replayed per scenario")
+    parser.add_argument("--sample", type=int, default=500, help="users sampled from the dataset")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--update", action="store_true", help="rewrite the stored plans")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,236 @@
+"""
+In-process API benchmarks.
+
+Drives the ASGI app through ``httpx.ASGITransport`` (as ``tests/conftest.py``
+does) against the configured database, which should hold a generated dataset:
+
+    uv run python -m app.scripts.seed --synthetic
+    uv run python -m benchmarks.run                    # compare with baselines.json
+    uv run python -m benchmarks.run --update-baseline  # record new baselines
+
+Every request runs in its own transaction that is rolled back, so writes made
+by the benchmark (e.g. ``create_booking``) never reach the dataset. Exits with
+status 1 when a scenario regresses past the tolerance.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import AsyncGenerator
+
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_async_db, get_read_db
+from app.core.security import create_access_token
+from app.main import app
+from app.models import User, UserStats, Space, UserRole, UserStatus, SpaceStatus
+from benchmarks.harness import RequestFn, run_scenario, compare
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+# Password the synthetic generator gives every user
+SYNTHETIC_PASSWORD = "password123"
+
+
+@dataclass
+class Fixtures:
+    """Ids and credentials sampled from the dataset."""
+    admin_headers: dict
+    student_headers: list[dict]
+    student_emails: list[str]
+    user_ids: list[int]
+    space_ids: list[int]
+    buildings: list[str]
+
+
+async def rollback_db() -> AsyncGenerator[AsyncSession, None]:
+    """Like ``get_async_db`` but never commits."""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
+def headers_for(user_id: int) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(subject=user_id)}"}
+
+
+async def load_fixtures(sample: int) -> Fixtures:
+    async with AsyncSessionLocal() as db:
+        admin_id = (await db.execute(
+            select(User.id).where(User.role == UserRole.ADMIN).order_by(User.id).limit(1)
+        )).scalar_one()
+
+        # Active students that are still allowed to book
+        limit = settings.BOOKING_PENALTY_POINTS_LIMIT or 1 << 30
+        students = (await db.execute(
+            select(User.id, User.email)
+            .outerjoin(UserStats, UserStats.user_id == User.id)
+            .where(
+                User.role == UserRole.STUDENT,
+                User.status == UserStatus.ACTIVE,
+                func.coalesce(UserStats.active_penalty_points, 0) < limit,
+            )
+            .order_by(func.random())
+            .limit(sample)
+        )).all()
+        user_ids = (await db.execute(
+            select(User.id).order_by(func.random()).limit(sample)
+        )).scalars().all()
+        spaces = (await db.execute(
+            select(Space.id, Space.building).where(Space.status == SpaceStatus.ACTIVE)
+        )).all()
+
+    if not students or not spaces:
+        sys.exit("The database has no students or spaces; run `python -m app.scripts.seed --synthetic` first.")
+
+    return Fixtures(
+        admin_headers=headers_for(admin_id),
+        student_headers=[headers_for(user_id) for user_id, _ in students],
+        student_emails=[email for _, email in students],
+        user_ids=list(user_ids),
+        space_ids=[space_id for space_id, _ in spaces],
+        buildings=sorted({building for _, building in spaces}),
+    )
+
+
+def build_scenarios(fx: Fixtures, rng: random.Random) -> dict[str, tuple[RequestFn, tuple[int, ...]]]:
+    """Scenario name -> (request function, statuses counted as success)."""
+
+    async def list_spaces(client: AsyncClient, i: int):
+        params = [
+            {},
+            {"building": rng.choice(fx.buildings)},
+            {"capacityMin": rng.choice([4, 8, 20])},
+            {"utilities": "wifi"},
+            {"q": "A1"},
+        ][i % 5]
+        return await client.get("/spaces", params={**params, "offset": rng.randrange(0, 100, 20)})
+
+    async def list_bookings(client: AsyncClient, i: int):
+        if i % 2:
+            return await client.get("/bookings", headers=rng.choice(fx.student_headers))
+        return await client.get(
+            "/bookings",
+            headers=fx.admin_headers,
+            params={"my": False, "offset": rng.randrange(0, 1000, 20)},
+        )
+
+    async def booking_calendar(client: AsyncClient, i: int):
+        start = date.today() + timedelta(days=rng.randint(-7, 7))
+        params = {"from": start.isoformat(), "to": (start + timedelta(days=6)).isoformat()}
+        if i % 2:
+            params["spaceIds"] = ",".join(map(str, rng.sample(fx.space_ids, min(5, len(fx.space_ids)))))
+        return await client.get("/bookings/calendar", headers=rng.choice(fx.student_headers), params=params)
+
+    async def create_booking(client: AsyncClient, i: int):
+        start = rng.randrange(settings.BOOKING_DAY_START_HOUR, settings.BOOKING_DAY_END_HOUR - 1)
+        return await client.post("/bookings", headers=rng.choice(fx.student_headers), json={
+            "space_id": rng.choice(fx.space_ids),
+            "booking_date": (date.today() + timedelta(days=rng.randint(1, 14))).isoformat(),
+            "start_time": f"{start:02d}:00:00",
+            "end_time": f"{start + 1:02d}:00:00",
+            "attendees": 1,
+            "purpose": "Benchmark",
+        })
+
+    async def login(client: AsyncClient, i: int):
+        return await client.post("/auth/login", json={
+            "email": rng.choice(fx.student_emails),
+            "password": SYNTHETIC_PASSWORD,
+        })
+
+    async def admin_list_users(client: AsyncClient, i: int):
+        return await client.get(
+            "/admin/users",
+            headers=fx.admin_headers,
+            params={"offset": rng.randrange(0, 2000, 20)},
+        )
+
+    async def admin_get_user_summary(client: AsyncClient, i: int):
+        return await client.get(f"/admin/users/{rng.choice(fx.user_ids)}/summary", headers=fx.admin_headers)
+
+    return {
+        "list_spaces": (list_spaces, (200,)),
+        "list_bookings": (list_bookings, (200,)),
+        "booking_calendar": (booking_calendar, (200,)),
+        # Slot conflicts (400) are an expected outcome under contention
+        "create_booking": (create_booking, (201, 400)),
+        "login": (login, (200,)),
+        "admin_list_users": (admin_list_users, (200,)),
+        "admin_get_user_summary": (admin_get_user_summary, (200,)),
+    }
+
+
+async def main(args: argparse.Namespace) -> int:
+    rng = random.Random(args.seed)
+    fixtures = await load_fixtures(args.sample)
+    scenarios = build_scenarios(fixtures, rng)
+    selected = args.scenario or list(scenarios)
+    unknown = set(selected) - set(scenarios)
+    if unknown:
+        sys.exit(f"Unknown scenarios: {', '.join(sorted(unknown))} (available: {', '.join(scenarios)})")
+
+    baselines = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    results, problems = {}, []
+
+    app.dependency_overrides[get_async_db] = rollback_db
+    app.dependency_overrides[get_read_db] = rollback_db
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            print(f"{'scenario':<24}{'p50':>9}{'p95':>9}{'p99':>9}{'rps':>9}{'sql/req':>9}  status")
+            for name in selected:
+                request, ok_statuses = scenarios[name]
+                # Warm up pools, caches and statement caches before measuring
+                await run_scenario(client, request, args.warmup, args.concurrency, ok_statuses)
+                result = await run_scenario(client, request, args.requests, args.concurrency, ok_statuses)
+                results[name] = result.as_dict()
+                problems += compare(name, result, baselines.get("scenarios", {}).get(name), args.tolerance)
+                print(
+                    f"{name:<24}{result.p50_ms:>9}{result.p95_ms:>9}{result.p99_ms:>9}"
+                    f"{result.throughput_rps:>9}{result.statements_per_request:>9}  {result.status_codes}"
+                )
+    finally:
+        app.dependency_overrides.clear()
+
+    if args.update_baseline:
+        baselines.setdefault("scenarios", {}).update(results)
+        baselines["settings"] = {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+        }
+        args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaselines written to {args.baseline}")
+        return 0
+
+    if problems:
+        print("\nREGRESSIONS:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    if baselines:
+        print(f"\nNo regressions (tolerance {args.tolerance:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="In-process API benchmarks.")
+    parser.add_argument("scenario", nargs="*", help="scenarios to run (default: all)")
+    parser.add_argument("--requests", type=int, default=500, help="measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=50, help="unmeasured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--sample", type=int, default=500, help="users sampled from the dataset")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed latency/throughput regression")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -20,7 +20,8 @@ from app.core.database import Base
 # Import all models to register them with Base.metadata
 from app.models import (
     User, Space, Utility, SpaceUtility,
-    Booking, UserPenalty, UserRating
+    Booking, UserPenalty, UserRating, SpaceUsageRollup, UserStats, Tombstone,
+    AllocationWindow, AllocationRequest
 )
 
 
@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
-from app.core.database import get_async_db
+from app.core.database import get_async_db, get_primary_read_db, get_read_db
 from app.core.security import get_password_hash, create_access_token
 from app.main import app
 from app.models import User, UserRole, UserStatus, Utility, Space, SpaceStatus
@@ -58,6 +58,8 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_async_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_primary_read_db] = override_get_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
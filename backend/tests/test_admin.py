@@ -3,7 +3,9 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import User, UserPenalty, UserRating, Booking, PenaltyStatus
+from app.models import User, UserPenalty, UserRating, Booking, PenaltyStatus, UserStatus
+from app.schemas import AdminUserSummaryResponse, PenaltyResponse, RatingResponse, UserResponse
+from app.schemas.user import BookingHistoryItem
 from datetime import date, time, timedelta
 
 
@@ -65,6 +67,19 @@ class TestAdminUsers:
         data = response.json()
         assert data["meta"]["total"] >= 1
 
+    async def test_list_users_by_ids(
+        self, client: AsyncClient, admin_headers: dict, test_user: User, test_admin: User
+    ):
+        """Test batch lookup of users preserves the requested order."""
+        response = await client.get(
+            "/admin/users",
+            headers=admin_headers,
+            params={"ids": f"{test_user.id},{test_admin.id}"}
+        )
+
+        assert response.status_code == 200
+        assert [u["id"] for u in response.json()["data"]] == [test_user.id, test_admin.id]
+
     async def test_get_user_details(
         self, client: AsyncClient, admin_headers: dict, test_user: User
     ):
@@ -126,6 +141,90 @@ class TestAdminUsers:
         assert "penalties" in data
         assert "ratings" in data
 
+    async def test_user_summary_contents(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        test_user: User,
+        test_space,
+        completed_booking: Booking,
+    ):
+        """Test the single-statement summary carries every section in the response shape."""
+        penalty = (await client.post("/penalties", headers=admin_headers, json={
+            "user_id": test_user.id, "booking_id": completed_booking.id, "reason": "Late", "points": 5,
+        })).json()
+        rating = (await client.post("/ratings", headers=admin_headers, json={
+            "rated_user_id": test_user.id, "booking_id": completed_booking.id, "rating": 4, "comment": "Tidy",
+        })).json()
+
+        response = await client.get(f"/admin/users/{test_user.id}/summary", headers=admin_headers)
+
+        assert response.status_code == 200
+        # The route returns SQL-built JSON unvalidated: its keys must match the schema exactly
+        raw = response.json()
+        assert set(raw) == set(AdminUserSummaryResponse.model_fields)
+        assert set(raw["user"]) == set(UserResponse.model_fields)
+        assert set(raw["booking_history"][0]) == set(BookingHistoryItem.model_fields)
+        assert set(raw["penalties"][0]) == set(PenaltyResponse.model_fields)
+        assert set(raw["ratings"][0]) == set(RatingResponse.model_fields)
+        data = AdminUserSummaryResponse.model_validate(raw)
+        user = (await client.get(f"/admin/users/{test_user.id}", headers=admin_headers)).json()
+        assert data.user.model_dump(mode="json") == UserResponse.model_validate(user).model_dump(mode="json")
+        assert data.user.active_penalty_points == 5
+        assert data.user.average_rating == 4.0
+        assert data.booking_history_total == 1
+        [item] = data.booking_history
+        assert item.id == completed_booking.id
+        assert item.space_name == test_space.name
+        assert item.date == str(completed_booking.booking_date)
+        assert item.time == "10:00 - 12:00"
+        assert item.status == "completed"
+        assert [p.id for p in data.penalties] == [penalty["id"]]
+        assert data.penalties[0].status == "active"
+        assert [r.id for r in data.ratings] == [rating["id"]]
+
+    async def test_user_summary_sections_paginated(
+        self, client: AsyncClient, admin_headers: dict, test_user: User
+    ):
+        """Test each section is paged on its own, with its total."""
+        for points in (1, 2, 3):
+            await client.post("/penalties", headers=admin_headers, json={
+                "user_id": test_user.id, "reason": f"Penalty {points}", "points": points,
+            })
+
+        response = await client.get(
+            f"/admin/users/{test_user.id}/summary",
+            headers=admin_headers,
+            params={"penaltyLimit": 2, "penaltyOffset": 2},
+        )
+
+        data = response.json()
+        assert data["penalties_total"] == 3
+        # Newest first: the third page item is the oldest penalty
+        assert [p["points"] for p in data["penalties"]] == [1]
+        assert data["booking_history"] == []
+        assert data["ratings_total"] == 0
+
+    async def test_user_summary_penalties_unbounded_by_default(
+        self, client: AsyncClient, db_session: AsyncSession, admin_headers: dict, test_user: User
+    ):
+        """Test penalties and ratings are returned in full unless a limit is given."""
+        db_session.add_all(
+            UserPenalty(user_id=test_user.id, reason=f"Penalty {i}", points=1) for i in range(60)
+        )
+        await db_session.flush()
+
+        response = await client.get(f"/admin/users/{test_user.id}/summary", headers=admin_headers)
+
+        data = response.json()
+        assert (len(data["penalties"]), data["penalties_total"]) == (60, 60)
+
+    async def test_user_summary_not_found(self, client: AsyncClient, admin_headers: dict):
+        """Test summary of an unknown user is a 404."""
+        response = await client.get("/admin/users/99999/summary", headers=admin_headers)
+
+        assert response.status_code == 404
+
 
 class TestPenalties:
     """Tests for penalty management endpoints."""
@@ -286,3 +385,144 @@ class TestRatings:
         response = await client.delete(f"/ratings/{rating.id}", headers=admin_headers)
 
         assert response.status_code == 204
+
+
+class TestUserStats:
+    """Tests for materialized user stats."""
+
+    async def test_rating_updates_stats(
+        self, client: AsyncClient, admin_headers: dict, test_user: User
+    ):
+        """Test ratings are reflected in the user's average."""
+        for score in (5, 2):
+            await client.post("/ratings", headers=admin_headers, json={
+                "rated_user_id": test_user.id,
+                "rating": score,
+            })
+
+        response = await client.get(f"/admin/users/{test_user.id}", headers=admin_headers)
+
+        data = response.json()
+        assert data["rating_count"] == 2
+        assert data["average_rating"] == 3.5
+
+    async def test_penalty_status_updates_active_points(
+        self, client: AsyncClient, admin_headers: dict, test_user: User
+    ):
+        """Test only active penalties count towards active points."""
+        response = await client.post("/penalties", headers=admin_headers, json={
+            "user_id": test_user.id,
+            "reason": "Late",
+            "points": 7,
+        })
+        penalty_id = response.json()["id"]
+
+        response = await client.get("/admin/users", headers=admin_headers, params={"q": test_user.email})
+        assert response.json()["data"][0]["active_penalty_points"] == 7
+
+        await client.patch(f"/penalties/{penalty_id}", headers=admin_headers, json={"status": "resolved"})
+
+        response = await client.get("/admin/users", headers=admin_headers, params={"q": test_user.email})
+        assert response.json()["data"][0]["active_penalty_points"] == 0
+
+    async def test_no_show_counted(
+        self, client: AsyncClient, admin_headers: dict, auth_headers: dict,
+        test_user: User, test_space
+    ):
+        """Test bookings and no-shows are counted."""
+        response = await client.post("/bookings", headers=auth_headers, json={
+            "space_id": test_space.id,
+            "booking_date": (date.today() + timedelta(days=1)).isoformat(),
+            "start_time": "10:00:00",
+            "end_time": "11:00:00",
+            "attendees": 1,
+            "purpose": "Study",
+        })
+        await client.patch(
+            f"/bookings/{response.json()['id']}",
+            headers=admin_headers,
+            json={"status": "no_show"}
+        )
+
+        response = await client.get(f"/admin/users/{test_user.id}", headers=admin_headers)
+
+        data = response.json()
+        assert data["total_bookings"] == 1
+        assert data["no_show_count"] == 1
+
+    async def test_rebuild_matches_incremental(
+        self, client: AsyncClient, admin_headers: dict, test_user: User, db_session: AsyncSession
+    ):
+        """Test rebuilding stats from source tables gives the same counters."""
+        from app.models import UserStats
+        from app.services.user_stats import rebuild_user_stats
+
+        await client.post("/ratings", headers=admin_headers, json={"rated_user_id": test_user.id, "rating": 4})
+        await client.post("/penalties", headers=admin_headers, json={
+            "user_id": test_user.id,
+            "reason": "Noise",
+            "points": 3,
+        })
+        incremental = await db_session.get(UserStats, test_user.id)
+        before = (incremental.rating_count, incremental.rating_sum, incremental.active_penalty_points)
+
+        await rebuild_user_stats(db_session)
+        rebuilt = await db_session.get(UserStats, test_user.id, populate_existing=True)
+
+        assert (rebuilt.rating_count, rebuilt.rating_sum, rebuilt.active_penalty_points) == before
+
+
+class TestAdminStats:
+    """Tests for GET /admin/stats"""
+
+    @pytest.fixture(autouse=True)
+    def clear_stats_cache(self):
+        from app.core.cache import admin_stats_cache
+        admin_stats_cache.clear()
+
+    async def test_stats(
+        self, client: AsyncClient, admin_headers: dict, test_user: User,
+        db_session: AsyncSession
+    ):
+        """Test dashboard counters are computed."""
+        test_user.status = UserStatus.SUSPENDED
+        await db_session.flush()
+
+        response = await client.get("/admin/stats", headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_users"] >= 2
+        assert data["suspended_users"] >= 1
+
+    async def test_stats_invalidated_by_booking(
+        self, client: AsyncClient, admin_headers: dict, auth_headers: dict, test_space
+    ):
+        """Test a new booking is reflected despite the cache."""
+        before = (await client.get("/admin/stats", headers=admin_headers)).json()
+
+        await client.post("/bookings", headers=auth_headers, json={
+            "space_id": test_space.id,
+            "booking_date": date.today().isoformat(),
+            "start_time": "23:00:00",
+            "end_time": "23:30:00",
+            "attendees": 1,
+            "purpose": "Study",
+        })
+        after = (await client.get("/admin/stats", headers=admin_headers)).json()
+
+        assert after["pending_bookings"] == before["pending_bookings"] + 1
+        assert after["today_bookings"] == before["today_bookings"] + 1
+
+    async def test_stats_cached(self, client: AsyncClient, admin_headers: dict):
+        """Test repeated reads are served from the cache."""
+        first = (await client.get("/admin/stats", headers=admin_headers)).json()
+        second = (await client.get("/admin/stats", headers=admin_headers)).json()
+
+        assert first["generated_at"] == second["generated_at"]
+
+    async def test_stats_requires_admin(self, client: AsyncClient, auth_headers: dict):
+        """Test non-admins cannot read stats."""
+        response = await client.get("/admin/stats", headers=auth_headers)
+
+        assert response.status_code == 403
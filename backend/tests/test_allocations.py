@@ -0,0 +1,305 @@
+"""Tests for batch allocation windows."""
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.core.security import create_access_token, get_password_hash
+from app.main import app
+from app.models import (
+    AllocationRequest,
+    AllocationRequestStatus,
+    AllocationWindow,
+    AllocationWindowStatus,
+    Booking,
+    BookingStatus,
+    Space,
+    User,
+    UserStats,
+)
+from app.services.allocations import allocate_due_windows
+
+DAY = date.today() + timedelta(days=3)
+
+
+async def add_student(db_session: AsyncSession) -> tuple[User, dict]:
+    user = User(
+        email=f"student_{uuid.uuid4().hex[:8]}@test.com",
+        password_hash=get_password_hash("password123"),
+        full_name="Student",
+    )
+    db_session.add(user)
+    await db_session.flush()
+    return user, {"Authorization": f"Bearer {create_access_token(subject=user.id)}"}
+
+
+async def open_window(client: AsyncClient, admin_headers: dict, space: Space, **fields) -> dict:
+    response = await client.post("/allocations/windows", headers=admin_headers, json={
+        "space_id": space.id,
+        "booking_date": DAY.isoformat(),
+        "closes_at": (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat(),
+        **fields,
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+async def request_slot(client: AsyncClient, headers: dict, space: Space, start: str, end: str):
+    return await client.post("/bookings", headers=headers, json={
+        "space_id": space.id,
+        "booking_date": DAY.isoformat(),
+        "start_time": start,
+        "end_time": end,
+        "attendees": 2,
+        "purpose": "Exam prep",
+    })
+
+
+async def close(db_session: AsyncSession, window_id: int) -> None:
+    window = await db_session.get(AllocationWindow, window_id)
+    window.closes_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+    await db_session.flush()
+
+
+class TestQueueing:
+    """Tests for POST /bookings inside an allocation window"""
+
+    async def test_requests_queued_while_open(
+        self, client: AsyncClient, admin_headers: dict, auth_headers: dict, test_space: Space
+    ):
+        """Test requests are queued, once per user, instead of booked."""
+        window = await open_window(client, admin_headers, test_space)
+
+        response = await request_slot(client, auth_headers, test_space, "10:00", "11:00")
+        assert response.status_code == 202
+        queued = response.json()
+        assert (queued["window_id"], queued["status"], queued["booking_id"]) == (window["id"], "queued", None)
+
+        response = await request_slot(client, auth_headers, test_space, "14:00", "15:00")
+        assert response.status_code == 409
+        assert response.json()["detail"]["code"] == "ALREADY_QUEUED"
+
+        response = await client.get("/allocations/requests", headers=auth_headers)
+        assert [r["id"] for r in response.json()["data"]] == [queued["id"]]
+        response = await client.get("/bookings", headers=auth_headers)
+        assert response.json()["data"] == []
+
+    async def test_slots_outside_window_book_normally(
+        self, client: AsyncClient, admin_headers: dict, auth_headers: dict, test_space: Space
+    ):
+        """Test a window over some slots leaves the rest of the day bookable."""
+        await open_window(client, admin_headers, test_space, start_time="10:00", end_time="12:00")
+
+        response = await request_slot(client, auth_headers, test_space, "14:00", "15:00")
+        assert response.status_code == 201
+
+        response = await request_slot(client, auth_headers, test_space, "11:30", "12:30")
+        assert response.status_code == 202
+
+
+class TestAllocation:
+    """Tests for allocating queued requests"""
+
+    async def test_allocate_grants_requests_that_fit(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_headers: dict,
+        test_admin: User,
+        test_space: Space,
+    ):
+        """Test each slot goes to one request and existing bookings are respected."""
+        db_session.add(Booking(
+            user_id=test_admin.id, space_id=test_space.id, booking_date=DAY,
+            start_time=time(9, 0), end_time=time(10, 0), attendees=1, purpose="Existing",
+            status=BookingStatus.APPROVED,
+        ))
+        window = await open_window(client, admin_headers, test_space)
+        slots = [("09:30", "10:30"), ("10:00", "11:00"), ("10:30", "11:30"), ("13:00", "14:00")]
+        queued = {}
+        for start, end in slots:
+            _, headers = await add_student(db_session)
+            response = await request_slot(client, headers, test_space, start, end)
+            assert response.status_code == 202
+            queued[start] = response.json()["id"]
+
+        response = await client.post(f"/allocations/windows/{window['id']}/allocate", headers=admin_headers)
+
+        assert response.status_code == 200
+        result = response.json()
+        assert (result["allocated"], result["rejected"]) == (2, 2)
+        assert result["window"]["status"] == "allocated"
+
+        response = await client.get(
+            "/allocations/requests", headers=admin_headers, params={"windowId": window["id"]}
+        )
+        outcomes = {r["id"]: r for r in response.json()["data"]}
+        assert outcomes[queued["09:30"]]["status"] == "rejected"
+        assert outcomes[queued["13:00"]]["status"] == "allocated"
+        # The two overlapping requests can't both win
+        assert {outcomes[queued["10:00"]]["status"], outcomes[queued["10:30"]]["status"]} == {
+            "allocated", "rejected",
+        }
+
+        winners = [r for r in outcomes.values() if r["status"] == "allocated"]
+        bookings = (await db_session.execute(
+            select(Booking).where(Booking.id.in_([r["booking_id"] for r in winners]))
+        )).scalars().all()
+        assert sorted((b.user_id, b.status) for b in bookings) == sorted(
+            (r["user_id"], BookingStatus.PENDING) for r in winners
+        )
+        stats = await db_session.get(UserStats, winners[0]["user_id"])
+        assert stats.booking_count == 1
+
+        response = await client.post(f"/allocations/windows/{window['id']}/allocate", headers=admin_headers)
+        assert response.status_code == 400
+
+    async def test_penalty_weighted_favours_low_points(
+        self, client: AsyncClient, db_session: AsyncSession, admin_headers: dict, test_space: Space
+    ):
+        """Test the penalty-weighted lottery all but rules out heavily penalized users."""
+        window = await open_window(client, admin_headers, test_space, policy="penalty_weighted")
+        penalized, penalized_headers = await add_student(db_session)
+        clean, clean_headers = await add_student(db_session)
+        for headers in (penalized_headers, clean_headers):
+            response = await request_slot(client, headers, test_space, "10:00", "11:00")
+            assert response.status_code == 202
+        # Penalties received after queueing still count at allocation
+        db_session.add(UserStats(user_id=penalized.id, active_penalty_points=1_000_000))
+        await db_session.flush()
+
+        response = await client.post(f"/allocations/windows/{window['id']}/allocate", headers=admin_headers)
+        assert response.status_code == 200
+
+        response = await client.get("/allocations/requests", headers=clean_headers)
+        assert response.json()["data"][0]["status"] == "allocated"
+        response = await client.get("/allocations/requests", headers=penalized_headers)
+        assert response.json()["data"][0]["status"] == "rejected"
+
+    async def test_closed_window_allocates_on_next_request(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_headers: dict,
+        auth_headers: dict,
+        test_space: Space,
+    ):
+        """Test the first booking after a window closes allocates it, then books as usual."""
+        window = await open_window(client, admin_headers, test_space)
+        _, headers = await add_student(db_session)
+        queued = (await request_slot(client, headers, test_space, "10:00", "11:00")).json()
+        await close(db_session, window["id"])
+
+        response = await request_slot(client, auth_headers, test_space, "10:30", "11:30")
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "SLOT_CONFLICT"
+
+        response = await client.get(f"/allocations/requests/{queued['id']}", headers=headers)
+        assert response.json()["status"] == "allocated"
+        response = await request_slot(client, auth_headers, test_space, "11:00", "12:00")
+        assert response.status_code == 201
+
+    async def test_allocation_survives_failing_trigger(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        admin_headers: dict,
+        auth_headers: dict,
+        test_space: Space,
+    ):
+        """Test a lazy allocation stays committed when the request that ran it fails."""
+        window = await open_window(client, admin_headers, test_space)
+        _, headers = await add_student(db_session)
+        queued = (await request_slot(client, headers, test_space, "10:00", "11:00")).json()
+        await close(db_session, window["id"])
+
+        # Commit and roll back like get_async_db, inside the test's transaction
+        connection = await db_session.connection()
+        request_session = AsyncSession(
+            bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False
+        )
+
+        async def get_request_db():
+            try:
+                yield request_session
+                await request_session.commit()
+            except Exception:
+                await request_session.rollback()
+                raise
+
+        get_test_db = app.dependency_overrides[get_async_db]
+        app.dependency_overrides[get_async_db] = get_request_db
+        try:
+            response = await request_slot(client, auth_headers, test_space, "10:30", "11:30")
+        finally:
+            app.dependency_overrides[get_async_db] = get_test_db
+            await request_session.close()
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "SLOT_CONFLICT"
+        db_session.expire_all()
+        assert (await db_session.get(AllocationWindow, window["id"])).status == AllocationWindowStatus.ALLOCATED
+        request = await db_session.get(AllocationRequest, queued["id"])
+        assert request.status == AllocationRequestStatus.ALLOCATED
+        assert await db_session.get(Booking, request.booking_id) is not None
+
+    async def test_allocate_due_windows(
+        self, client: AsyncClient, db_session: AsyncSession, admin_headers: dict, test_space: Space
+    ):
+        """Test the scheduled pass allocates closed windows and leaves open ones."""
+        other = Space(name="Other", building="B2", floor="1", capacity=4)
+        db_session.add(other)
+        await db_session.flush()
+        due = await open_window(client, admin_headers, test_space)
+        await open_window(client, admin_headers, other)
+        await close(db_session, due["id"])
+
+        results = await allocate_due_windows(db_session)
+
+        assert [r.window.id for r in results] == [due["id"]]
+        statuses = (await db_session.execute(
+            select(AllocationWindow.space_id, AllocationWindow.status)
+            .where(AllocationWindow.space_id.in_([test_space.id, other.id]))
+        )).all()
+        assert dict(statuses) == {
+            test_space.id: AllocationWindowStatus.ALLOCATED,
+            other.id: AllocationWindowStatus.OPEN,
+        }
+
+
+class TestWindows:
+    """Tests for /allocations/windows"""
+
+    async def test_create_window_validation(
+        self, client: AsyncClient, admin_headers: dict, auth_headers: dict, test_space: Space
+    ):
+        """Test windows need an admin, a future day and close, and no other open window."""
+        body = {
+            "space_id": test_space.id,
+            "booking_date": DAY.isoformat(),
+            "closes_at": (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat(),
+        }
+        response = await client.post("/allocations/windows", headers=auth_headers, json=body)
+        assert response.status_code == 403
+
+        past = {**body, "closes_at": (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()}
+        response = await client.post("/allocations/windows", headers=admin_headers, json=past)
+        assert response.status_code == 400
+
+        response = await client.post("/allocations/windows", headers=admin_headers, json={**body, "start_time": "10:00"})
+        assert response.status_code == 400
+
+        yesterday = {**body, "booking_date": (date.today() - timedelta(days=1)).isoformat()}
+        response = await client.post("/allocations/windows", headers=admin_headers, json=yesterday)
+        assert response.status_code == 400
+
+        await open_window(client, admin_headers, test_space)
+        response = await client.post("/allocations/windows", headers=admin_headers, json=body)
+        assert response.status_code == 409
+
+        response = await client.get("/allocations/windows", headers=auth_headers, params={"spaceId": test_space.id})
+        assert response.status_code == 200
+        assert response.json()["meta"]["total"] == 1
@@ -0,0 +1,145 @@
+"""Tests for usage rollups and analytics endpoints."""
+from datetime import date, timedelta
+
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Space, SpaceUsageRollup
+from app.services.usage import rebuild_usage_rollups
+
+
+async def create_booking(client: AsyncClient, headers: dict, space: Space, start: str, end: str) -> dict:
+    """Create a booking for tomorrow through the API."""
+    response = await client.post("/bookings", headers=headers, json={
+        "space_id": space.id,
+        "booking_date": (date.today() + timedelta(days=1)).isoformat(),
+        "start_time": start,
+        "end_time": end,
+        "attendees": 2,
+        "purpose": "Analytics",
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+async def rollup_rows(db_session: AsyncSession, space: Space) -> list[tuple]:
+    """Return the non-empty rollup rows for a space as comparable tuples."""
+    result = await db_session.execute(
+        select(SpaceUsageRollup)
+        .where(SpaceUsageRollup.space_id == space.id)
+        .order_by(SpaceUsageRollup.usage_date, SpaceUsageRollup.hour)
+    )
+    rows = [
+        (r.usage_date, r.hour, r.pending_count, r.approved_count, r.cancelled_count,
+         r.completed_count, r.no_show_count, r.booked_minutes)
+        for r in result.scalars().all()
+    ]
+    # Incremental updates can leave rows that have been decremented back to zero
+    return [row for row in rows if any(row[2:])]
+
+
+class TestUsageRollups:
+    """Tests for incremental rollup maintenance."""
+
+    async def test_rollups_follow_status_changes(
+        self, client: AsyncClient, db_session: AsyncSession,
+        auth_headers: dict, admin_headers: dict, test_space: Space
+    ):
+        """Test counters move between statuses and minutes spread over hours."""
+        booking = await create_booking(client, auth_headers, test_space, "10:30", "12:00")
+        await client.patch(f"/bookings/{booking['id']}", headers=admin_headers, json={"status": "approved"})
+
+        rows = await rollup_rows(db_session, test_space)
+        tomorrow = date.today() + timedelta(days=1)
+        assert rows == [
+            (tomorrow, 10, 0, 1, 0, 0, 0, 30),
+            (tomorrow, 11, 0, 0, 0, 0, 0, 60),
+        ]
+
+    async def test_incremental_matches_rebuild(
+        self, client: AsyncClient, db_session: AsyncSession,
+        auth_headers: dict, admin_headers: dict, test_space: Space
+    ):
+        """Test incremental rollups equal a full rebuild."""
+        first = await create_booking(client, auth_headers, test_space, "08:00", "09:45")
+        second = await create_booking(client, auth_headers, test_space, "13:00", "15:00")
+        await create_booking(client, auth_headers, test_space, "16:15", "17:00")
+        await client.patch(f"/bookings/{first['id']}", headers=admin_headers, json={"status": "no_show"})
+        await client.patch(f"/bookings/{second['id']}", headers=auth_headers, json={"status": "cancelled"})
+
+        incremental = await rollup_rows(db_session, test_space)
+        await rebuild_usage_rollups(db_session)
+        assert await rollup_rows(db_session, test_space) == incremental
+
+    async def test_delete_removes_usage(
+        self, client: AsyncClient, db_session: AsyncSession,
+        auth_headers: dict, admin_headers: dict, test_space: Space
+    ):
+        """Test deleting a booking subtracts its counters."""
+        booking = await create_booking(client, auth_headers, test_space, "10:00", "11:00")
+        await client.delete(f"/bookings/{booking['id']}", headers=admin_headers)
+
+        assert await rollup_rows(db_session, test_space) == []
+
+
+class TestUtilization:
+    """Tests for GET /admin/analytics/utilization"""
+
+    async def test_utilization_by_space(
+        self, client: AsyncClient, auth_headers: dict, admin_headers: dict, test_space: Space
+    ):
+        """Test occupancy and no-show rate per space."""
+        booking = await create_booking(client, auth_headers, test_space, "10:00", "12:00")
+        await client.patch(f"/bookings/{booking['id']}", headers=admin_headers, json={"status": "no_show"})
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+
+        response = await client.get(
+            "/admin/analytics/utilization",
+            headers=admin_headers,
+            params={"from": tomorrow, "to": tomorrow, "spaceId": test_space.id},
+        )
+
+        assert response.status_code == 200
+        rows = response.json()["rows"]
+        assert len(rows) == 1
+        assert rows[0]["key"] == str(test_space.id)
+        assert rows[0]["label"] == test_space.name
+        assert rows[0]["booked_minutes"] == 120
+        assert rows[0]["no_show_rate"] == 1.0
+        assert rows[0]["occupancy_rate"] > 0
+
+    async def test_utilization_by_hour(
+        self, client: AsyncClient, auth_headers: dict, admin_headers: dict, test_space: Space
+    ):
+        """Test grouping by hour of day."""
+        await create_booking(client, auth_headers, test_space, "09:00", "10:00")
+
+        response = await client.get(
+            "/admin/analytics/utilization",
+            headers=admin_headers,
+            params={
+                "to": (date.today() + timedelta(days=1)).isoformat(),
+                "groupBy": "hour",
+                "spaceId": test_space.id,
+            },
+        )
+
+        assert response.status_code == 200
+        assert [row["key"] for row in response.json()["rows"]] == ["9"]
+
+    async def test_utilization_invalid_range(self, client: AsyncClient, admin_headers: dict):
+        """Test 'to' before 'from' is rejected."""
+        response = await client.get(
+            "/admin/analytics/utilization",
+            headers=admin_headers,
+            params={"from": "2025-02-01", "to": "2025-01-01"},
+        )
+
+        assert response.status_code == 400
+
+    async def test_utilization_requires_admin(self, client: AsyncClient, auth_headers: dict):
+        """Test non-admins cannot read analytics."""
+        response = await client.get("/admin/analytics/utilization", headers=auth_headers)
+
+        assert response.status_code == 403
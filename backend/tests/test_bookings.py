@@ -1,11 +1,13 @@
 """Tests for booking endpoints."""
 from datetime import date, time, timedelta
 
+import msgpack
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import User, Space, Booking, BookingStatus
+from app.models import User, Space, SpaceStatus, SpaceUtility, Booking, BookingStatus
 
 
 @pytest.fixture
@@ -60,6 +62,80 @@ class TestListBookings:
         assert len(data["data"]) == 1
         assert data["data"][0]["id"] == test_booking.id
 
+    async def test_list_bookings_by_ids(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_booking: Booking,
+        approved_booking: Booking,
+    ):
+        """Test batch lookup of bookings preserves the requested order."""
+        response = await client.get(
+            "/bookings",
+            headers=auth_headers,
+            params={"ids": f"{test_booking.id},{approved_booking.id}"}
+        )
+
+        assert response.status_code == 200
+        assert [b["id"] for b in response.json()["data"]] == [test_booking.id, approved_booking.id]
+
+    async def test_list_bookings_date_range(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_booking: Booking,
+        approved_booking: Booking,
+    ):
+        """Test from/to restrict bookings to a range of dates."""
+        day = approved_booking.booking_date.isoformat()
+        response = await client.get("/bookings", headers=auth_headers, params={"from": day})
+
+        assert response.status_code == 200
+        assert [b["id"] for b in response.json()["data"]] == [approved_booking.id]
+
+        response = await client.get(
+            "/bookings", headers=auth_headers, params={"to": test_booking.booking_date.isoformat()}
+        )
+        assert [b["id"] for b in response.json()["data"]] == [test_booking.id]
+
+        response = await client.get(
+            "/bookings", headers=auth_headers,
+            params={"from": day, "to": test_booking.booking_date.isoformat()}
+        )
+        assert response.status_code == 400
+
+    async def test_list_bookings_by_ids_only_own(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict,
+        admin_headers: dict,
+        test_admin: User,
+        test_space: Space,
+        test_booking: Booking,
+    ):
+        """Test a batch never returns other users' bookings to a non-admin."""
+        other = Booking(
+            user_id=test_admin.id,
+            space_id=test_space.id,
+            booking_date=date.today() + timedelta(days=3),
+            start_time=time(8, 0),
+            end_time=time(9, 0),
+            attendees=1,
+            purpose="Admin booking",
+            status=BookingStatus.PENDING,
+        )
+        db_session.add(other)
+        await db_session.flush()
+        ids = f"{other.id},3000000000,{test_booking.id}"
+
+        response = await client.get("/bookings", headers=auth_headers, params={"ids": ids})
+        assert [b["id"] for b in response.json()["data"]] == [test_booking.id]
+
+        # Admins see any booking in a batch, not just their own
+        response = await client.get("/bookings", headers=admin_headers, params={"ids": ids})
+        assert [b["id"] for b in response.json()["data"]] == [other.id, test_booking.id]
+
     async def test_list_bookings_no_auth(self, client: AsyncClient):
         """Test listing bookings without auth fails."""
         response = await client.get("/bookings")
@@ -120,6 +196,30 @@ class TestCreateBooking:
 
         assert response.status_code == 400
 
+    async def test_create_booking_penalty_limit(
+        self, client: AsyncClient, auth_headers: dict, admin_headers: dict,
+        test_user: User, test_space: Space
+    ):
+        """Test users over the penalty point limit cannot book."""
+        await client.post("/penalties", headers=admin_headers, json={
+            "user_id": test_user.id,
+            "reason": "Repeated no-shows",
+            "points": 50,
+        })
+
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        response = await client.post("/bookings", headers=auth_headers, json={
+            "space_id": test_space.id,
+            "booking_date": tomorrow,
+            "start_time": "10:00:00",
+            "end_time": "12:00:00",
+            "attendees": 2,
+            "purpose": "Study",
+        })
+
+        assert response.status_code == 403
+        assert response.json()["detail"]["code"] == "PENALTY_LIMIT_REACHED"
+
     async def test_create_booking_time_conflict(
         self, client: AsyncClient, auth_headers: dict, test_space: Space, test_booking: Booking
     ):
@@ -135,6 +235,87 @@ class TestCreateBooking:
 
         assert response.status_code == 400
 
+    async def test_conflict_suggests_same_space(
+        self, client: AsyncClient, auth_headers: dict, test_space: Space, test_booking: Booking
+    ):
+        """Test a conflict offers the nearest free starts in the same space, nearest first."""
+        response = await client.post("/bookings", headers=auth_headers, json={
+            "space_id": test_space.id,
+            "booking_date": test_booking.booking_date.isoformat(),
+            "start_time": "10:30",
+            "end_time": "12:30",
+            "attendees": 3,
+            "purpose": "Conflicting booking",
+        })
+
+        assert response.status_code == 400
+        error = response.json()["detail"]
+        assert error["code"] == "SLOT_CONFLICT"
+        alternatives = error["details"]["alternatives"]
+        assert [(a["space_id"], a["start_time"], a["end_time"]) for a in alternatives] == [
+            (test_space.id, "12:00:00", "14:00:00"),
+            (test_space.id, "12:30:00", "14:30:00"),
+            (test_space.id, "08:00:00", "10:00:00"),
+            (test_space.id, "13:00:00", "15:00:00"),
+            # Equally far either side: the earlier start first
+            (test_space.id, "07:30:00", "09:30:00"),
+        ]
+        assert alternatives[0]["booking_date"] == test_booking.booking_date.isoformat()
+
+    async def test_conflict_suggests_similar_spaces(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict,
+        test_user: User,
+        test_space: Space,
+        test_booking: Booking,
+        test_utilities: list,
+    ):
+        """Test free spaces in the same building with the same utilities come first."""
+        wifi, ac = test_utilities[0], test_utilities[1]
+        db_session.add(SpaceUtility(space_id=test_space.id, utility_id=wifi.id))
+
+        def room(name: str, capacity: int, building: str = test_space.building, utilities=(wifi,)) -> Space:
+            return Space(
+                name=name, building=building, floor="2", capacity=capacity, status=SpaceStatus.ACTIVE,
+                space_utilities=[SpaceUtility(utility_id=u.id) for u in utilities],
+            )
+
+        roomy, snug = room("Roomy", 20, utilities=(wifi, ac)), room("Snug", 4)
+        busy = room("Busy", 8)
+        excluded = [room("Tiny", 2), room("No WiFi", 8, utilities=()), room("Elsewhere", 8, building="Other")]
+        db_session.add_all([roomy, snug, busy, *excluded])
+        await db_session.flush()
+        db_session.add(Booking(
+            user_id=test_user.id, space_id=busy.id, booking_date=test_booking.booking_date,
+            start_time=time(11, 0), end_time=time(12, 0), attendees=1, purpose="Busy",
+            status=BookingStatus.APPROVED,
+        ))
+        await db_session.flush()
+        # The route shares this session; drop the space loaded before its utility was added
+        db_session.expunge_all()
+
+        response = await client.post("/bookings", headers=auth_headers, json={
+            "space_id": test_space.id,
+            "booking_date": test_booking.booking_date.isoformat(),
+            "start_time": "10:30",
+            "end_time": "12:30",
+            "attendees": 3,
+            "purpose": "Conflicting booking",
+        })
+
+        assert response.status_code == 400
+        alternatives = response.json()["detail"]["details"]["alternatives"]
+        assert [(a["space_id"], a["start_time"]) for a in alternatives] == [
+            (snug.id, "10:30:00"),
+            (roomy.id, "10:30:00"),
+            (test_space.id, "12:00:00"),
+            (test_space.id, "12:30:00"),
+            (test_space.id, "08:00:00"),
+        ]
+        assert alternatives[0]["space_name"] == "Snug"
+
     async def test_create_booking_invalid_time(
         self, client: AsyncClient, auth_headers: dict, test_space: Space
     ):
@@ -173,6 +354,196 @@ class TestGetBooking:
         assert response.status_code == 404
 
 
+class TestSparseBookings:
+    """Tests for the fields= and include= parameters."""
+
+    @pytest.fixture
+    def statements(self, db_session: AsyncSession) -> list[str]:
+        """SQL issued on the test connection, with the identity map cleared first."""
+        db_session.expunge_all()
+        captured = []
+        connection = db_session.bind.sync_connection
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            captured.append(statement)
+
+        event.listen(connection, "before_cursor_execute", record)
+        yield captured
+        event.remove(connection, "before_cursor_execute", record)
+
+    async def test_list_selected_fields_only(
+        self, client: AsyncClient, auth_headers: dict, test_booking: Booking, statements: list[str]
+    ):
+        """Test a lean list returns the requested fields and never reads related tables."""
+        response = await client.get(
+            "/bookings?fields=id,booking_date,start_time,end_time,status", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["meta"]["total"] == 1
+        assert data["data"] == [{
+            "id": test_booking.id,
+            "booking_date": test_booking.booking_date.isoformat(),
+            "start_time": "10:00:00",
+            "end_time": "12:00:00",
+            "status": "pending",
+        }]
+        booking_queries = [s for s in statements if "FROM bookings" in s]
+        assert booking_queries
+        assert "bookings.purpose" not in booking_queries[-1]
+        assert not any("FROM spaces" in s or "FROM utilities" in s for s in statements)
+
+    async def test_fields_with_included_space(
+        self, client: AsyncClient, auth_headers: dict, test_booking: Booking, test_space: Space
+    ):
+        """Test relations named in include are embedded alongside the fields."""
+        response = await client.get(
+            f"/bookings/{test_booking.id}?fields=id,status&include=space", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {"id", "status", "space"}
+        assert data["space"]["id"] == test_space.id
+        assert "utilities" in data["space"]
+
+    async def test_include_without_fields(
+        self, client: AsyncClient, auth_headers: dict, test_booking: Booking, statements: list[str]
+    ):
+        """Test include alone narrows the relations of the full response."""
+        response = await client.get(f"/bookings/{test_booking.id}?include=", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["purpose"] == test_booking.purpose
+        assert data["space"] is None
+        assert data["user"] is None
+        assert not any("FROM spaces" in s for s in statements)
+
+    async def test_mutation_returns_selected_fields(
+        self, client: AsyncClient, auth_headers: dict, test_booking: Booking
+    ):
+        """Test mutation routes honour fields too."""
+        response = await client.patch(
+            f"/bookings/{test_booking.id}?fields=id,status",
+            json={"status": "cancelled"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"id": test_booking.id, "status": "cancelled"}
+
+    async def test_unknown_field_rejected(self, client: AsyncClient, auth_headers: dict):
+        """Test unknown fields and relations are a 400."""
+        response = await client.get("/bookings?fields=id,password", headers=auth_headers)
+        assert response.status_code == 400
+
+        response = await client.get("/bookings?include=approver", headers=auth_headers)
+        assert response.status_code == 400
+
+
+class TestBookingCalendar:
+    """Tests for GET /bookings/calendar"""
+
+    async def test_parallel_arrays(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_booking: Booking,
+        approved_booking: Booking,
+        test_space: Space,
+    ):
+        """Test bookings come back as columns of day offsets, minutes and status indexes."""
+        start = date.today()
+        response = await client.get(
+            "/bookings/calendar",
+            params={"from": start.isoformat(), "to": (start + timedelta(days=6)).isoformat()},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.headers["vary"] == "Accept"
+        data = response.json()
+        assert data["ids"] == [test_booking.id, approved_booking.id]
+        assert data["space_ids"] == [test_space.id, test_space.id]
+        assert data["days"] == [1, 2]
+        assert data["start_minutes"] == [600, 840]
+        assert data["end_minutes"] == [720, 960]
+        assert [data["status_names"][i] for i in data["statuses"]] == ["pending", "approved"]
+        assert "cancelled" not in data["status_names"]
+
+    async def test_filters(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        test_booking: Booking,
+        approved_booking: Booking,
+        test_space: Space,
+    ):
+        """Test spaceIds and statuses narrow the calendar."""
+        params = {"from": date.today().isoformat(), "to": (date.today() + timedelta(days=6)).isoformat()}
+
+        response = await client.get(
+            "/bookings/calendar", params={**params, "statuses": "approved"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["ids"] == [approved_booking.id]
+        assert response.json()["status_names"] == ["approved"]
+
+        response = await client.get(
+            "/bookings/calendar", params={**params, "spaceIds": str(test_space.id + 1)}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["ids"] == []
+
+        response = await client.get(
+            "/bookings/calendar", params={**params, "spaceIds": f"3000000000,{test_space.id}"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert set(response.json()["ids"]) == {test_booking.id, approved_booking.id}
+
+    async def test_invalid_range(self, client: AsyncClient, auth_headers: dict):
+        """Test backwards, overlong and malformed requests are a 400."""
+        today = date.today()
+        for params in (
+            {"from": today.isoformat(), "to": (today - timedelta(days=1)).isoformat()},
+            {"from": today.isoformat(), "to": (today + timedelta(days=365)).isoformat()},
+            {"from": today.isoformat(), "to": today.isoformat(), "spaceIds": "x"},
+            {"from": today.isoformat(), "to": today.isoformat(), "statuses": "lost"},
+        ):
+            response = await client.get("/bookings/calendar", params=params, headers=auth_headers)
+            assert response.status_code == 400, params
+
+    async def test_msgpack(self, client: AsyncClient, auth_headers: dict, test_booking: Booking):
+        """Test clients that accept MessagePack get the same payload packed."""
+        params = {"from": date.today().isoformat(), "to": (date.today() + timedelta(days=6)).isoformat()}
+
+        response = await client.get(
+            "/bookings/calendar", params=params, headers={**auth_headers, "Accept": "application/msgpack"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content)["ids"] == [test_booking.id]
+
+    async def test_msgpack_quality(self, client: AsyncClient, auth_headers: dict):
+        """Test Accept q-values: MessagePack only when ranked above zero and no lower than JSON."""
+        params = {"from": date.today().isoformat(), "to": (date.today() + timedelta(days=6)).isoformat()}
+        cases = {
+            "application/msgpack;q=0": "application/json",
+            "application/json, application/msgpack;q=0.5": "application/json",
+            "application/json;q=0.5, application/x-msgpack": "application/msgpack",
+            "*/*": "application/json",
+        }
+
+        for accept, media_type in cases.items():
+            response = await client.get(
+                "/bookings/calendar", params=params, headers={**auth_headers, "Accept": accept}
+            )
+            assert response.headers["content-type"] == media_type, accept
+
+
 class TestUpdateBookingStatus:
     """Tests for PATCH /bookings/{booking_id}"""
 
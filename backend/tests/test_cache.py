@@ -0,0 +1,154 @@
+"""Tests for in-process caches and the invalidation bus."""
+from typing import AsyncGenerator
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache, admin_stats_cache, caches, catalog_cache
+from app.core.database import get_primary_read_db
+from app.core.invalidation import Invalidation, InvalidationBus, InvalidationKind
+from app.main import app
+
+
+class TestInvalidationBus:
+    """Tests for the invalidation bus wire format and dispatch."""
+
+    def test_foreign_notifications_are_applied(self):
+        """Test messages from another replica reach subscribers."""
+        bus = InvalidationBus("test")
+        other = InvalidationBus("test")
+        received = []
+        bus.subscribe(received.append, InvalidationKind.SPACE)
+
+        payload = other.encode([Invalidation(InvalidationKind.SPACE, "7")])
+        bus._on_notification(None, 0, "test", payload)
+
+        assert received == [Invalidation(InvalidationKind.SPACE, "7")]
+
+    def test_own_notifications_are_ignored(self):
+        """Test a replica does not re-apply its own messages."""
+        bus = InvalidationBus("test")
+        received = []
+        bus.subscribe(received.append, InvalidationKind.SPACE)
+
+        bus._on_notification(None, 0, "test", bus.encode([Invalidation(InvalidationKind.SPACE, "7")]))
+
+        assert received == []
+
+    def test_large_batches_collapse_to_kind_flushes(self):
+        """Test oversized payloads invalidate whole kinds instead."""
+        bus = InvalidationBus("test")
+        messages = [Invalidation(InvalidationKind.USER, str(i)) for i in range(500)]
+
+        _, decoded = bus.decode(bus.encode(messages))
+
+        assert decoded == [Invalidation(InvalidationKind.USER)]
+
+    def test_malformed_payload_flushes(self):
+        """Test an unreadable payload drops every cache."""
+        bus = InvalidationBus("test")
+        flushed = []
+        bus.on_flush(lambda: flushed.append(True))
+
+        bus._on_notification(None, 0, "test", "not json")
+
+        assert flushed == [True]
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    @pytest.fixture
+    def bus(self) -> InvalidationBus:
+        """A private bus, so test caches don't subscribe to the app's."""
+        return InvalidationBus("test")
+
+    @pytest.fixture
+    def registry(self) -> dict[str, TTLCache]:
+        """A private registry, so test caches stay out of caches and /metrics."""
+        return {}
+
+    async def test_cleared_by_subscribed_kind(self, bus: InvalidationBus, registry: dict):
+        """Test the cache is cleared by messages it subscribes to."""
+        cache = TTLCache(
+            "test_cleared", ttl=60, invalidated_by=(InvalidationKind.UTILITY,), bus=bus, registry=registry
+        )
+        cache.set("key", 1)
+
+        bus.apply(Invalidation(InvalidationKind.BOOKING_DAY, "2025-01-01"))
+        assert cache.get("key") == 1
+
+        bus.apply(Invalidation(InvalidationKind.UTILITY, "3"))
+        assert cache.get("key") is None
+        assert registry == {"test_cleared": cache}
+        assert "test_cleared" not in caches
+
+    async def test_load_across_invalidation_is_not_stored(self, bus: InvalidationBus, registry: dict):
+        """Test a value loaded while the cache was invalidated is not cached."""
+        cache = TTLCache("test_race", ttl=60, bus=bus, registry=registry)
+
+        async def loader():
+            cache.clear()
+            return "stale"
+
+        assert await cache.get_or_load("key", loader) == "stale"
+        assert cache.get("key") is None
+
+    async def test_catalog_sees_new_utility(
+        self, client: AsyncClient, admin_headers: dict
+    ):
+        """Test the cached utility list reflects a newly created utility."""
+        await client.get("/utilities")
+
+        response = await client.post("/utilities", headers=admin_headers, json={
+            "key": "cache_test_utility",
+            "label": "Cache Test",
+        })
+        assert response.status_code == 201
+
+        response = await client.get("/utilities")
+        assert "cache_test_utility" in [u["key"] for u in response.json()]
+
+    async def test_filter_config_sees_new_space(
+        self, client: AsyncClient, admin_headers: dict
+    ):
+        """Test the cached filter config reflects a newly created space."""
+        await client.get("/spaces/config/filters")
+
+        response = await client.post("/spaces", headers=admin_headers, json={
+            "name": "Cache Room",
+            "building": "Cache Building",
+            "floor": "9",
+            "capacity": 4,
+        })
+        assert response.status_code == 201
+
+        response = await client.get("/spaces/config/filters")
+        assert "Cache Building" in response.json()["buildings"]
+
+    async def test_loaders_read_from_primary(
+        self, client: AsyncClient, db_session: AsyncSession, admin_headers: dict
+    ):
+        """Test cache misses are loaded on the primary, never from a lagging replica."""
+        primary = AsyncSession(bind=await db_session.connection())
+        loads = []
+        event.listen(primary.sync_session, "do_orm_execute", loads.append)
+
+        async def get_primary() -> AsyncGenerator[AsyncSession, None]:
+            yield primary
+
+        get_test_db = app.dependency_overrides[get_primary_read_db]
+        app.dependency_overrides[get_primary_read_db] = get_primary
+        catalog_cache.clear()
+        admin_stats_cache.clear()
+        try:
+            for path in ("/utilities", "/spaces/config/filters", "/spaces?facets=true", "/admin/stats"):
+                before = len(loads)
+                response = await client.get(path, headers=admin_headers)
+                assert response.status_code == 200
+                assert len(loads) > before, path
+        finally:
+            app.dependency_overrides[get_primary_read_db] = get_test_db
+            await primary.close()
@@ -0,0 +1,196 @@
+"""Tests for the /changes delta sync feeds."""
+from datetime import date, time, timedelta
+
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.models import Booking, BookingStatus, Space, SpaceStatus, User
+from app.services.changes import decode_cursor, encode_cursor, fetch_changes
+from tests.conftest import get_test_database_url
+
+
+async def add_space(db_session: AsyncSession, name: str) -> Space:
+    space = Space(name=name, building="B9", floor="1", capacity=4, status=SpaceStatus.ACTIVE)
+    db_session.add(space)
+    await db_session.flush()
+    return space
+
+
+async def add_booking(db_session: AsyncSession, user: User, space: Space, days: int) -> Booking:
+    booking = Booking(
+        user_id=user.id,
+        space_id=space.id,
+        booking_date=date.today() + timedelta(days=days),
+        start_time=time(9, 0),
+        end_time=time(10, 0),
+        attendees=1,
+        purpose="Sync",
+        status=BookingStatus.PENDING,
+    )
+    db_session.add(booking)
+    await db_session.flush()
+    return booking
+
+
+async def earlier_cursor(db_session: AsyncSession, model: type, *rows) -> str:
+    """
+    A cursor taken before this test's transaction, with ``rows`` moved back
+    to before it as if an earlier transaction had written them.
+
+    Every write in a test shares one transaction and so one ``now()``.
+    """
+    now = (await db_session.execute(select(func.now()))).scalar_one()
+    if rows:
+        await db_session.execute(
+            update(model)
+            .where(model.id.in_([row.id for row in rows]))
+            .values(updated_at=now - timedelta(hours=1))
+            .execution_options(synchronize_session=False)
+        )
+    return encode_cursor(now - timedelta(minutes=1), 0)
+
+
+async def sync(client: AsyncClient, path: str, headers: dict | None = None, **params) -> dict:
+    response = await client.get(path, headers=headers, params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestSpaceChanges:
+    """Tests for GET /spaces/changes"""
+
+    async def test_full_copy(self, client: AsyncClient, test_space: Space):
+        """Test syncing without a cursor returns every space and no deletions."""
+        data = await sync(client, "/spaces/changes")
+
+        assert test_space.id in [s["id"] for s in data["data"]]
+        assert data["deleted"] == []
+        assert data["has_more"] is False
+        assert data["cursor"]
+
+    async def test_only_changes_since_cursor(
+        self, client: AsyncClient, db_session: AsyncSession, admin_headers: dict
+    ):
+        """Test updated and deleted spaces show up after a cursor, untouched ones don't."""
+        untouched = await add_space(db_session, "Untouched")
+        updated = await add_space(db_session, "Updated")
+        deleted = await add_space(db_session, "Deleted")
+        since = await earlier_cursor(db_session, Space, untouched, updated, deleted)
+
+        data = await sync(client, "/spaces/changes", since=since)
+        assert (data["data"], data["deleted"], data["has_more"]) == ([], [], False)
+
+        response = await client.patch(f"/spaces/{updated.id}", headers=admin_headers, json={"capacity": 6})
+        assert response.status_code == 200
+        response = await client.delete(f"/spaces/{deleted.id}", headers=admin_headers)
+        assert response.status_code == 204
+
+        data = await sync(client, "/spaces/changes", since=since)
+        assert [(s["id"], s["capacity"]) for s in data["data"]] == [(updated.id, 6)]
+        assert data["deleted"] == [deleted.id]
+
+    async def test_utility_changes_bump_space(
+        self, client: AsyncClient, db_session: AsyncSession, admin_headers: dict, test_utilities
+    ):
+        """Test replacing a space's utilities counts as a change to the space."""
+        space = await add_space(db_session, "Utilities")
+        since = await earlier_cursor(db_session, Space, space)
+
+        response = await client.patch(
+            f"/spaces/{space.id}", headers=admin_headers, json={"utilities": [test_utilities[0].key]}
+        )
+        assert response.status_code == 200
+        # The feed shares this session; drop the copy loaded before the patch
+        db_session.expunge_all()
+
+        data = await sync(client, "/spaces/changes", since=since)
+        assert [s["id"] for s in data["data"]] == [space.id]
+        assert data["data"][0]["utilities"] == [test_utilities[0].key]
+
+    async def test_pages_follow_cursor(self, client: AsyncClient, db_session: AsyncSession):
+        """Test a limited feed pages through every change exactly once."""
+        spaces = [await add_space(db_session, f"Paged {n}") for n in range(3)]
+        since = await earlier_cursor(db_session, Space)
+
+        seen = []
+        while True:
+            data = await sync(client, "/spaces/changes", since=since, limit=2)
+            seen += [s["id"] for s in data["data"]]
+            since = data["cursor"]
+            if not data["has_more"]:
+                break
+
+        assert sorted(seen) == sorted(s.id for s in spaces)
+        assert (await sync(client, "/spaces/changes", since=since))["data"] == []
+
+    async def test_invalid_cursor(self, client: AsyncClient):
+        """Test a malformed cursor is rejected."""
+        response = await client.get("/spaces/changes", params={"since": "not-a-cursor"})
+        assert response.status_code == 400
+
+
+class TestBookingChanges:
+    """Tests for GET /bookings/changes"""
+
+    async def test_status_change_and_delete(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict,
+        admin_headers: dict,
+        test_user: User,
+        test_space: Space,
+    ):
+        """Test a booking's status change and deletion reach its owner's feed."""
+        approved = await add_booking(db_session, test_user, test_space, 1)
+        removed = await add_booking(db_session, test_user, test_space, 2)
+        since = await earlier_cursor(db_session, Booking, approved, removed)
+
+        response = await client.patch(
+            f"/bookings/{approved.id}", headers=admin_headers, json={"status": "approved"}
+        )
+        assert response.status_code == 200
+        assert response.json()["updated_at"]
+        response = await client.delete(f"/bookings/{removed.id}", headers=admin_headers)
+        assert response.status_code == 204
+
+        data = await sync(client, "/bookings/changes", auth_headers, since=since)
+        assert [(b["id"], b["status"]) for b in data["data"]] == [(approved.id, "approved")]
+        assert data["data"][0]["space"] is None
+        assert data["deleted"] == [removed.id]
+
+    async def test_only_own_bookings(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict,
+        test_user: User,
+        test_admin: User,
+        test_space: Space,
+    ):
+        """Test students only sync their own bookings, even with my=false."""
+        own = await add_booking(db_session, test_user, test_space, 1)
+        await add_booking(db_session, test_admin, test_space, 1)
+
+        data = await sync(client, "/bookings/changes", auth_headers, my="false", include="space")
+
+        assert [b["id"] for b in data["data"]] == [own.id]
+        assert data["data"][0]["space"]["id"] == test_space.id
+
+    async def test_horizon_waits_for_open_transactions(
+        self, db_session: AsyncSession, test_user: User, test_space: Space
+    ):
+        """Test the cursor never passes the start of a transaction still in flight."""
+        await add_booking(db_session, test_user, test_space, 1)
+        engine = create_async_engine(get_test_database_url(), poolclass=NullPool)
+        try:
+            async with engine.connect() as other:
+                other_started = (await other.execute(select(func.now()))).scalar_one()
+
+                changes = await fetch_changes(db_session, select(Booking), Booking, None, 100)
+
+                assert decode_cursor(changes.cursor)[0] <= other_started
+        finally:
+            await engine.dispose()
@@ -0,0 +1,212 @@
+"""Tests for the engine, connection pool and read routing."""
+import re
+from typing import Annotated, AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core import database, metrics
+from app.core.config import Settings
+from app.core.database import (
+    CONSISTENCY_HEADER,
+    ConsistencyTokenMiddleware,
+    InstrumentedQueuePool,
+    engine_options,
+    get_async_db,
+    get_read_db,
+)
+from app.core.exceptions import BadRequestException
+from tests.conftest import get_test_database_url
+
+
+class TestEngineOptions:
+    """Tests for engine_options()"""
+
+    def test_pool_settings_applied(self):
+        """Test pool sizing and health-check settings come from Settings."""
+        options = engine_options(Settings(
+            DB_POOL_SIZE=3,
+            DB_MAX_OVERFLOW=1,
+            DB_POOL_TIMEOUT=2.5,
+            DB_POOL_RECYCLE=600,
+            DB_POOL_PRE_PING=False,
+            DB_STATEMENT_CACHE_SIZE=50,
+        ))
+        assert options["poolclass"] is InstrumentedQueuePool
+        assert options["pool_size"] == 3
+        assert options["max_overflow"] == 1
+        assert options["pool_timeout"] == 2.5
+        assert options["pool_recycle"] == 600
+        assert options["pool_pre_ping"] is False
+        assert options["connect_args"]["statement_cache_size"] == 50
+        assert options["connect_args"]["prepared_statement_cache_size"] == 50
+
+    def test_connection_budget_split_across_workers(self):
+        """Test each worker's pool is capped at its share of the connection budget."""
+        options = engine_options(Settings(
+            DB_POOL_SIZE=10, DB_MAX_OVERFLOW=20, DB_CONNECTION_BUDGET=100, WEB_CONCURRENCY=8,
+        ))
+        assert options["pool_size"] == 10
+        assert options["max_overflow"] == 2
+
+        options = engine_options(Settings(
+            DB_POOL_SIZE=10, DB_MAX_OVERFLOW=20, DB_CONNECTION_BUDGET=20, WEB_CONCURRENCY=4,
+        ))
+        assert options["pool_size"] == 5
+        assert options["max_overflow"] == 0
+
+    def test_pgbouncer_mode(self):
+        """Test PgBouncer mode disables statement caches and uses unique names."""
+        connect_args = engine_options(Settings(DB_PGBOUNCER=True))["connect_args"]
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        name_func = connect_args["prepared_statement_name_func"]
+        assert name_func() != name_func()
+
+    async def test_pgbouncer_mode_connects(self):
+        """Test an engine in PgBouncer mode runs parameterized queries."""
+        engine = create_async_engine(get_test_database_url(), **engine_options(Settings(DB_PGBOUNCER=True)))
+        try:
+            async with engine.connect() as connection:
+                for value in (1, 2):
+                    result = await connection.execute(text("SELECT :value + 1"), {"value": value})
+                    assert result.scalar_one() == value + 1
+        finally:
+            await engine.dispose()
+
+    async def test_pool_wait_recorded(self):
+        """Test each checkout from the instrumented pool records its wait time."""
+        engine = create_async_engine(get_test_database_url(), **engine_options(Settings()))
+        before = metrics.db_pool_wait.count(engine="primary")
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        finally:
+            await engine.dispose()
+        assert metrics.db_pool_wait.count(engine="primary") == before + 2
+
+
+class TestReadRouting:
+    """Tests for read-only sessions, replica routing and consistency tokens"""
+
+    @pytest_asyncio.fixture
+    async def routed_client(self, monkeypatch) -> AsyncGenerator[AsyncClient, None]:
+        """A small app using the real dependencies, with primary and "replica" on the test database."""
+        primary = create_async_engine(get_test_database_url(), poolclass=NullPool, pool_logging_name="primary")
+        replica = create_async_engine(get_test_database_url(), poolclass=NullPool, pool_logging_name="replica")
+        self.checkouts = 0
+
+        @event.listens_for(primary.sync_engine, "checkout")
+        @event.listens_for(replica.sync_engine, "checkout")
+        def count_checkout(*args):
+            self.checkouts += 1
+
+        monkeypatch.setattr(database, "AsyncSessionLocal", async_sessionmaker(
+            bind=primary, class_=AsyncSession, expire_on_commit=False,
+        ))
+        monkeypatch.setattr(database, "replica_engine", replica)
+        monkeypatch.setattr(database, "primary_read_engine", primary.execution_options(postgresql_readonly=True))
+        monkeypatch.setattr(database, "replica_read_engine", replica.execution_options(postgresql_readonly=True))
+
+        app = FastAPI()
+        app.add_middleware(ConsistencyTokenMiddleware)
+
+        def role(db: AsyncSession) -> str:
+            return db.get_bind().pool.logging_name
+
+        @app.get("/read")
+        async def read(db: Annotated[AsyncSession, Depends(get_async_db)]):
+            await db.execute(text("SELECT 1"))
+            return {"role": role(db)}
+
+        @app.get("/cached")
+        async def cached(db: Annotated[AsyncSession, Depends(get_async_db)]):
+            return {}
+
+        @app.get("/write-in-get")
+        async def write_in_get(db: Annotated[AsyncSession, Depends(get_async_db)]):
+            await db.execute(text("CREATE TEMPORARY TABLE read_only_check (id int)"))
+            return {}
+
+        @app.post("/write")
+        async def write(db: Annotated[AsyncSession, Depends(get_async_db)], fail: bool = False):
+            await db.execute(text("SELECT 1"))
+            if fail:
+                raise BadRequestException(detail="Nope")
+            return {"role": role(db)}
+
+        @app.post("/search")
+        async def search(db: Annotated[AsyncSession, Depends(get_read_db)]):
+            await db.execute(text("SELECT 1"))
+            return {"role": role(db)}
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+        await primary.dispose()
+        await replica.dispose()
+
+    async def test_reads_use_replica_writes_use_primary(self, routed_client: AsyncClient):
+        """Test GET goes to the replica and POST to the primary."""
+        assert (await routed_client.get("/read")).json() == {"role": "replica"}
+        assert (await routed_client.post("/write")).json() == {"role": "primary"}
+
+    async def test_read_db_on_any_method(self, routed_client: AsyncClient):
+        """Test routes declaring get_read_db are served read-only whatever the method."""
+        response = await routed_client.post("/search")
+        assert response.json() == {"role": "replica"}
+        assert CONSISTENCY_HEADER not in response.headers
+
+    async def test_read_sessions_are_read_only(self, routed_client: AsyncClient):
+        """Test a read session refuses writes."""
+        with pytest.raises(DBAPIError, match="read-only transaction"):
+            await routed_client.get("/write-in-get")
+
+    async def test_connection_checked_out_on_first_use(self, routed_client: AsyncClient):
+        """Test a request that never queries never checks out a connection."""
+        await routed_client.get("/cached", headers={CONSISTENCY_HEADER: "0/1"})
+        assert self.checkouts == 0
+        await routed_client.get("/read")
+        assert self.checkouts == 1
+
+    async def test_write_returns_token(self, routed_client: AsyncClient):
+        """Test a successful write returns the primary's WAL position."""
+        response = await routed_client.post("/write")
+        assert response.status_code == 200
+        assert re.fullmatch(r"[0-9A-F]+/[0-9A-F]+", response.headers[CONSISTENCY_HEADER])
+
+    async def test_failed_write_has_no_token(self, routed_client: AsyncClient):
+        """Test error responses don't carry a token."""
+        response = await routed_client.post("/write", params={"fail": True})
+        assert response.status_code == 400
+        assert CONSISTENCY_HEADER not in response.headers
+
+    async def test_read_with_token_waits_for_replica(self, routed_client: AsyncClient):
+        """Test a read with a token is served by a replica that has caught up."""
+        token = (await routed_client.post("/write")).headers[CONSISTENCY_HEADER]
+        before = metrics.db_reads.get(engine="replica", reason="caught_up")
+
+        response = await routed_client.get("/read", headers={CONSISTENCY_HEADER: token})
+        assert response.json() == {"role": "replica"}
+        assert metrics.db_reads.get(engine="replica", reason="caught_up") == before + 1
+
+    async def test_read_falls_back_to_primary(self, routed_client: AsyncClient, monkeypatch):
+        """Test a read falls back to the primary when the replica stays behind."""
+        monkeypatch.setattr(database, "_replica_caught_up", lambda connection, token: False)
+        monkeypatch.setattr(database.settings, "REPLICA_MAX_WAIT_MS", 20)
+
+        response = await routed_client.get("/read", headers={CONSISTENCY_HEADER: "0/16B3748"})
+        assert response.json() == {"role": "primary"}
+
+    async def test_invalid_token_ignored(self, routed_client: AsyncClient):
+        """Test a malformed token doesn't reach the database."""
+        response = await routed_client.get("/read", headers={CONSISTENCY_HEADER: "'; DROP TABLE users"})
+        assert response.status_code == 200
+        assert response.json() == {"role": "replica"}
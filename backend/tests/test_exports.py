@@ -0,0 +1,150 @@
+"""Tests for streaming exports."""
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Space, User
+from app.services.exports import iter_export
+from app.schemas import ExportFormat
+
+
+async def create_booking(client: AsyncClient, headers: dict, space: Space, days: int, start: str, end: str) -> dict:
+    response = await client.post("/bookings", headers=headers, json={
+        "space_id": space.id,
+        "booking_date": (date.today() + timedelta(days=days)).isoformat(),
+        "start_time": start,
+        "end_time": end,
+        "attendees": 1,
+        "purpose": "Export",
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestBookingExport:
+    """Tests for GET /admin/exports/bookings"""
+
+    async def test_export_csv(
+        self, client: AsyncClient, auth_headers: dict, admin_headers: dict,
+        test_space: Space, test_user: User
+    ):
+        """Test bookings are exported as CSV with a header row."""
+        booking = await create_booking(client, auth_headers, test_space, 1, "10:00", "11:00")
+
+        response = await client.get(
+            "/admin/exports/bookings",
+            headers=admin_headers,
+            params={"from": (date.today() + timedelta(days=1)).isoformat()},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "bookings.csv" in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        row = next(r for r in rows if r["id"] == str(booking["id"]))
+        assert row["status"] == "pending"
+        assert row["user_email"] == test_user.email
+        assert row["space_name"] == test_space.name
+        assert row["start_time"] == "10:00:00"
+
+    async def test_export_ndjson_filters(
+        self, client: AsyncClient, auth_headers: dict, admin_headers: dict, test_space: Space
+    ):
+        """Test date and status filters with NDJSON output."""
+        first = await create_booking(client, auth_headers, test_space, 3, "10:00", "11:00")
+        second = await create_booking(client, auth_headers, test_space, 3, "12:00", "13:00")
+        await create_booking(client, auth_headers, test_space, 4, "10:00", "11:00")
+        await client.patch(f"/bookings/{second['id']}", headers=admin_headers, json={"status": "approved"})
+        day = (date.today() + timedelta(days=3)).isoformat()
+
+        response = await client.get(
+            "/admin/exports/bookings",
+            headers=admin_headers,
+            params={"format": "ndjson", "from": day, "to": day, "status": "pending"},
+        )
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        ids = [line["id"] for line in lines]
+        assert first["id"] in ids
+        assert second["id"] not in ids
+        assert all(line["booking_date"] == day for line in lines)
+
+    async def test_export_invalid_range(self, client: AsyncClient, admin_headers: dict):
+        """Test 'to' before 'from' is rejected."""
+        response = await client.get(
+            "/admin/exports/bookings",
+            headers=admin_headers,
+            params={"from": "2025-02-01", "to": "2025-01-01"},
+        )
+
+        assert response.status_code == 400
+
+    async def test_export_requires_admin(self, client: AsyncClient, auth_headers: dict):
+        """Test non-admins cannot export."""
+        response = await client.get("/admin/exports/bookings", headers=auth_headers)
+
+        assert response.status_code == 403
+
+
+class TestPenaltyAndRatingExport:
+    """Tests for penalty and rating exports."""
+
+    async def test_export_penalties(
+        self, client: AsyncClient, admin_headers: dict, test_user: User
+    ):
+        """Test penalties are exported with their status."""
+        await client.post("/penalties", headers=admin_headers, json={
+            "user_id": test_user.id,
+            "reason": "Late",
+            "points": 5,
+        })
+
+        response = await client.get(
+            "/admin/exports/penalties",
+            headers=admin_headers,
+            params={"format": "ndjson", "status": "active", "from": date.today().isoformat()},
+        )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        mine = [line for line in lines if line["user_id"] == test_user.id]
+        assert len(mine) == 1
+        assert mine[0]["points"] == 5
+        assert mine[0]["status"] == "active"
+
+    async def test_export_ratings(
+        self, client: AsyncClient, admin_headers: dict, test_user: User
+    ):
+        """Test ratings are exported."""
+        await client.post("/ratings", headers=admin_headers, json={
+            "rated_user_id": test_user.id,
+            "rating": 4,
+            "comment": "Tidy, quiet",
+        })
+
+        response = await client.get("/admin/exports/ratings", headers=admin_headers)
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        mine = [row for row in rows if row["rated_user_id"] == str(test_user.id)]
+        assert mine[0]["comment"] == "Tidy, quiet"
+
+
+async def test_iter_export_yields_per_batch(
+    client: AsyncClient, auth_headers: dict, db_session: AsyncSession, test_space: Space
+):
+    """Test rows are encoded one fetched batch at a time."""
+    from sqlalchemy import select
+    from app.models import Booking
+
+    for hour in (8, 9, 10):
+        await create_booking(client, auth_headers, test_space, 5, f"{hour:02d}:00", f"{hour:02d}:30")
+
+    query = select(Booking.id).where(Booking.space_id == test_space.id).order_by(Booking.id)
+    chunks = [chunk async for chunk in iter_export(db_session, query, ExportFormat.CSV, batch_size=2)]
+
+    assert chunks[0] == "id\r\n"
+    assert [len(chunk.splitlines()) for chunk in chunks[1:]] == [2, 1]
@@ -0,0 +1,131 @@
+"""Tests for the /metrics endpoint and in-process metrics."""
+import pytest
+from httpx import AsyncClient
+
+from app.core import metrics
+from app.core.cache import TTLCache, caches
+from app.core.metrics import Registry, timed_job
+from app.models import Space, User
+
+
+def sample(text: str, line_prefix: str) -> float:
+    """Value of the first exposition line starting with ``line_prefix``."""
+    for line in text.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{line_prefix} not found in metrics output")
+
+
+class TestRegistry:
+    """Tests for the exposition format."""
+
+    def test_render_counter_gauge_histogram(self):
+        """Test each metric type renders in the Prometheus text format."""
+        registry = Registry()
+        counter = registry.counter("jobs", "Jobs run", ["kind"])
+        gauge = registry.gauge("queue_depth", "Queued items")
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        gauge.set(5)
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(3)
+
+        text = registry.render()
+        assert "# HELP jobs_total Jobs run" in text
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{kind="a"} 3' in text
+        assert "queue_depth 5" in text
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="1"} 2' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+        assert "latency_seconds_count 3" in text
+        assert "latency_seconds_sum 3.55" in text
+
+    def test_label_values_escaped(self):
+        """Test quotes and backslashes in label values are escaped."""
+        registry = Registry()
+        registry.gauge("g", "Gauge", ["path"]).set(1, path='a"b\\c')
+        assert 'g{path="a\\"b\\\\c"} 1' in registry.render()
+
+    def test_wrong_labels_rejected(self):
+        """Test observing with the wrong label names fails loudly."""
+        registry = Registry()
+        counter = registry.counter("c", "Counter", ["kind"])
+        with pytest.raises(ValueError):
+            counter.inc(other="x")
+
+    async def test_timed_job_records_outcome(self):
+        """Test job durations are recorded with their outcome."""
+        @timed_job("test_job")
+        async def succeed():
+            return 1
+
+        @timed_job("test_job")
+        async def fail():
+            raise RuntimeError("boom")
+
+        before_ok = metrics.job_duration.count(job="test_job", outcome="success")
+        before_err = metrics.job_duration.count(job="test_job", outcome="error")
+        assert await succeed() == 1
+        with pytest.raises(RuntimeError):
+            await fail()
+        assert metrics.job_duration.count(job="test_job", outcome="success") == before_ok + 1
+        assert metrics.job_duration.count(job="test_job", outcome="error") == before_err + 1
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics"""
+
+    async def test_metrics_exposition(self, client: AsyncClient):
+        """Test the endpoint serves the text format with pool gauges."""
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+        assert "db_pool_size " in response.text
+        assert "db_pool_checked_out " in response.text
+
+    async def test_requests_labelled_by_route_template(self, client: AsyncClient, test_space: Space):
+        """Test latency is recorded per route template, not per raw path."""
+        prefix = 'http_request_duration_seconds_count{method="GET",route="/spaces/{space_id}"}'
+        before = metrics.http_request_duration.count(method="GET", route="/spaces/{space_id}")
+
+        response = await client.get(f"/spaces/{test_space.id}")
+        assert response.status_code == 200
+
+        text = (await client.get("/metrics")).text
+        assert sample(text, prefix) == before + 1
+        assert f"/spaces/{test_space.id}" not in text
+        assert 'http_requests_total{method="GET",route="/spaces/{space_id}",status="200"}' in text
+        assert 'http_requests_in_flight{method="GET",route="/spaces/{space_id}"} 0' in text
+
+    async def test_login_records_bcrypt_timing(self, client: AsyncClient, test_user: User):
+        """Test password verification runs on the bcrypt pool and is timed."""
+        before = metrics.bcrypt_duration.count(operation="verify")
+        response = await client.post("/auth/login", json={
+            "email": test_user.email,
+            "password": "password123",
+        })
+        assert response.status_code == 200
+        assert metrics.bcrypt_duration.count(operation="verify") == before + 1
+        assert metrics.bcrypt_queue_wait.count(operation="verify") >= before + 1
+
+    async def test_cache_hit_ratio(self, client: AsyncClient):
+        """Test cache hits and misses are reported with a ratio."""
+        cache = TTLCache("metrics_test", ttl=60)
+        try:
+            cache.set("a", 1)
+            cache.get("a")
+            cache.get("a")
+            cache.get("a")
+            cache.get("missing")
+
+            text = (await client.get("/metrics")).text
+            assert sample(text, 'cache_hits_total{cache="metrics_test"}') == 3
+            assert sample(text, 'cache_misses_total{cache="metrics_test"}') == 1
+            assert sample(text, 'cache_hit_ratio{cache="metrics_test"}') == 0.75
+        finally:
+            caches.pop("metrics_test")
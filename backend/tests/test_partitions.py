@@ -0,0 +1,90 @@
+"""Tests for the monthly partitions of the bookings table."""
+from datetime import date, time
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Booking, BookingStatus, Space, User
+from app.services.partitions import (
+    DEFAULT_PARTITION,
+    archive_partitions,
+    ensure_partitions,
+    list_partitions,
+    next_month,
+)
+
+
+async def add_booking(db_session: AsyncSession, user: User, space: Space, day: date) -> Booking:
+    booking = Booking(
+        user_id=user.id,
+        space_id=space.id,
+        booking_date=day,
+        start_time=time(10, 0),
+        end_time=time(12, 0),
+        attendees=2,
+        purpose="Partitioned",
+        status=BookingStatus.PENDING,
+    )
+    db_session.add(booking)
+    await db_session.flush()
+    return booking
+
+
+async def stored_in(db_session: AsyncSession, booking: Booking) -> str:
+    """Name of the partition holding a booking."""
+    result = await db_session.execute(
+        text("SELECT tableoid::regclass::text FROM bookings WHERE id = :id"), {"id": booking.id}
+    )
+    return result.scalar_one()
+
+
+class TestPartitions:
+    """Tests for creating and archiving booking partitions."""
+
+    async def test_unpartitioned_dates_use_default(
+        self, db_session: AsyncSession, test_user: User, test_space: Space
+    ):
+        """Test a booking outside every month partition lands in the default one."""
+        booking = await add_booking(db_session, test_user, test_space, date(2031, 5, 12))
+
+        assert await stored_in(db_session, booking) == DEFAULT_PARTITION
+        partitions = await list_partitions(db_session)
+        assert partitions[-1].name == DEFAULT_PARTITION
+        assert partitions[-1].start is None
+
+    async def test_ensure_moves_rows_out_of_default(
+        self, db_session: AsyncSession, test_user: User, test_space: Space
+    ):
+        """Test creating a month's partition takes over its rows from the default one."""
+        booking = await add_booking(db_session, test_user, test_space, date(2031, 5, 12))
+        later = await add_booking(db_session, test_user, test_space, date(2031, 7, 1))
+
+        created = await ensure_partitions(db_session, date(2031, 5, 1), date(2031, 6, 30))
+
+        assert created == ["bookings_2031_05", "bookings_2031_06"]
+        assert await stored_in(db_session, booking) == "bookings_2031_05"
+        assert await stored_in(db_session, later) == DEFAULT_PARTITION
+        assert await ensure_partitions(db_session, date(2031, 5, 1), date(2031, 6, 30)) == []
+
+        partition = next(p for p in await list_partitions(db_session) if p.name == "bookings_2031_05")
+        assert (partition.start, partition.end) == (date(2031, 5, 1), date(2031, 6, 1))
+
+    async def test_archive_detaches_old_months(
+        self, db_session: AsyncSession, test_user: User, test_space: Space
+    ):
+        """Test archived months leave the bookings table but stay queryable."""
+        await ensure_partitions(db_session, date(2001, 1, 1), date(2001, 1, 1))
+        booking = await add_booking(db_session, test_user, test_space, date(2001, 1, 15))
+        booking_id = booking.id
+        db_session.expunge(booking)
+
+        archived = await archive_partitions(db_session, next_month(date(2001, 1, 1)))
+
+        assert archived == ["archive.bookings_2001_01"]
+        assert "bookings_2001_01" not in {p.name for p in await list_partitions(db_session)}
+        result = await db_session.execute(select(Booking).where(Booking.id == booking_id))
+        assert result.scalar_one_or_none() is None
+        result = await db_session.execute(
+            text("SELECT count(*) FROM archive.bookings_2001_01 WHERE id = :id"), {"id": booking_id}
+        )
+        assert result.scalar_one() == 1
@@ -1,8 +1,11 @@
 """Tests for spaces and utilities endpoints."""
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import User, Space, Utility
+from app.core.cache import catalog_cache
+from app.models import User, Space, SpaceStatus, SpaceUtility, Utility
 
 
 class TestListSpaces:
@@ -60,6 +63,189 @@ class TestListSpaces:
         data = response.json()
         assert len(data["data"]) == 0
 
+    async def test_list_spaces_by_ids(self, client: AsyncClient, db_session, test_space: Space):
+        """Test a batch lookup returns the spaces in request order, skipping unknown ids."""
+        other = Space(name="Other Room", building="Other", floor="2", capacity=4)
+        db_session.add(other)
+        await db_session.flush()
+
+        response = await client.get("/spaces", params={"ids": f"{other.id},99999,{test_space.id},{other.id}"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [s["id"] for s in data["data"]] == [other.id, test_space.id]
+        assert data["meta"]["total"] == 2
+
+    async def test_list_spaces_by_ids_past_int4(self, client: AsyncClient, test_space: Space):
+        """Test ids too large for a 32-bit integer are unknown ids, not an error."""
+        response = await client.get("/spaces", params={"ids": f"3000000000,{test_space.id}"})
+
+        assert response.status_code == 200
+        assert [s["id"] for s in response.json()["data"]] == [test_space.id]
+
+    async def test_list_spaces_bad_ids(self, client: AsyncClient):
+        """Test malformed or oversized id lists are rejected."""
+        response = await client.get("/spaces", params={"ids": "1,abc"})
+        assert response.status_code == 400
+
+        response = await client.get("/spaces", params={"ids": ",".join(map(str, range(101)))})
+        assert response.status_code == 400
+
+        response = await client.get("/spaces", params={"ids": str(2**63)})
+        assert response.status_code == 400
+
+
+class TestSpaceFacets:
+    """Tests for GET /spaces?facets=true"""
+
+    @pytest.fixture
+    async def catalog(self, db_session, test_utilities: list[Utility]) -> list[Space]:
+        """Four spaces over two buildings, the first two with WiFi."""
+        catalog_cache.clear()
+        wifi = test_utilities[0]
+        spaces = [
+            Space(name="Facet A1", building="Facet A", floor="1", capacity=4,
+                  space_utilities=[SpaceUtility(utility_id=wifi.id)]),
+            Space(name="Facet A2", building="Facet A", floor="2", capacity=20,
+                  space_utilities=[SpaceUtility(utility_id=wifi.id)]),
+            Space(name="Facet A3", building="Facet A", floor="2", capacity=40),
+            Space(name="Facet B1", building="Facet B", floor="1", capacity=8),
+        ]
+        db_session.add_all(spaces)
+        await db_session.flush()
+        return spaces
+
+    async def test_counts(self, client: AsyncClient, catalog: list[Space], test_utilities: list[Utility]):
+        """Test each facet counts the spaces behind its options."""
+        response = await client.get("/spaces", params={"facets": "true", "limit": 1})
+
+        assert response.status_code == 200
+        facets = response.json()["facets"]
+        assert facets["buildings"] == [
+            {"value": "Facet A", "count": 3, "floors": [
+                {"value": "1", "count": 1}, {"value": "2", "count": 2},
+            ]},
+            {"value": "Facet B", "count": 1, "floors": [{"value": "1", "count": 1}]},
+        ]
+        assert [(c["value"], c["min"], c["max"], c["count"]) for c in facets["capacity"]] == [
+            ("1-10", 1, 10, 2), ("11-30", 11, 30, 1), ("31+", 31, None, 1),
+        ]
+        assert facets["utilities"] == [{"value": test_utilities[0].key, "count": 2}]
+
+    async def test_counts_follow_other_filters(
+        self, client: AsyncClient, catalog: list[Space], test_utilities: list[Utility]
+    ):
+        """Test each facet applies the other facets' filters but not its own."""
+        response = await client.get("/spaces", params={
+            "facets": "true", "building": "Facet A", "utilities": test_utilities[0].key,
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["meta"]["total"] == 2
+        facets = data["facets"]
+        # Other buildings stay visible, narrowed to spaces with WiFi
+        assert [(b["value"], b["count"]) for b in facets["buildings"]] == [("Facet A", 2), ("Facet B", 0)]
+        assert [c["count"] for c in facets["capacity"]] == [1, 1, 0]
+        assert facets["utilities"] == [{"value": test_utilities[0].key, "count": 2}]
+
+    async def test_utility_counts_narrow(
+        self, client: AsyncClient, db_session, catalog: list[Space], test_utilities: list[Utility]
+    ):
+        """Test utility counts apply the utility filter too, since utilities combine with AND."""
+        wifi, ac = test_utilities[0], test_utilities[1]
+        db_session.add_all([
+            SpaceUtility(space_id=catalog[0].id, utility_id=ac.id),
+            Space(name="Facet B2", building="Facet B", floor="1", capacity=8,
+                  space_utilities=[SpaceUtility(utility_id=ac.id)]),
+        ])
+        await db_session.flush()
+
+        response = await client.get("/spaces", params={"facets": "true", "utilities": wifi.key})
+
+        counts = {u["value"]: u["count"] for u in response.json()["facets"]["utilities"]}
+        # Only Facet A1 has both; Facet B2 has air conditioning without WiFi
+        assert counts == {wifi.key: 2, ac.key: 1}
+
+    async def test_facets_cached_with_catalog(
+        self, client: AsyncClient, db_session, admin_headers: dict, catalog: list[Space]
+    ):
+        """Test facets are served from the catalog cache until a space changes."""
+        params = {"facets": "true", "capacityMin": 1}
+        first = (await client.get("/spaces", params=params)).json()["facets"]
+
+        # A Core insert skips the ORM's cache invalidation
+        await db_session.execute(
+            insert(Space).values(name="Facet B2", building="Facet B", floor="1", capacity=8, status=SpaceStatus.ACTIVE)
+        )
+        assert (await client.get("/spaces", params=params)).json()["facets"] == first
+
+        response = await client.patch(f"/spaces/{catalog[3].id}", headers=admin_headers, json={"capacity": 9})
+        assert response.status_code == 200
+        buildings = (await client.get("/spaces", params=params)).json()["facets"]["buildings"]
+        assert [(b["value"], b["count"]) for b in buildings] == [("Facet A", 3), ("Facet B", 2)]
+
+    async def test_search_facets_not_cached(self, client: AsyncClient, db_session, catalog: list[Space]):
+        """Test facets of a free-text search are counted fresh and kept out of the catalog cache."""
+        params = {"facets": "true", "q": "Facet"}
+        await client.get("/spaces", params=params)
+
+        await db_session.execute(
+            insert(Space).values(name="Facet B2", building="Facet B", floor="1", capacity=8, status=SpaceStatus.ACTIVE)
+        )
+        buildings = (await client.get("/spaces", params=params)).json()["facets"]["buildings"]
+        assert [(b["value"], b["count"]) for b in buildings] == [("Facet A", 3), ("Facet B", 2)]
+        assert catalog_cache.get(("space_facets", "Facet", None, None, None, None, None, None)) is None
+
+    async def test_no_facets_by_default(self, client: AsyncClient, catalog: list[Space]):
+        """Test facets are only computed when asked for."""
+        response = await client.get("/spaces")
+
+        assert response.status_code == 200
+        assert response.json()["facets"] is None
+
+
+class TestSpacesBootstrap:
+    """Tests for GET /spaces/bootstrap"""
+
+    async def test_bootstrap_matches_separate_requests(
+        self, client: AsyncClient, admin_headers: dict, test_space: Space, test_utilities: list[Utility]
+    ):
+        """Test the bootstrap carries the filters, utilities and first page of spaces."""
+        keys = sorted(u.key for u in test_utilities[:2])
+        await client.post("/spaces", headers=admin_headers, json={
+            "name": "Bootstrap Room",
+            "building": "Building B",
+            "floor": "3",
+            "capacity": 8,
+            "utilities": keys,
+        })
+
+        response = await client.get("/spaces/bootstrap", params={"limit": 10})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["filters"] == (await client.get("/spaces/config/filters")).json()
+        assert data["utilities"] == (await client.get("/utilities")).json()
+        assert data["spaces"]["meta"] == {"total": 2, "limit": 10, "offset": 0}
+
+        listed = (await client.get("/spaces", params={"limit": 10})).json()["data"]
+        assert [s["id"] for s in data["spaces"]["data"]] == [s["id"] for s in listed]
+        room = data["spaces"]["data"][1]
+        assert room["utilities"] == keys
+        assert room["status"] == "active"
+        assert data["spaces"]["data"][0]["utilities"] == []
+
+    async def test_bootstrap_applies_filters(self, client: AsyncClient, test_space: Space):
+        """Test the list parameters narrow the spaces but not the filter options."""
+        response = await client.get("/spaces/bootstrap", params={"building": "Nonexistent"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["spaces"]["data"] == []
+        assert data["spaces"]["meta"]["total"] == 0
+        assert test_space.building in data["filters"]["buildings"]
+
 
 class TestGetSpace:
     """Tests for GET /spaces/{space_id}"""
@@ -246,3 +432,153 @@ class TestUtilities:
         response = await client.delete(f"/utilities/{utility_id}", headers=admin_headers)
 
         assert response.status_code == 204
+
+
+class TestImport:
+    """Tests for POST /spaces/import and POST /utilities/import"""
+
+    async def test_import_spaces_csv(
+        self, client: AsyncClient, admin_headers: dict, test_utilities: list[Utility]
+    ):
+        """Test spaces are created with utilities and bad rows are reported."""
+        wifi, ac = test_utilities[0].key, test_utilities[1].key
+        content = (
+            "name,building,floor,capacity,status,utilities\n"
+            f"Room 101,Import Hall,1,8,active,{wifi}|{ac}\n"
+            "Room 102,Import Hall,1,0,active,\n"
+            "Room 103,Import Hall,1,4,maintenance,missing_utility\n"
+            "Room 101,Import Hall,2,6,active,\n"
+        )
+
+        response = await client.post(
+            "/spaces/import",
+            headers=admin_headers,
+            files={"file": ("rooms.csv", content, "text/csv")},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 1
+        assert data["updated"] == 0
+        assert [error["row"] for error in data["errors"]] == [2, 3, 4]
+        assert "missing_utility" in data["errors"][1]["message"]
+
+        spaces = (await client.get("/spaces", params={"building": "Import Hall"})).json()["data"]
+        assert len(spaces) == 1
+        assert sorted(spaces[0]["utilities"]) == sorted([wifi, ac])
+
+    async def test_import_spaces_ragged_csv(self, client: AsyncClient, admin_headers: dict):
+        """Test short and long CSV rows are reported per row, not failing the upload."""
+        content = (
+            "name,building,floor,capacity\n"
+            "Room 201,Ragged Hall\n"
+            "Room 202,Ragged Hall,2,6,extra\n"
+            "Room 203,Ragged Hall,2,6\n"
+        )
+
+        response = await client.post(
+            "/spaces/import",
+            headers=admin_headers,
+            files={"file": ("rooms.csv", content, "text/csv")},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 1
+        assert [error["row"] for error in data["errors"]] == [1, 2]
+        assert "more cells than the header" in data["errors"][1]["message"]
+
+    async def test_import_spaces_updates_existing(
+        self, client: AsyncClient, admin_headers: dict, test_space: Space
+    ):
+        """Test rows matching (building, name) update the existing space."""
+        space_id, utilities = test_space.id, [u.key for u in test_space.utilities]
+        content = (
+            '[{"name": "%s", "building": "%s", "floor": "9", "capacity": 42}]'
+            % (test_space.name, test_space.building)
+        )
+
+        response = await client.post(
+            "/spaces/import",
+            headers=admin_headers,
+            files={"file": ("rooms.json", content, "application/json")},
+        )
+
+        assert response.json() == {"created": 0, "updated": 1, "errors": []}
+        space = (await client.get(f"/spaces/{space_id}")).json()
+        assert space["capacity"] == 42
+        assert space["floor"] == "9"
+        # No utilities column: existing links are kept
+        assert space["utilities"] == utilities
+
+    async def test_import_spaces_ambiguous_match(
+        self, client: AsyncClient, db_session: AsyncSession, admin_headers: dict
+    ):
+        """Test rows matching several existing spaces are reported and left alone."""
+        db_session.add_all([
+            Space(name="Twin Room", building="Twin Hall", floor="1", capacity=4),
+            Space(name="Twin Room", building="Twin Hall", floor="2", capacity=4),
+        ])
+        await db_session.flush()
+        content = (
+            "name,building,floor,capacity\n"
+            "Twin Room,Twin Hall,3,10\n"
+            "Single Room,Twin Hall,3,10\n"
+        )
+
+        response = await client.post(
+            "/spaces/import",
+            headers=admin_headers,
+            files={"file": ("rooms.csv", content, "text/csv")},
+        )
+
+        data = response.json()
+        assert (data["created"], data["updated"]) == (1, 0)
+        assert [error["row"] for error in data["errors"]] == [1]
+        assert "2 existing spaces" in data["errors"][0]["message"]
+        spaces = (await client.get("/spaces", params={"building": "Twin Hall"})).json()["data"]
+        assert sorted((s["name"], s["capacity"]) for s in spaces) == [
+            ("Single Room", 10), ("Twin Room", 4), ("Twin Room", 4),
+        ]
+
+    async def test_import_invalid_file(self, client: AsyncClient, admin_headers: dict):
+        """Test malformed JSON is rejected."""
+        response = await client.post(
+            "/spaces/import",
+            headers=admin_headers,
+            files={"file": ("rooms.json", '{"name": "x"}', "application/json")},
+        )
+
+        assert response.status_code == 400
+
+    async def test_import_requires_admin(self, client: AsyncClient, auth_headers: dict):
+        """Test non-admins cannot import."""
+        response = await client.post(
+            "/spaces/import",
+            headers=auth_headers,
+            files={"file": ("rooms.csv", "name\n", "text/csv")},
+        )
+
+        assert response.status_code == 403
+
+    async def test_import_utilities(
+        self, client: AsyncClient, admin_headers: dict, test_utilities: list[Utility]
+    ):
+        """Test utilities are upserted by key."""
+        existing = test_utilities[0].key
+        content = (
+            "key,label,description\n"
+            f"{existing},Fast WiFi,\n"
+            f"{existing}_new,Projector,HDMI\n"
+        )
+
+        response = await client.post(
+            "/utilities/import",
+            headers=admin_headers,
+            files={"file": ("utilities.csv", content, "text/csv")},
+        )
+
+        assert response.json() == {"created": 1, "updated": 1, "errors": []}
+        labels = {u["key"]: u["label"] for u in (await client.get("/utilities")).json()}
+        assert labels[existing] == "Fast WiFi"
+        assert labels[f"{existing}_new"] == "Projector"
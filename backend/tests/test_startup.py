@@ -0,0 +1,86 @@
+"""Tests for startup warm-up and the readiness endpoint."""
+import gc
+import os
+
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core import warmup
+from app.core.cache import catalog_cache
+from app.main import app
+from app.scripts.serve import available_cpus, shared_secret_key
+from app.models import User
+from tests.conftest import get_test_database_url
+
+
+@pytest_asyncio.fixture
+async def fresh_startup(monkeypatch):
+    """Reset the process's startup report for the test."""
+    monkeypatch.setattr(warmup.startup, "ready", False)
+    monkeypatch.setattr(warmup.startup, "warmup_seconds", None)
+    monkeypatch.setattr(warmup.startup, "steps", {})
+    monkeypatch.setattr(warmup.startup, "error", None)
+    catalog_cache.clear()
+    yield warmup.startup
+    catalog_cache.clear()
+
+
+class TestReadiness:
+    """Tests for GET /ready"""
+
+    async def test_not_ready_before_warm_up(self, client: AsyncClient, fresh_startup):
+        """Test readiness fails while warming up but liveness passes."""
+        response = await client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+        assert (await client.get("/health")).status_code == 200
+
+    async def test_warm_up_marks_ready(
+        self, client: AsyncClient, db_session: AsyncSession, test_admin: User, fresh_startup, monkeypatch
+    ):
+        """Test warm-up runs every step, primes caches and flips readiness."""
+        engine = create_async_engine(get_test_database_url(), poolclass=NullPool)
+        monkeypatch.setattr(warmup, "AsyncSessionLocal", async_sessionmaker(bind=engine, class_=AsyncSession))
+        try:
+            report = await warmup.warm_up(app, engines=[engine])
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+            await engine.dispose()
+
+        assert report.ready
+        assert set(report.steps) == {"configure_mappers", "open_connections", "replay_routes", "openapi", "gc_freeze"}
+        assert len(catalog_cache) > 0
+
+        response = await client.get("/ready")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert body["warmup_seconds"] is not None
+        assert body["import_seconds"] is not None
+
+
+class TestServe:
+    """Tests for the multi-worker server settings"""
+
+    def test_cgroup_quota_caps_cpus(self, tmp_path):
+        """Test a container CPU quota limits the worker count."""
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+        assert available_cpus(cpu_max) == min(2, len(os.sched_getaffinity(0)))
+
+        cpu_max.write_text("max 100000\n")
+        assert available_cpus(cpu_max) == len(os.sched_getaffinity(0))
+
+        assert available_cpus(tmp_path / "missing") == len(os.sched_getaffinity(0))
+
+    def test_workers_share_secret_key(self, monkeypatch):
+        """Test a generated signing key is exported for the workers to inherit."""
+        monkeypatch.setenv("SECRET_KEY", "unused")
+        monkeypatch.delenv("SECRET_KEY")
+        shared_secret_key()
+        key = os.environ["SECRET_KEY"]
+        shared_secret_key()
+        assert os.environ["SECRET_KEY"] == key
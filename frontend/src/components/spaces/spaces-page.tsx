@@ -1,6 +1,6 @@
 "use client"
 
-import { useState, useEffect } from "react"
+import { useState, useEffect, useRef } from "react"
 import { Header } from "../landing/header"
 import { SearchBar } from "./search-bar"
 import { FilterSidebar } from "./filter-sidebar"
@@ -9,7 +9,6 @@ import { BookingModal } from "./booking-modal"
 import { Footer } from "../landing/footer"
 import { toast } from "sonner"
 import { spacesApi } from "@/lib/spaces"
-import { utilitiesApi } from "@/lib/utilities"
 import type { SpaceListParams, UtilityResponse } from "@/schemas/api"
 import { useRequireAuth } from "@/hooks/useRequireAuth"
 
@@ -33,26 +32,8 @@ export function SpacesPage() {
   const [floors, setFloors] = useState<string[]>([])
   const [utilities, setUtilities] = useState<UtilityResponse[]>([])
   const itemsPerPage = 12
-
-  // Fetch filter configuration on mount
-  useEffect(() => {
-    const fetchFilterConfig = async () => {
-      try {
-        const [config, utilitiesList] = await Promise.all([
-          spacesApi.getFilterConfig(),
-          utilitiesApi.list(),
-        ])
-        setBuildings(config.buildings)
-        setFloors(config.floors)
-        setUtilities(utilitiesList)
-      } catch (err) {
-        console.error("Error fetching filter config:", err)
-        // Silent fail - filter will just be empty
-      }
-    }
-
-    fetchFilterConfig()
-  }, [])
+  // The first fetch also loads the filter options and utilities
+  const bootstrapped = useRef(false)
 
   // Fetch spaces from API
   useEffect(() => {
@@ -97,7 +78,17 @@ export function SpacesPage() {
           params.utilities = utility
         }
 
-        const response = await spacesApi.list(params)
+        let response
+        if (bootstrapped.current) {
+          response = await spacesApi.list(params)
+        } else {
+          const bootstrap = await spacesApi.bootstrap(params)
+          setBuildings(bootstrap.filters.buildings)
+          setFloors(bootstrap.filters.floors)
+          setUtilities(bootstrap.utilities)
+          bootstrapped.current = true
+          response = bootstrap.spaces
+        }
         setRooms(response.data)
         setTotalCount(response.meta.total)
       } catch (err) {
@@ -6,6 +6,8 @@ import type {
   AdminUserListParams,
   AdminUpdateUserRequest,
   AdminUserSummaryResponse,
+  AdminUserSummaryParams,
+  AdminStatsResponse,
   PaginatedResponse,
 } from '@/schemas/api';
 
@@ -14,6 +16,14 @@ import type {
 // ============================================================================
 
 export const adminApi = {
+  /**
+   * Get dashboard counters (admin only)
+   * Requires authentication
+   */
+  getStats: async (): Promise<AdminStatsResponse> => {
+    return api.get<AdminStatsResponse>('/admin/stats', undefined, true);
+  },
+
   /**
    * List users (admin only)
    * Requires authentication
@@ -22,6 +32,15 @@ export const adminApi = {
     return api.get<PaginatedResponse<UserSummaryResponse>>('/admin/users', params, true);
   },
 
+  /**
+   * Get several users in one request, in the order given (admin only)
+   * Requires authentication
+   */
+  getUsersByIds: async (userIds: number[]): Promise<UserSummaryResponse[]> => {
+    const page = await api.get<PaginatedResponse<UserSummaryResponse>>('/admin/users', { ids: userIds.join(',') }, true);
+    return page.data;
+  },
+
   /**
    * Get user details (admin only)
    * Requires authentication
@@ -42,7 +61,7 @@ export const adminApi = {
    * Get user summary with booking history, penalties, and ratings (admin only)
    * Requires authentication
    */
-  getUserSummary: async (userId: number): Promise<AdminUserSummaryResponse> => {
-    return api.get<AdminUserSummaryResponse>(`/admin/users/${userId}/summary`, undefined, true);
+  getUserSummary: async (userId: number, params?: AdminUserSummaryParams): Promise<AdminUserSummaryResponse> => {
+    return api.get<AdminUserSummaryResponse>(`/admin/users/${userId}/summary`, params, true);
   },
 };
@@ -0,0 +1,57 @@
+// Allocations API Service
+import { api } from './api';
+import type {
+  AllocationWindowResponse,
+  CreateAllocationWindowRequest,
+  AllocationWindowListParams,
+  AllocationRequestResponse,
+  AllocationRequestListParams,
+  AllocationResult,
+  PaginatedResponse,
+} from '@/schemas/api';
+
+// ============================================================================
+// Allocations API
+// ============================================================================
+
+export const allocationsApi = {
+  /**
+   * List allocation windows (open ones by default)
+   * Requires authentication
+   */
+  listWindows: async (params?: AllocationWindowListParams): Promise<PaginatedResponse<AllocationWindowResponse>> => {
+    return api.get<PaginatedResponse<AllocationWindowResponse>>('/allocations/windows', params, true);
+  },
+
+  /**
+   * Open an allocation window for a space and day (admin only)
+   * Requires authentication
+   */
+  createWindow: async (data: CreateAllocationWindowRequest): Promise<AllocationWindowResponse> => {
+    return api.post<AllocationWindowResponse>('/allocations/windows', data, true);
+  },
+
+  /**
+   * Allocate a window's queued requests now (admin only)
+   * Requires authentication
+   */
+  allocate: async (windowId: number): Promise<AllocationResult> => {
+    return api.post<AllocationResult>(`/allocations/windows/${windowId}/allocate`, undefined, true);
+  },
+
+  /**
+   * List your queued booking requests and their outcomes (admins see everyone's)
+   * Requires authentication
+   */
+  listRequests: async (params?: AllocationRequestListParams): Promise<PaginatedResponse<AllocationRequestResponse>> => {
+    return api.get<PaginatedResponse<AllocationRequestResponse>>('/allocations/requests', params, true);
+  },
+
+  /**
+   * Get a queued booking request and its outcome
+   * Requires authentication
+   */
+  getRequest: async (requestId: number): Promise<AllocationRequestResponse> => {
+    return api.get<AllocationRequestResponse>(`/allocations/requests/${requestId}`, undefined, true);
+  },
+};
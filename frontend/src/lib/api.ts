@@ -7,6 +7,7 @@ import type { ApiError } from '@/schemas/api';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 const TOKEN_KEY = 'access_token';
+const CONSISTENCY_HEADER = 'X-Consistency-Token';
 
 // ============================================================================
 // Token Management
@@ -33,6 +34,14 @@ export const TokenManager = {
   },
 };
 
+// ============================================================================
+// Read-Your-Writes Consistency
+// ============================================================================
+
+// WAL position returned by the last write; sent with later requests so reads
+// served by a read replica never miss this client's own changes
+let consistencyToken: string | null = null;
+
 // ============================================================================
 // API Error Class
 // ============================================================================
@@ -120,6 +129,10 @@ class ApiClient {
       }
     }
 
+    if (consistencyToken) {
+      headers[CONSISTENCY_HEADER] = consistencyToken;
+    }
+
     return headers;
   }
 
@@ -188,6 +201,11 @@ class ApiClient {
       },
     });
 
+    const writeToken = response.headers.get(CONSISTENCY_HEADER);
+    if (writeToken) {
+      consistencyToken = writeToken;
+    }
+
     return this.handleResponse<T>(response, hadToken);
   }
 
@@ -5,7 +5,12 @@ import type {
   CreateBookingRequest,
   UpdateBookingStatusRequest,
   BookingListParams,
+  BookingCalendarParams,
+  BookingCalendarResponse,
   PaginatedResponse,
+  ChangesResponse,
+  ChangesParams,
+  AllocationRequestResponse,
 } from '@/schemas/api';
 
 // ============================================================================
@@ -21,6 +26,31 @@ export const bookingsApi = {
     return api.get<PaginatedResponse<BookingResponse>>('/bookings', params, true);
   },
 
+  /**
+   * Get several bookings in one request, in the order given (unknown ids are skipped)
+   * Requires authentication
+   */
+  getByIds: async (bookingIds: number[]): Promise<BookingResponse[]> => {
+    const page = await api.get<PaginatedResponse<BookingResponse>>('/bookings', { ids: bookingIds.join(',') }, true);
+    return page.data;
+  },
+
+  /**
+   * Booked slots of every space in a date range, as parallel arrays
+   * Requires authentication
+   */
+  calendar: async (params: BookingCalendarParams): Promise<BookingCalendarResponse> => {
+    return api.get<BookingCalendarResponse>('/bookings/calendar', params, true);
+  },
+
+  /**
+   * Bookings created, updated or deleted since a cursor (omit it for a full copy)
+   * Requires authentication
+   */
+  changes: async (params?: ChangesParams & { my?: boolean }): Promise<ChangesResponse<BookingResponse>> => {
+    return api.get<ChangesResponse<BookingResponse>>('/bookings/changes', params, true);
+  },
+
   /**
    * Get a single booking by ID
    * Requires authentication
@@ -31,10 +61,11 @@ export const bookingsApi = {
 
   /**
    * Create a new booking request
+   * Inside an open allocation window the request is queued instead (202)
    * Requires authentication
    */
-  create: async (data: CreateBookingRequest): Promise<BookingResponse> => {
-    return api.post<BookingResponse>('/bookings', data, true);
+  create: async (data: CreateBookingRequest): Promise<BookingResponse | AllocationRequestResponse> => {
+    return api.post<BookingResponse | AllocationRequestResponse>('/bookings', data, true);
   },
 
   /**
@@ -3,10 +3,14 @@ import { api } from './api';
 import type {
   SpaceResponse,
   SpaceListParams,
+  SpaceListResponse,
   CreateSpaceRequest,
   UpdateSpaceRequest,
   PaginatedResponse,
   SpaceFilterConfigResponse,
+  SpacesBootstrapResponse,
+  ChangesResponse,
+  ChangesParams,
 } from '@/schemas/api';
 
 // ============================================================================
@@ -22,10 +26,32 @@ export const spacesApi = {
   },
 
   /**
-   * List spaces with optional filters and pagination
+   * Filter configuration, utilities and the first page of spaces in one request
    */
-  list: async (params?: SpaceListParams): Promise<PaginatedResponse<SpaceResponse>> => {
-    return api.get<PaginatedResponse<SpaceResponse>>('/spaces', params, false);
+  bootstrap: async (params?: SpaceListParams): Promise<SpacesBootstrapResponse> => {
+    return api.get<SpacesBootstrapResponse>('/spaces/bootstrap', params, false);
+  },
+
+  /**
+   * List spaces with optional filters and pagination (and facet counts with facets: true)
+   */
+  list: async (params?: SpaceListParams): Promise<SpaceListResponse> => {
+    return api.get<SpaceListResponse>('/spaces', params, false);
+  },
+
+  /**
+   * Get several spaces in one request, in the order given (unknown ids are skipped)
+   */
+  getByIds: async (spaceIds: number[]): Promise<SpaceResponse[]> => {
+    const page = await api.get<PaginatedResponse<SpaceResponse>>('/spaces', { ids: spaceIds.join(',') }, false);
+    return page.data;
+  },
+
+  /**
+   * Spaces created, updated or deleted since a cursor (omit it for a full copy)
+   */
+  changes: async (params?: ChangesParams): Promise<ChangesResponse<SpaceResponse>> => {
+    return api.get<ChangesResponse<SpaceResponse>>('/spaces/changes', params, false);
   },
 
   /**
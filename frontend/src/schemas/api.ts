@@ -35,6 +35,22 @@ export enum PenaltyStatus {
   EXPIRED = "expired",
 }
 
+export enum AllocationPolicy {
+  LOTTERY = "lottery",
+  PENALTY_WEIGHTED = "penalty_weighted",
+}
+
+export enum AllocationWindowStatus {
+  OPEN = "open",
+  ALLOCATED = "allocated",
+}
+
+export enum AllocationRequestStatus {
+  QUEUED = "queued",
+  ALLOCATED = "allocated",
+  REJECTED = "rejected",
+}
+
 // ============================================================================
 // User Schemas
 // ============================================================================
@@ -113,6 +129,7 @@ export interface BookingResponse {
   cancellation_reason?: string | null;
   check_in_at?: string | null;
   check_out_at?: string | null;
+  updated_at: string;
   space?: SpaceResponse | null;
   user?: UserSummaryResponse | null;
 }
@@ -169,6 +186,19 @@ export interface PaginatedResponse<T> {
   meta: PaginationMeta;
 }
 
+// Rows written and ids deleted since `since`; pass `cursor` back as the next `since`
+export interface ChangesResponse<T> {
+  data: T[];
+  deleted: number[];
+  cursor: string;
+  has_more: boolean;
+}
+
+export interface ChangesParams {
+  since?: string; // omit for a full copy
+  limit?: number; // 1-1000, default: 500
+}
+
 export interface ApiError {
   code: string;
   message: string;
@@ -246,6 +276,23 @@ export interface SpaceListParams {
   capacityMax?: number;
   utilities?: string; // comma-separated keys
   status?: SpaceStatus; // default: active only
+  facets?: boolean; // default: false - also return counts per filter option
+}
+
+export interface FacetCount {
+  value: string;
+  count: number;
+}
+
+// Each facet applies every current filter except its own
+export interface SpaceFacets {
+  buildings: (FacetCount & { floors: FacetCount[] })[];
+  capacity: (FacetCount & { min: number; max: number | null })[];
+  utilities: FacetCount[];
+}
+
+export interface SpaceListResponse extends PaginatedResponse<SpaceResponse> {
+  facets: SpaceFacets | null; // null unless facets=true
 }
 
 export interface SpaceFilterConfigResponse {
@@ -253,6 +300,12 @@ export interface SpaceFilterConfigResponse {
   floors: string[];
 }
 
+export interface SpacesBootstrapResponse {
+  filters: SpaceFilterConfigResponse;
+  utilities: UtilityResponse[];
+  spaces: PaginatedResponse<SpaceResponse>;
+}
+
 // Utility Requests
 export interface CreateUtilityRequest {
   key: string;
@@ -290,6 +343,101 @@ export interface BookingListParams {
   my?: boolean; // default: true - Admin filter for own bookings
   userId?: number; // Admin filter by user
   spaceId?: number; // Filter by space
+  from?: string; // YYYY-MM-DD, earliest booking date
+  to?: string; // YYYY-MM-DD, latest booking date
+}
+
+// Offered in details.alternatives of a SLOT_CONFLICT error, best first
+export interface BookingAlternative {
+  space_id: number;
+  space_name: string;
+  building: string;
+  floor: string;
+  capacity: number;
+  booking_date: string;
+  start_time: string;
+  end_time: string;
+}
+
+export interface BookingCalendarParams {
+  from: string; // YYYY-MM-DD
+  to: string; // YYYY-MM-DD, at most 42 days after from
+  spaceIds?: string; // comma-separated, default: all spaces
+  statuses?: string; // comma-separated, default: all but cancelled and rejected
+}
+
+// Entry i of each array is one booking; days count from start_date, times
+// are minutes after midnight and statuses index status_names
+export interface BookingCalendarResponse {
+  start_date: string;
+  end_date: string;
+  status_names: BookingStatus[];
+  ids: number[];
+  space_ids: number[];
+  days: number[];
+  start_minutes: number[];
+  end_minutes: number[];
+  statuses: number[];
+}
+
+// Allocation Windows
+export interface AllocationWindowResponse {
+  id: number;
+  space_id: number;
+  booking_date: string;
+  start_time: string | null; // null with end_time: the whole day
+  end_time: string | null;
+  closes_at: string; // ISO datetime
+  policy: AllocationPolicy;
+  status: AllocationWindowStatus;
+  created_by: number | null;
+  created_at: string;
+  allocated_at: string | null;
+}
+
+export interface CreateAllocationWindowRequest {
+  space_id: number;
+  booking_date: string;
+  start_time?: string | null; // both or neither
+  end_time?: string | null;
+  closes_at: string; // ISO datetime with timezone, in the future
+  policy?: AllocationPolicy; // default: lottery
+}
+
+export interface AllocationWindowListParams {
+  limit?: number; // 1-100, default: 20
+  offset?: number; // default: 0
+  status?: AllocationWindowStatus; // default: open
+  spaceId?: number;
+  date?: string; // YYYY-MM-DD
+}
+
+// A booking request queued in a window (POST /bookings answers 202 with one)
+export interface AllocationRequestResponse {
+  id: number;
+  window_id: number;
+  user_id: number;
+  start_time: string;
+  end_time: string;
+  attendees: number;
+  purpose: string;
+  status: AllocationRequestStatus;
+  booking_id: number | null; // set once allocated
+  requested_at: string;
+  decided_at: string | null;
+}
+
+export interface AllocationRequestListParams {
+  limit?: number; // 1-100, default: 20
+  offset?: number; // default: 0
+  status?: AllocationRequestStatus;
+  windowId?: number;
+}
+
+export interface AllocationResult {
+  window: AllocationWindowResponse;
+  allocated: number;
+  rejected: number;
 }
 
 // Admin User Requests
@@ -300,6 +448,15 @@ export interface AdminUserListParams {
   status?: UserStatus;
 }
 
+export interface AdminUserSummaryParams {
+  limit?: number; // booking history items, 1-100, default: 50
+  bookingOffset?: number; // default: 0
+  penaltyLimit?: number; // default: all penalties
+  penaltyOffset?: number; // default: 0
+  ratingLimit?: number; // default: all ratings
+  ratingOffset?: number; // default: 0
+}
+
 export interface AdminUpdateUserRequest {
   role?: UserRole;
   status?: UserStatus;
@@ -318,8 +475,22 @@ export interface UpdateUserProfileRequest {
 export interface AdminUserSummaryResponse {
   user: UserResponse;
   booking_history: BookingHistoryItem[];
+  booking_history_total: number;
   penalties: PenaltyResponse[];
+  penalties_total: number;
   ratings: RatingResponse[];
+  ratings_total: number;
+}
+
+export interface AdminStatsResponse {
+  total_users: number;
+  suspended_users: number;
+  total_spaces: number;
+  active_spaces: number;
+  pending_bookings: number;
+  today_bookings: number;
+  active_penalties: number;
+  generated_at: string; // ISO datetime
 }
 
 // Penalty Requests